@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import random
+from datetime import datetime
+
+class AdaptiveSyncInterval:
+    """Intervalo de sincronização ajustado à frequência observada de alterações
+
+    Cada sondagem de alterações (ChangeProbe) alimenta duas médias móveis
+    exponenciais: alterações por hora no upstream (revisões SVN e commits
+    no remoto Git) e na cópia de trabalho local (caminhos alterados). O
+    intervalo é escolhido para que, em média, cerca de `target_changes`
+    alterações se acumulem entre sincronizações, limitado a
+    [min_minutes, max_minutes], e recebe um jitter aleatório para que
+    muitos repositórios não consultem o servidor SVN no mesmo segundo.
+    """
+
+    STATE_FILE = "svn_sync_schedule.json"
+
+    def __init__(self, working_dir, logger, min_minutes=5, max_minutes=120,
+                 jitter=0.1, smoothing=0.3, target_changes=1.0):
+        """Inicializa o estimador, carregando as médias persistidas do repositório"""
+        self.logger = logger
+        self.min_minutes = min_minutes
+        self.max_minutes = max(min_minutes, max_minutes)
+        self.jitter = jitter
+        self.smoothing = smoothing
+        self.target_changes = target_changes
+
+        self.state_path = os.path.join(working_dir, '.git', self.STATE_FILE)
+        self.state = self._load()
+
+    def _load(self):
+        """Carrega as médias de alterações por hora"""
+        try:
+            if os.path.exists(self.state_path):
+                with open(self.state_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            self.logger.log(f"Error loading adaptive schedule state: {str(e)}", "WARNING")
+        return {"upstream_rate": None, "local_rate": None, "last_probe": None}
+
+    def _save(self):
+        """Persiste as médias"""
+        if not os.path.isdir(os.path.dirname(self.state_path)):
+            return
+        try:
+            tmp_path = self.state_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.state, f)
+            os.replace(tmp_path, self.state_path)
+        except Exception as e:
+            self.logger.log(f"Error saving adaptive schedule state: {str(e)}", "WARNING")
+
+    @property
+    def upstream_rate(self):
+        """Alterações por hora estimadas no upstream (None antes da primeira sondagem)"""
+        return self.state.get("upstream_rate")
+
+    @property
+    def local_rate(self):
+        """Alterações por hora estimadas na cópia de trabalho"""
+        return self.state.get("local_rate")
+
+    def _update_rate(self, key, count, hours):
+        """Atualiza a média móvel com a taxa observada desde a última sondagem"""
+        observed = count / hours
+        previous = self.state.get(key)
+        self.state[key] = observed if previous is None else (
+            self.smoothing * observed + (1 - self.smoothing) * previous
+        )
+
+    def observe(self, result, now=None):
+        """Registra o resultado de uma sondagem (dicionário de ChangeProbe.probe)
+
+        Usa as contagens de ChangeProbe.count_changes; sem elas, cada lado
+        que mudou conta como uma alteração. Sondagens com falha não dizem
+        nada sobre a frequência de alterações e são ignoradas.
+        """
+        reasons = result.get("reasons", [])
+        if any(r.startswith("probe failed") for r in reasons):
+            return
+
+        now = now or datetime.now()
+        last_probe = self.state.get("last_probe")
+        self.state["last_probe"] = now.isoformat(timespec='seconds')
+        if last_probe is None or "no previous sync recorded" in reasons:
+            self._save()
+            return
+
+        # Nunca considerar menos que o intervalo mínimo, para uma sondagem
+        # antecipada (sincronização forçada, watcher) não inflar a taxa
+        elapsed = (now - datetime.fromisoformat(last_probe)).total_seconds() / 3600
+        hours = max(elapsed, self.min_minutes / 60)
+
+        upstream = result.get("upstream_changes")
+        if upstream is None:
+            upstream = sum(1 for r in reasons if r.startswith(("Git remote moved", "SVN changed")))
+        local = result.get("local_changes")
+        if local is None:
+            local = 1 if "local changes" in reasons else 0
+        self._update_rate("upstream_rate", upstream, hours)
+        self._update_rate("local_rate", local, hours)
+        self._save()
+
+    def next_interval(self, default_minutes):
+        """Calcula o próximo intervalo em minutos
+
+        Retorna (minutos com jitter, motivo). Sem histórico de sondagens,
+        usa `default_minutes` (limitado aos mesmos extremos).
+        """
+        upstream, local = self.upstream_rate, self.local_rate
+        if upstream is None or local is None:
+            minutes = min(max(default_minutes, self.min_minutes), self.max_minutes)
+            reason = "configured interval (no change history yet)"
+        else:
+            rate = upstream + local
+            minutes = self.max_minutes if rate <= 0 else self.target_changes / rate * 60
+            minutes = min(max(minutes, self.min_minutes), self.max_minutes)
+            if minutes == self.min_minutes:
+                bound = " (minimum)"
+            elif minutes == self.max_minutes:
+                bound = " (maximum)"
+            else:
+                bound = ""
+            reason = (f"adaptive{bound}: upstream {upstream:.1f}/h, "
+                      f"local {local:.1f}/h")
+
+        if self.jitter:
+            minutes *= 1 + random.uniform(-self.jitter, self.jitter)
+            minutes = min(max(minutes, self.min_minutes), self.max_minutes)
+        return minutes, reason
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+
+class AsyncVCSExecutor:
+    """Executor assíncrono de comandos VCS baseado em asyncio
+
+    Mantém um único event loop em uma thread de fundo, compartilhado por
+    todos os repositórios. Consultas de status, diffs e cats de muitos
+    repositórios rodam concorrentemente nesse loop, limitadas por um
+    semáforo, em vez de ocupar uma thread do sistema por chamada.
+    """
+
+    def __init__(self, max_concurrency=8):
+        """Inicializa o executor"""
+        self.max_concurrency = max_concurrency
+        self.loop = None
+        self._semaphore = None
+        self._thread = None
+        self._started = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Inicia o event loop em uma thread de fundo (idempotente)"""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._started.clear()
+            self._thread = threading.Thread(target=self._run_loop, name="vcs-asyncio", daemon=True)
+            self._thread.start()
+        self._started.wait()
+
+    def _run_loop(self):
+        """Função da thread do event loop"""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._started.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+    def stop(self):
+        """Para o event loop e aguarda a thread terminar"""
+        with self._lock:
+            if not self._thread or not self.loop:
+                return
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout=5.0)
+            self._thread = None
+
+    async def run(self, cmd, cwd=None, input_data=None):
+        """Executa um comando e retorna (returncode, stdout, stderr) como texto"""
+        async with self._semaphore:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE if input_data is not None else asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=cwd
+            )
+            stdout, stderr = await process.communicate(input_data)
+
+        return (
+            process.returncode,
+            stdout.decode('utf-8', errors='replace'),
+            stderr.decode('utf-8', errors='replace')
+        )
+
+    def submit(self, coro):
+        """Agenda uma corrotina no loop a partir de qualquer thread
+
+        Retorna um concurrent.futures.Future.
+        """
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run_sync(self, coro, timeout=None):
+        """Executa uma corrotina no loop e aguarda o resultado (bloqueante)"""
+        return self.submit(coro).result(timeout)
+
+    def gather(self, coros, timeout=None):
+        """Executa várias corrotinas concorrentemente e retorna os resultados em ordem"""
+        async def _gather():
+            return await asyncio.gather(*coros, return_exceptions=True)
+        return self.run_sync(_gather(), timeout)
+
+_default_executor = None
+_default_lock = threading.Lock()
+
+def get_executor():
+    """Retorna o executor compartilhado pela aplicação"""
+    global _default_executor
+    with _default_lock:
+        if _default_executor is None:
+            _default_executor = AsyncVCSExecutor()
+        return _default_executor
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+
+import os
+import signal
+import threading
+import subprocess
+import time
+from contextlib import contextmanager
+
+class OperationCancelled(Exception):
+    """Exceção lançada quando uma operação de sincronização é cancelada"""
+    pass
+
+def _popen_group_kwargs():
+    """Argumentos do Popen para criar o processo em um grupo próprio"""
+    if os.name == 'nt':
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+def kill_process_group(process, grace=2.0):
+    """Encerra o processo e todos os seus filhos (SIGTERM, depois SIGKILL)"""
+    if process.poll() is not None:
+        return
+
+    try:
+        if os.name == 'nt':
+            # process.kill() encerra apenas o processo; /T inclui os filhos (git-remote-https, ssh)
+            try:
+                subprocess.run(["taskkill", "/T", "/F", "/PID", str(process.pid)],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=grace * 5)
+            except (subprocess.SubprocessError, OSError):
+                pass
+            if process.poll() is None:
+                process.kill()
+        else:
+            os.killpg(process.pid, signal.SIGTERM)
+            try:
+                process.wait(grace)
+                return
+            except subprocess.TimeoutExpired:
+                os.killpg(process.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError, OSError):
+        pass
+
+class CancellationToken:
+    """Token de cancelamento compartilhado pelas fases de uma sincronização
+
+    Processos registrados no token são encerrados (com o grupo de
+    processos inteiro) assim que o cancelamento é solicitado.
+    """
+
+    def __init__(self):
+        """Inicializa o token"""
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._processes = set()
+        self.reason = None
+        # Comandos dos processos encerrados pelo cancelamento e horário (time.time()) do kill
+        self.killed = []
+
+    @property
+    def is_cancelled(self):
+        """Indica se o cancelamento foi solicitado"""
+        return self._event.is_set()
+
+    def cancel(self, reason="Operation cancelled"):
+        """Solicita o cancelamento e encerra os processos em execução"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            processes = list(self._processes)
+
+        for process in processes:
+            self._kill(process)
+
+    def _kill(self, process):
+        """Encerra um processo registrado, guardando o comando e o horário do kill"""
+        if process.poll() is None:
+            self.killed.append((process.args, time.time()))
+        kill_process_group(process)
+
+    def killed_command(self, program):
+        """Horário do primeiro kill de um processo de `program` (ex.: "git"), ou None"""
+        for args, killed_at in self.killed:
+            name = args[0] if isinstance(args, (list, tuple)) and args else str(args).split()[0]
+            if os.path.basename(str(name)) in (program, f"{program}.exe"):
+                return killed_at
+        return None
+
+    def raise_if_cancelled(self):
+        """Lança OperationCancelled se o cancelamento foi solicitado"""
+        if self._event.is_set():
+            raise OperationCancelled(self.reason)
+
+    def wait(self, timeout):
+        """Aguarda o cancelamento por até `timeout` segundos"""
+        return self._event.wait(timeout)
+
+    def register_process(self, process):
+        """Associa um processo ao token (encerrado imediatamente se já cancelado)"""
+        with self._lock:
+            self._processes.add(process)
+            cancelled = self._event.is_set()
+        if cancelled:
+            self._kill(process)
+
+    def unregister_process(self, process):
+        """Remove a associação de um processo finalizado"""
+        with self._lock:
+            self._processes.discard(process)
+
+def start_process(cmd, cwd=None, token=None, timeout=None, **popen_kwargs):
+    """Inicia um processo em grupo próprio, ligado ao token e a um timeout
+
+    Retorna (process, timer). O timer encerra o grupo de processos quando o
+    timeout expira e deve ser cancelado por finish_process.
+    """
+    if token:
+        token.raise_if_cancelled()
+
+    process = subprocess.Popen(cmd, cwd=cwd, **_popen_group_kwargs(), **popen_kwargs)
+    process.timed_out = False
+
+    if token:
+        token.register_process(process)
+
+    timer = None
+    if timeout:
+        def on_timeout():
+            process.timed_out = True
+            kill_process_group(process)
+        timer = threading.Timer(timeout, on_timeout)
+        timer.daemon = True
+        timer.start()
+
+    return process, timer
+
+def finish_process(process, timer, token=None, cmd=None, timeout=None):
+    """Libera timer e token de um processo e traduz timeout/cancelamento em exceções"""
+    if timer:
+        timer.cancel()
+    if token:
+        token.unregister_process(process)
+        token.raise_if_cancelled()
+    if getattr(process, "timed_out", False):
+        raise subprocess.TimeoutExpired(cmd or process.args, timeout)
+
+def run_command(cmd, cwd=None, timeout=None, token=None, text=True, input=None, env=None):
+    """Equivalente a subprocess.run com timeout, cancelamento e kill do grupo de processos"""
+    process, timer = start_process(
+        cmd, cwd=cwd, token=token, timeout=timeout, env=env,
+        stdin=subprocess.PIPE if input is not None else subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=text,
+        **({"encoding": "utf-8", "errors": "replace"} if text else {})
+    )
+
+    try:
+        stdout, stderr = process.communicate(input)
+    finally:
+        finish_process(process, timer, token, cmd, timeout)
+
+    return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+
+class PhaseWatchdog:
+    """Watchdog que registra no log fases de sincronização travadas
+
+    Uma única thread verifica periodicamente a fase em andamento e emite
+    um aviso cada vez que ela ultrapassa um múltiplo de `stuck_after`.
+    """
+
+    def __init__(self, logger, stuck_after=300, check_interval=5.0):
+        """Inicializa o watchdog"""
+        self.logger = logger
+        self.stuck_after = stuck_after
+        self.check_interval = check_interval
+        self.current_phase = None
+        self.phase_started = None
+        self._warned = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Inicia a thread do watchdog (idempotente)"""
+        # Limpar antes: uma thread parada que ainda não acordou continua ativa
+        self._stop.clear()
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="sync-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Para a thread do watchdog (ela termina na próxima verificação)"""
+        self._stop.set()
+
+    def enter(self, name):
+        """Marca o início de uma nova fase (substitui a fase atual)"""
+        self.start()
+        with self._lock:
+            self.current_phase = name
+            self.phase_started = time.monotonic()
+            self._warned = 0
+
+    def clear(self):
+        """Indica que nenhuma fase está em andamento"""
+        with self._lock:
+            self.current_phase = None
+            self.phase_started = None
+            self._warned = 0
+
+    @contextmanager
+    def phase(self, name):
+        """Marca o início e o fim de uma fase monitorada"""
+        self.start()
+        with self._lock:
+            previous = (self.current_phase, self.phase_started, self._warned)
+            self.current_phase = name
+            self.phase_started = time.monotonic()
+            self._warned = 0
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.current_phase, self.phase_started, self._warned = previous
+
+    def _run(self):
+        """Função da thread do watchdog"""
+        while not self._stop.wait(self.check_interval):
+            with self._lock:
+                if not self.current_phase:
+                    continue
+                elapsed = time.monotonic() - self.phase_started
+                if elapsed < self.stuck_after * (self._warned + 1):
+                    continue
+                self._warned += 1
+                phase = self.current_phase
+
+            self.logger.log(f"Sync phase '{phase}' has been running for {int(elapsed)}s", "WARNING")
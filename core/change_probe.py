@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import time
+import hashlib
+
+# Lados registrados pela sonda: remoto Git, repositório SVN e alterações locais
+SIDES = ("git", "svn", "local")
+
+# Lados que cada direção de sincronização de fato sincroniza. Uma
+# sincronização Git -> SVN sem arquivos alterados termina antes do
+# 'svn update', e uma SVN -> Git não envia as alterações locais do Git.
+SYNCED_SIDES = {
+    "git_to_svn": ("git", "local"),
+    "svn_to_git": ("svn",),
+    "bidirectional": SIDES,
+}
+
+class ChangeProbe:
+    """Sondagem barata de alterações antes de uma sincronização completa
+
+    Compara a ponta da branch no remoto Git ('git ls-remote') e a última
+    revisão alterada no SVN ('svn info -r HEAD --xml') com os valores
+    registrados após a última sincronização, e verifica se há alterações
+    locais. Se nenhum lado mudou, a sincronização pode ser pulada.
+    """
+
+    STATE_FILE = "svn_sync_probe.json"
+
+    def __init__(self, git_manager, svn_manager, logger):
+        """Inicializa a sonda para a cópia de trabalho dos gerenciadores"""
+        self.git_manager = git_manager
+        self.svn_manager = svn_manager
+        self.logger = logger
+        self.state_path = os.path.join(git_manager.working_dir, '.git', self.STATE_FILE)
+        self.state = self._load()
+
+        # Estatísticas acumuladas: sondagens, sincronizações puladas e tempo total
+        self.probes = 0
+        self.skipped = 0
+        self.probe_time = 0.0
+
+    def _load(self):
+        """Carrega os valores registrados na última sincronização"""
+        try:
+            if os.path.exists(self.state_path):
+                with open(self.state_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            self.logger.log(f"Error loading sync probe state: {str(e)}", "WARNING")
+        return {}
+
+    def _save(self):
+        """Persiste os valores registrados"""
+        if not os.path.isdir(os.path.dirname(self.state_path)):
+            return
+        try:
+            tmp_path = self.state_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.state, f)
+            os.replace(tmp_path, self.state_path)
+        except Exception as e:
+            self.logger.log(f"Error saving sync probe state: {str(e)}", "WARNING")
+
+    def _local_entries(self):
+        """Alterações locais por caminho (status, mtime e tamanho)
+
+        O Git continua com arquivos modificados depois de uma sincronização
+        Git -> SVN, então o que importa é quais entradas mudaram desde a
+        última sincronização, não apenas se elas existem. Retorna
+        {caminho: "origem:status:mtime:tamanho;..."}.
+        """
+        entries = []
+        snapshot = self.git_manager.get_status_snapshot()
+        if snapshot:
+            entries.extend(("git", f["type"], f["path"]) for f in snapshot.to_modified_files())
+            entries.extend(("git-index", code, path) for path, code in snapshot.staged)
+        entries.extend(("svn", f["type"], f["path"]) for f in self.svn_manager.get_modified_files(quiet=True))
+
+        local = {}
+        for source, code, path in sorted(entries):
+            try:
+                stat = os.stat(os.path.join(self.git_manager.working_dir, path))
+                details = f"{stat.st_mtime_ns}:{stat.st_size}"
+            except OSError:
+                details = "missing"
+            local[path] = local.get(path, "") + f"{source}:{code}:{details};"
+        return local
+
+    @staticmethod
+    def _changed_paths(recorded, local):
+        """Número de caminhos cujas entradas diferem das registradas
+
+        Retorna None se não houver registro comparável (nenhuma
+        sincronização registrada ou resumo SHA-1 de versões anteriores).
+        """
+        if not isinstance(recorded, dict):
+            return None
+        return sum(1 for path in recorded.keys() | local.keys() if recorded.get(path) != local.get(path))
+
+    def _remote_state(self):
+        """Lê a ponta do remoto Git e a última revisão alterada do SVN"""
+        git_tip = self.git_manager.get_remote_tip()
+        info = self.svn_manager.get_info(revision="HEAD")
+        if info is None:
+            raise RuntimeError("svn info -r HEAD failed")
+        return git_tip, info["last_changed_revision"] or info["revision"]
+
+    def probe(self):
+        """Verifica se algum lado mudou desde a última sincronização
+
+        Retorna um dicionário com "changed", "reasons", "duration" e
+        "state" (ponta do Git e revisão do SVN lidas agora, ou None se a
+        sondagem falhou). Erros na sondagem contam como alteração, para
+        nunca pular uma sincronização necessária.
+        """
+        started = time.monotonic()
+        reasons = []
+        state = None
+        local_paths = 0
+        try:
+            git_tip, svn_revision = self._remote_state()
+            state = {"git_tip": git_tip, "svn_revision": svn_revision}
+            if not self.state:
+                reasons.append("no previous sync recorded")
+            else:
+                if git_tip != self.state.get("git_tip"):
+                    reasons.append("Git remote moved")
+                if svn_revision != self.state.get("svn_revision"):
+                    reasons.append(f"SVN changed (r{self.state.get('svn_revision')} -> r{svn_revision})")
+
+            if self.state:
+                local = self._local_entries()
+                changed_paths = self._changed_paths(self.state.get("local"), local)
+                local_paths = len(local) if changed_paths is None else changed_paths
+                if changed_paths is None or changed_paths:
+                    reasons.append("local changes")
+        except Exception as e:
+            reasons.append(f"probe failed: {str(e)}")
+            state = None
+
+        duration = time.monotonic() - started
+        self.probes += 1
+        self.probe_time += duration
+        changed = bool(reasons)
+        if not changed:
+            self.skipped += 1
+
+        return {"changed": changed, "reasons": reasons, "duration": duration, "state": state,
+                "previous": dict(self.state), "local_paths": local_paths}
+
+    def count_changes(self, result):
+        """Conta as alterações detectadas por uma sondagem
+
+        Preenche "upstream_changes" (revisões SVN novas mais commits novos
+        no remoto Git) e "local_changes" (caminhos alterados localmente
+        desde a última sincronização) em `result` e os retorna. Chamada
+        após a sincronização, quando os commits do Git já foram buscados e
+        podem ser contados com 'git rev-list --count'; se não puderem, cada
+        lado que mudou conta 1.
+        """
+        reasons = result.get("reasons", [])
+        state = result.get("state") or {}
+        previous = result.get("previous") or {}
+
+        upstream = 0
+        if any(r.startswith("SVN changed") for r in reasons):
+            old, new = previous.get("svn_revision"), state.get("svn_revision")
+            upstream += new - old if isinstance(old, int) and isinstance(new, int) and new > old else 1
+        if "Git remote moved" in reasons:
+            old, new = previous.get("git_tip"), state.get("git_tip")
+            commits = self.git_manager.count_commits(old, new) if old and new else None
+            upstream += commits if commits else (1 if new else 0)
+
+        local = result.get("local_paths", 0) if "local changes" in reasons else 0
+        result["upstream_changes"] = upstream
+        result["local_changes"] = local
+        return upstream, local
+
+    def record(self, result, sides=SIDES):
+        """Registra o estado sincronizado após uma sincronização bem-sucedida
+
+        `result` é a sondagem feita antes da sincronização. Os remotos são
+        registrados como estavam naquele momento: commits que chegaram
+        durante a sincronização continuam aparecendo como alteração na
+        próxima sondagem. As alterações locais são lidas agora, pois a
+        própria sincronização altera a cópia de trabalho.
+
+        Apenas os lados em `sides` ("git", "svn", "local", ver SYNCED_SIDES)
+        são atualizados; os demais mantêm o valor anterior, para que uma
+        sincronização em uma única direção não esconda da próxima sondagem
+        as alterações do outro lado.
+        """
+        state = result.get("state") if result else None
+        if not state:
+            # Sem estado anterior confiável: a próxima sondagem não pula a sincronização
+            self.state = {}
+            self._save()
+            return
+
+        recorded = dict(self.state)
+        if "git" in sides:
+            recorded["git_tip"] = state["git_tip"]
+        if "svn" in sides:
+            recorded["svn_revision"] = state["svn_revision"]
+        if "local" in sides:
+            try:
+                recorded["local"] = self._local_entries()
+            except Exception as e:
+                self.logger.log(f"Could not record sync probe state: {str(e)}", "WARNING")
+                recorded.pop("local", None)
+        self.state = recorded
+        self._save()
+
+    @property
+    def skip_rate(self):
+        """Fração das sondagens que evitaram uma sincronização"""
+        return self.skipped / self.probes if self.probes else 0.0
+
+    def describe(self, result):
+        """Resume o resultado de uma sondagem e as estatísticas acumuladas"""
+        outcome = ", ".join(result["reasons"]) if result["changed"] else "no changes"
+        average = self.probe_time / self.probes if self.probes else 0.0
+        return (
+            f"Change probe took {result['duration']:.2f}s ({outcome}); "
+            f"skip rate {self.skip_rate:.0%} ({self.skipped}/{self.probes}), "
+            f"average probe {average:.2f}s"
+        )
@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import sqlite3
+import hashlib
+import threading
+
+class ContentIdentityIndex:
+    """Índice de identidade de conteúdo entre blobs Git e pristines SVN
+
+    O Git identifica conteúdo por SHA-1 de "blob <tamanho>\\0" + conteúdo,
+    enquanto o SVN guarda no wc.db o SHA-1 do conteúdo bruto. O índice
+    converte cada checksum SVN para o ID de blob Git correspondente uma
+    única vez (lendo o pristine) e persiste o mapeamento, permitindo
+    comparar os dois lados sem abrir o arquivo de trabalho.
+    """
+
+    CACHE_FILE = "svn_sync_identity.json"
+
+    # Limite de entradas do cache (as mais antigas saem primeiro)
+    MAX_ENTRIES = 100000
+
+    # Propriedades SVN com as quais o arquivo de trabalho difere do pristine
+    TRANSLATED_PROPS = (b"svn:eol-style", b"svn:keywords", b"svn:special")
+
+    def __init__(self, working_dir, logger):
+        """Inicializa o índice de identidade de conteúdo"""
+        self.working_dir = working_dir
+        self.logger = logger
+        self.svn_to_git = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+        self.cache_path = os.path.join(working_dir, '.git', self.CACHE_FILE)
+        self._load()
+
+    @staticmethod
+    def git_blob_id(data):
+        """Calcula o ID de blob Git para um conteúdo em bytes"""
+        sha = hashlib.sha1()
+        sha.update(b"blob %d\0" % len(data))
+        sha.update(data)
+        return sha.hexdigest()
+
+    @staticmethod
+    def svn_checksum(data):
+        """Calcula o checksum SHA-1 usado pelo SVN para um conteúdo em bytes"""
+        return hashlib.sha1(data).hexdigest()
+
+    def _load(self):
+        """Carrega o mapeamento persistido"""
+        try:
+            if os.path.exists(self.cache_path):
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    self.svn_to_git = json.load(f)
+        except Exception as e:
+            self.logger.log(f"Error loading content identity cache: {str(e)}", "WARNING")
+            self.svn_to_git = {}
+
+    def _pristine_checksums(self):
+        """Checksums dos pristines ainda presentes no wc.db (None se ilegível)"""
+        wc_db = os.path.join(self.working_dir, '.svn', 'wc.db')
+        if not os.path.exists(wc_db):
+            return None
+        try:
+            conn = sqlite3.connect(f"file:{wc_db}?mode=ro", uri=True)
+            try:
+                return {checksum[6:] for (checksum,) in conn.execute("SELECT checksum FROM pristine")
+                        if checksum and checksum.startswith("$sha1$")}
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return None
+
+    def _prune(self):
+        """Remove checksums cujo pristine não existe mais e limita o tamanho do cache
+
+        Chamado com o lock.
+        """
+        pristines = self._pristine_checksums()
+        if pristines is not None:
+            self.svn_to_git = {k: v for k, v in self.svn_to_git.items() if k in pristines}
+        excess = len(self.svn_to_git) - self.MAX_ENTRIES
+        if excess > 0:
+            for key in list(self.svn_to_git)[:excess]:
+                del self.svn_to_git[key]
+
+    def save(self):
+        """Persiste o mapeamento se houver novas entradas"""
+        with self._lock:
+            if not self._dirty or not os.path.isdir(os.path.dirname(self.cache_path)):
+                return
+            self._prune()
+            try:
+                tmp_path = self.cache_path + ".tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.svn_to_git, f)
+                os.replace(tmp_path, self.cache_path)
+                self._dirty = False
+            except Exception as e:
+                self.logger.log(f"Error saving content identity cache: {str(e)}", "WARNING")
+
+    def _pristine_path(self, svn_sha1):
+        """Retorna o caminho do pristine SVN para um checksum"""
+        return os.path.join(self.working_dir, '.svn', 'pristine', svn_sha1[:2], svn_sha1 + ".svn-base")
+
+    def git_id_for_svn_checksum(self, svn_sha1, size=None):
+        """Converte um checksum SVN no ID de blob Git equivalente (com cache)"""
+        with self._lock:
+            cached = self.svn_to_git.get(svn_sha1)
+        if cached:
+            return cached
+
+        pristine = self._pristine_path(svn_sha1)
+        try:
+            if size is None:
+                size = os.path.getsize(pristine)
+
+            # Hash em streaming: o cabeçalho do Git só depende do tamanho
+            git_sha = hashlib.sha1()
+            svn_sha = hashlib.sha1()
+            git_sha.update(b"blob %d\0" % size)
+            with open(pristine, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    git_sha.update(chunk)
+                    svn_sha.update(chunk)
+        except OSError:
+            # Pristine ausente ou comprimido - não é possível provar identidade
+            return None
+
+        if svn_sha.hexdigest() != svn_sha1:
+            return None
+
+        git_id = git_sha.hexdigest()
+        with self._lock:
+            self.svn_to_git[svn_sha1] = git_id
+            self._dirty = True
+        return git_id
+
+    def read_svn_checksums(self, paths=None):
+        """Lê os checksums SHA-1 dos arquivos versionados a partir do wc.db"""
+        wc_db = os.path.join(self.working_dir, '.svn', 'wc.db')
+        checksums = {}
+        if not os.path.exists(wc_db):
+            return checksums
+
+        query = (
+            "SELECT n.local_relpath, n.checksum, p.size FROM nodes n "
+            "LEFT JOIN pristine p ON p.checksum = n.checksum "
+            "WHERE n.kind = 'file' AND n.presence = 'normal' AND n.op_depth = ("
+            "SELECT MAX(op_depth) FROM nodes m "
+            "WHERE m.wc_id = n.wc_id AND m.local_relpath = n.local_relpath)"
+        )
+
+        wanted = set(paths) if paths is not None else None
+        try:
+            conn = sqlite3.connect(f"file:{wc_db}?mode=ro", uri=True)
+            try:
+                for relpath, checksum, size in conn.execute(query):
+                    if wanted is not None and relpath not in wanted:
+                        continue
+                    if checksum and checksum.startswith("$sha1$"):
+                        checksums[relpath] = (checksum[6:], size)
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            self.logger.log(f"Error reading SVN wc.db: {str(e)}", "WARNING")
+
+        return checksums
+
+    def read_git_index(self, repo, paths=None):
+        """Lê IDs de blob e metadados de stat do índice Git"""
+        entries = {}
+        wanted = set(paths) if paths is not None else None
+        try:
+            for (path, stage), entry in repo.index.entries.items():
+                if stage != 0:
+                    continue
+                if wanted is not None and path not in wanted:
+                    continue
+                entries[path] = entry
+        except Exception as e:
+            self.logger.log(f"Error reading Git index: {str(e)}", "WARNING")
+        return entries
+
+    def _index_mtime(self):
+        """mtime (ns) do arquivo de índice do Git, ou None"""
+        try:
+            return os.stat(os.path.join(self.working_dir, '.git', 'index')).st_mtime_ns
+        except OSError:
+            return None
+
+    def _matches_index_stat(self, path, entry, index_mtime=None, root=None):
+        """Verifica via stat se o arquivo de trabalho corresponde à entrada do índice
+
+        Arquivos alterados depois da gravação do índice ("racily clean")
+        não são considerados, pois o stat não prova seu conteúdo.
+        """
+        try:
+            st = os.stat(os.path.join(root or self.working_dir, path))
+        except OSError:
+            return False
+        if st.st_size != entry.size or st.st_mtime_ns != entry.mtime[0] * 10 ** 9 + entry.mtime[1]:
+            return False
+        return index_mtime is None or st.st_mtime_ns < index_mtime
+
+    def _svn_recorded_files(self, root=None):
+        """Arquivos cujo stat corresponde ao registrado no wc.db: {caminho: (sha1, tamanho)}
+
+        Arquivos com tradução de fim de linha, keywords ou links simbólicos
+        ficam de fora, pois o arquivo de trabalho difere do pristine.
+        """
+        wc_db = os.path.join(self.working_dir, '.svn', 'wc.db')
+        files = {}
+        if not os.path.exists(wc_db):
+            return files
+
+        query = (
+            "SELECT n.local_relpath, n.checksum, n.translated_size, n.last_mod_time, n.properties, p.size "
+            "FROM nodes n LEFT JOIN pristine p ON p.checksum = n.checksum "
+            "WHERE n.kind = 'file' AND n.presence = 'normal' AND n.op_depth = ("
+            "SELECT MAX(op_depth) FROM nodes m "
+            "WHERE m.wc_id = n.wc_id AND m.local_relpath = n.local_relpath)"
+        )
+        try:
+            conn = sqlite3.connect(f"file:{wc_db}?mode=ro", uri=True)
+            try:
+                rows = conn.execute(query).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            self.logger.log(f"Error reading SVN wc.db: {str(e)}", "WARNING")
+            return files
+
+        for relpath, checksum, translated_size, last_mod_time, properties, size in rows:
+            if not checksum or not checksum.startswith("$sha1$") or translated_size is None:
+                continue
+            if properties and any(prop in bytes(properties) for prop in self.TRANSLATED_PROPS):
+                continue
+            try:
+                st = os.stat(os.path.join(root or self.working_dir, relpath))
+            except OSError:
+                continue
+            # last_mod_time é gravado em microssegundos
+            if st.st_size == translated_size and st.st_mtime_ns // 1000 == last_mod_time:
+                files[relpath] = (checksum[6:], size)
+        return files
+
+    def working_ids(self, repo, root=None):
+        """IDs de blob Git dos arquivos de trabalho comprovados sem lê-los
+
+        Um arquivo entra no resultado quando seu stat (tamanho e mtime)
+        corresponde à entrada do índice Git ou ao registro do wc.db; seu
+        conteúdo é então o blob do índice ou o pristine SVN. `root` permite
+        verificar uma cópia da árvore feita com os mtimes preservados
+        (shutil.copy2). Retorna {caminho com '/': ID do blob}.
+        """
+        ids = {}
+        if repo is not None:
+            index_mtime = self._index_mtime()
+            for path, entry in self.read_git_index(repo).items():
+                if self._matches_index_stat(path, entry, index_mtime, root):
+                    ids[path] = entry.hexsha
+
+        for path, (svn_sha1, size) in self._svn_recorded_files(root).items():
+            if path in ids:
+                continue
+            git_id = self.git_id_for_svn_checksum(svn_sha1, size)
+            if git_id:
+                ids[path] = git_id
+
+        self.save()
+        return ids
+
+    def paths_in_agreement(self, repo, paths):
+        """Retorna os caminhos em que Git e SVN comprovadamente têm o mesmo conteúdo
+
+        Um caminho só é considerado em acordo quando o blob do índice Git
+        equivale ao pristine SVN e o arquivo de trabalho não mudou desde a
+        última atualização do índice (verificado apenas por stat).
+        """
+        paths = [p.replace(os.sep, '/') for p in paths]
+        svn_checksums = self.read_svn_checksums(paths)
+        git_entries = self.read_git_index(repo, paths)
+        index_mtime = self._index_mtime()
+
+        agreed = set()
+        for path in paths:
+            svn_entry = svn_checksums.get(path)
+            git_entry = git_entries.get(path)
+            if not svn_entry or git_entry is None:
+                continue
+
+            svn_sha1, size = svn_entry
+            if self.git_id_for_svn_checksum(svn_sha1, size) != git_entry.hexsha:
+                continue
+
+            if self._matches_index_stat(path, git_entry, index_mtime):
+                agreed.add(path)
+
+        self.save()
+        return agreed
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+from datetime import datetime, timedelta
+
+# Atalhos aceitos no lugar dos cinco campos
+ALIASES = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+
+MONTH_NAMES = {name: index for index, name in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], start=1)}
+DAY_NAMES = {name: index for index, name in enumerate(["sun", "mon", "tue", "wed", "thu", "fri", "sat"])}
+
+# (nome, mínimo, máximo, nomes simbólicos)
+FIELDS = [
+    ("minute", 0, 59, {}),
+    ("hour", 0, 23, {}),
+    ("day of month", 1, 31, {}),
+    ("month", 1, 12, MONTH_NAMES),
+    ("day of week", 0, 7, DAY_NAMES),
+]
+
+class CronExpression:
+    """Expressão cron de cinco campos (minuto, hora, dia do mês, mês, dia da semana)
+
+    Aceita '*', listas, intervalos, passos ('*/5', '8-18/2'), nomes de meses
+    e dias ('mon-fri', 'jan') e os atalhos '@hourly', '@daily' etc. Como
+    no cron tradicional, se dia do mês e dia da semana forem ambos
+    restritos, basta um deles coincidir. Domingo pode ser 0 ou 7.
+    """
+
+    def __init__(self, expression):
+        """Analisa a expressão, lançando ValueError se for inválida"""
+        self.expression = expression.strip()
+        text = ALIASES.get(self.expression.lower(), self.expression)
+        parts = text.split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression must have 5 fields: '{expression}'")
+
+        values = [self._parse_field(part, *field) for part, field in zip(parts, FIELDS)]
+        self.minutes, self.hours, self.days, self.months, weekdays = values
+        self.weekdays = {0 if day == 7 else day for day in weekdays}
+        self.day_restricted = parts[2] != "*"
+        self.weekday_restricted = parts[4] != "*"
+
+        self.sorted_minutes = sorted(self.minutes)
+        self.sorted_hours = sorted(self.hours)
+
+    @staticmethod
+    def _parse_value(text, name, names):
+        """Converte um valor numérico ou simbólico"""
+        text = text.lower()
+        if text in names:
+            return names[text]
+        if not text.isdigit():
+            raise ValueError(f"Invalid {name} value: '{text}'")
+        return int(text)
+
+    @classmethod
+    def _parse_field(cls, text, name, minimum, maximum, names):
+        """Expande um campo no conjunto de valores permitidos"""
+        values = set()
+        for item in text.split(','):
+            spec, _, step = item.partition('/')
+            step = int(step) if step else 1
+            if step < 1:
+                raise ValueError(f"Invalid step in {name}: '{item}'")
+
+            if spec == "*":
+                start, end = minimum, maximum
+            elif '-' in spec:
+                first, last = spec.split('-', 1)
+                start = cls._parse_value(first, name, names)
+                end = cls._parse_value(last, name, names)
+            else:
+                start = cls._parse_value(spec, name, names)
+                end = maximum if item.count('/') else start
+
+            if not (minimum <= start <= maximum and minimum <= end <= maximum) or start > end:
+                raise ValueError(f"Value out of range in {name}: '{item}'")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, day):
+        """Verifica dia do mês e dia da semana (regra OR do cron quando ambos são restritos)"""
+        in_month = day.day in self.days
+        in_week = (day.isoweekday() % 7) in self.weekdays
+        if self.day_restricted and self.weekday_restricted:
+            return in_month or in_week
+        return in_month and in_week
+
+    def next_after(self, moment):
+        """Próximo disparo estritamente depois de `moment` (datetime)
+
+        Avança por dia, hora e minuto usando os conjuntos ordenados, sem
+        testar minuto a minuto. Retorna None se não houver disparo nos
+        próximos anos (ex.: '0 0 31 2 *').
+        """
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=366 * 5)
+
+        while candidate < limit:
+            if candidate.month not in self.months:
+                # Primeiro dia do próximo mês
+                year, month = (candidate.year + 1, 1) if candidate.month == 12 else (candidate.year, candidate.month + 1)
+                candidate = candidate.replace(year=year, month=month, day=1, hour=0, minute=0)
+                continue
+
+            if not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+
+            hour = next((h for h in self.sorted_hours if h >= candidate.hour), None)
+            if hour is None:
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if hour != candidate.hour:
+                candidate = candidate.replace(hour=hour, minute=0)
+
+            minute = next((m for m in self.sorted_minutes if m >= candidate.minute), None)
+            if minute is None:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+                continue
+            return candidate.replace(minute=minute)
+
+        return None
+
+    def __str__(self):
+        return self.expression
@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+import threading
+import subprocess
+
+# Constantes de <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+EVENT_HEADER = struct.Struct("iIII")
+
+# Diretórios de controle nunca observados
+EXCLUDED_DIRS = {".git", ".svn"}
+
+def _load_libc():
+    """Carrega a libc com as funções de inotify (apenas Linux)"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+_libc = _load_libc()
+
+class InotifyWatcher:
+    """Observa a cópia de trabalho com inotify e agrupa rajadas de alterações
+
+    .git, .svn e caminhos ignorados pelo Git ficam de fora. Eventos são
+    acumulados até que nada mude por `debounce` segundos (ou até
+    `max_delay` segundos desde o primeiro evento) e então entregues de uma
+    vez a `on_change` como um conjunto de caminhos relativos. Se o kernel
+    descartar eventos ou não houver watches suficientes, `on_change`
+    recebe None, indicando que é preciso varrer a árvore inteira.
+    """
+
+    def __init__(self, root, logger, on_change, debounce=2.0, max_delay=30.0):
+        """Inicializa o watcher (os watches são criados em start)"""
+        self.root = os.path.abspath(root)
+        self.logger = logger
+        self.on_change = on_change
+        self.debounce = debounce
+        self.max_delay = max_delay
+
+        self.fd = None
+        self.watches = {}
+        self.ignored = set()
+        self.complete = True
+        self._pending = set()
+        self._overflow = False
+        self._first_event = None
+        self._last_event = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def is_available():
+        """Indica se inotify está disponível nesta plataforma"""
+        return _libc is not None
+
+    def start(self):
+        """Cria os watches e inicia a thread do watcher"""
+        if self._thread and self._thread.is_alive():
+            return True
+        if not self.is_available():
+            self.logger.log("File system watcher requires Linux inotify; falling back to scheduled syncs", "WARNING")
+            return False
+
+        self.fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            self.logger.log(f"inotify_init1 failed: {os.strerror(ctypes.get_errno())}", "ERROR")
+            self.fd = None
+            return False
+
+        self.complete = True
+        self.ignored = self._ignored_directories()
+        self._add_tree("", self.ignored)
+        self.logger.log(f"Watching {len(self.watches)} directories under {self.root}")
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="fs-watcher", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self):
+        """Para a thread e libera o descritor do inotify"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+        self.watches.clear()
+
+    def _ignored_directories(self, rel_dir=""):
+        """Diretórios ignorados pelo Git (não recebem watches), opcionalmente sob `rel_dir`
+
+        Se o próprio `rel_dir` for ignorado, ele faz parte do resultado.
+        """
+        pathspec = ["--", rel_dir] if rel_dir else []
+        try:
+            result = subprocess.run(
+                ["git", "ls-files", "--others", "--ignored", "--exclude-standard", "--directory", "-z"] + pathspec,
+                cwd=self.root, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+        except OSError:
+            return set()
+        paths = result.stdout.decode('utf-8', errors='replace').split('\0')
+        return {p.rstrip('/') for p in paths if p.endswith('/')}
+
+    def _filter_ignored(self, paths):
+        """Remove caminhos ignorados pelo Git com uma única chamada a 'git check-ignore'"""
+        if not paths:
+            return paths
+        try:
+            result = subprocess.run(
+                ["git", "check-ignore", "--stdin", "-z"],
+                cwd=self.root,
+                input=b''.join(p.encode('utf-8') + b'\0' for p in paths),
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+        except OSError:
+            return paths
+        ignored = set(result.stdout.decode('utf-8', errors='replace').split('\0'))
+        return {p for p in paths if p not in ignored}
+
+    def _add_watch(self, rel_dir):
+        """Cria um watch para um diretório relativo à raiz"""
+        path = os.path.join(self.root, rel_dir) if rel_dir else self.root
+        wd = _libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error == errno.ENOSPC and self.complete:
+                self.logger.log("inotify watch limit reached (fs.inotify.max_user_watches); "
+                                "changes will trigger full scans", "WARNING")
+            if error != errno.ENOENT:
+                self.complete = False
+            return
+        self.watches[wd] = rel_dir
+
+    def _add_tree(self, rel_dir, ignored=(), collect=None):
+        """Cria watches para um diretório e seus subdiretórios
+
+        Se `collect` for um conjunto, os arquivos encontrados são adicionados
+        a ele (usado para diretórios criados ou movidos para a árvore).
+        """
+        if rel_dir in ignored:
+            return
+        top = os.path.join(self.root, rel_dir) if rel_dir else self.root
+        for current, dirs, files in os.walk(top):
+            rel_current = os.path.relpath(current, self.root).replace(os.sep, '/')
+            rel_current = "" if rel_current == "." else rel_current
+            dirs[:] = [
+                d for d in dirs
+                if d not in EXCLUDED_DIRS and f"{rel_current}/{d}".lstrip('/') not in ignored
+            ]
+            self._add_watch(rel_current)
+            if collect is not None:
+                collect.update(f"{rel_current}/{f}".lstrip('/') for f in files)
+
+    def _read_events(self):
+        """Lê os eventos disponíveis e acumula os caminhos alterados"""
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return
+
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0').decode('utf-8', errors='replace')
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                # Eventos perdidos: o lote precisa ser entregue mesmo sem outros caminhos
+                self._overflow = True
+                self._mark_event()
+                continue
+            if mask & IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+
+            rel_dir = self.watches.get(wd)
+            if rel_dir is None or (mask & (IN_DELETE_SELF | IN_MOVE_SELF)):
+                continue
+
+            rel_path = f"{rel_dir}/{name}".lstrip('/') if name else rel_dir
+            if not rel_path or rel_path.split('/')[0] in EXCLUDED_DIRS:
+                continue
+
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                # Diretório novo: observar e marcar o conteúdo já existente, com
+                # o mesmo filtro da inicialização (node_modules, build/ etc.)
+                if self._filter_ignored({rel_path + '/'}) != {rel_path + '/'}:
+                    self.ignored.add(rel_path)
+                    continue
+                self.ignored.update(self._ignored_directories(rel_path))
+                self._add_tree(rel_path, self.ignored, collect=self._pending)
+            self._pending.add(rel_path)
+            self._mark_event()
+
+    def _mark_event(self):
+        """Registra o horário do evento para o debounce do lote"""
+        now = time.monotonic()
+        self._first_event = self._first_event or now
+        self._last_event = now
+
+    def _run(self):
+        """Função da thread: lê eventos e entrega lotes após o debounce"""
+        while not self._stop.is_set():
+            timeout = 0.5
+            if self._last_event is not None:
+                timeout = max(0.05, min(timeout, self._last_event + self.debounce - time.monotonic()))
+
+            try:
+                readable, _, _ = select.select([self.fd], [], [], timeout)
+            except (OSError, ValueError):
+                break
+            if readable:
+                self._read_events()
+
+            if self._last_event is None:
+                continue
+            now = time.monotonic()
+            if now - self._last_event >= self.debounce or now - self._first_event >= self.max_delay:
+                self._flush()
+
+    def _flush(self):
+        """Entrega o lote acumulado ao callback"""
+        paths = self._filter_ignored(self._pending)
+        incomplete = self._overflow or not self.complete
+        self._pending = set()
+        self._overflow = False
+        self._first_event = None
+        self._last_event = None
+
+        if not paths and not incomplete:
+            return
+        try:
+            self.on_change(None if incomplete else paths)
+        except Exception as e:
+            self.logger.log(f"Error handling file system changes: {str(e)}", "ERROR")
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+
+import threading
+from abc import ABC, abstractmethod
+
+from git import GitCommandError
+
+from core.cancellation import run_command
+from core.git_blob_reader import GitBlobReader
+from core.git_branches import GitBranchTable, BranchInfo, BRANCH_COMMAND
+from core.git_status import GitStatusSnapshot, STATUS_COMMAND
+
+try:
+    import pygit2
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    PYGIT2_AVAILABLE = False
+
+BACKEND_NAMES = ("cli", "pygit2", "auto")
+
+class GitBackend(ABC):
+    """Interface das leituras do GitManager que podem ser feitas por backends distintos
+
+    - status_snapshot(paths=None): GitStatusSnapshot da árvore de trabalho
+      (opcionalmente restrito a caminhos/diretórios)
+    - read_blobs(specs): conteúdo de "rev:caminho"/SHA (bytes ou None), na ordem
+    - diff_tree(old, new): alterações entre duas revisões
+      (lista de {"status", "path", "old_path"})
+    - list_refs(): GitBranchTable com branches locais e remotas
+
+    Backends incompletos não podem ser instanciados (TypeError).
+    """
+
+    name = None
+
+    def __init__(self, working_dir, logger):
+        self.working_dir = working_dir
+        self.logger = logger
+
+    @abstractmethod
+    def status_snapshot(self, paths=None):
+        """GitStatusSnapshot da árvore de trabalho"""
+
+    @abstractmethod
+    def read_blobs(self, specs):
+        """Conteúdo de cada "rev:caminho"/SHA (bytes ou None), na ordem"""
+
+    @abstractmethod
+    def diff_tree(self, old, new):
+        """Alterações entre duas revisões"""
+
+    @abstractmethod
+    def list_refs(self):
+        """GitBranchTable com branches locais e remotas"""
+
+    def close(self):
+        """Libera recursos do backend"""
+        pass
+
+class CLIGitBackend(GitBackend):
+    """Backend baseado no executável git (sempre disponível)"""
+
+    name = "cli"
+
+    def __init__(self, working_dir, logger):
+        super().__init__(working_dir, logger)
+        self.blob_reader = GitBlobReader(working_dir, logger)
+
+    def _git(self, args):
+        """Executa um comando git e retorna a saída (GitCommandError em caso de falha)"""
+        result = run_command(["git"] + list(args), cwd=self.working_dir)
+        if result.returncode != 0:
+            raise GitCommandError(["git"] + list(args), result.returncode, result.stderr.strip())
+        return result.stdout
+
+    def status_snapshot(self, paths=None):
+        args = list(STATUS_COMMAND)
+        if paths:
+            args += ["--"] + [f":(literal){p}" for p in sorted(paths)]
+        return GitStatusSnapshot.parse(self._git(args))
+
+    def read_blobs(self, specs):
+        return self.blob_reader.read_many(specs)
+
+    def diff_tree(self, old, new):
+        records = self._git(["diff-tree", "-r", "-z", "-M", "--name-status", old, new]).split('\0')
+        changes = []
+        i = 0
+        while i < len(records) and records[i]:
+            status = records[i]
+            if status[0] in "RC":
+                changes.append({"status": status[0], "old_path": records[i + 1], "path": records[i + 2]})
+                i += 3
+            else:
+                changes.append({"status": status[0], "old_path": None, "path": records[i + 1]})
+                i += 2
+        return changes
+
+    def list_refs(self):
+        return GitBranchTable.parse(self._git(BRANCH_COMMAND))
+
+    def close(self):
+        self.blob_reader.close()
+
+class Pygit2GitBackend(GitBackend):
+    """Backend em processo baseado em libgit2 (requer o pacote opcional pygit2)
+
+    O status não faz detecção de renomeações: arquivos renomeados aparecem
+    como removidos e adicionados, como em 'git status --no-renames'.
+
+    Um pygit2.Repository não pode ser usado por várias threads ao mesmo
+    tempo (fila de sincronização, watcher e GUI compartilham o backend),
+    então todos os acessos são serializados por um lock.
+    """
+
+    name = "pygit2"
+
+    def __init__(self, working_dir, logger):
+        super().__init__(working_dir, logger)
+        self.repo = pygit2.Repository(working_dir)
+        self._lock = threading.RLock()
+
+    def status_snapshot(self, paths=None):
+        with self._lock:
+            return self._status_snapshot(paths)
+
+    def _status_snapshot(self, paths=None):
+        snapshot = GitStatusSnapshot()
+        repo = self.repo
+        prefixes = tuple(p.rstrip('/') + '/' for p in paths) if paths else None
+
+        if repo.head_is_unborn:
+            snapshot.branch = repo.references["HEAD"].target.replace("refs/heads/", "")
+        elif repo.head_is_detached:
+            snapshot.branch = "Detached"
+            snapshot.oid = str(repo.head.target)
+        else:
+            snapshot.branch = repo.head.shorthand
+            snapshot.oid = str(repo.head.target)
+            upstream = repo.branches.local[snapshot.branch].upstream
+            if upstream is not None:
+                snapshot.upstream = upstream.shorthand
+                snapshot.ahead, snapshot.behind = repo.ahead_behind(repo.head.target, upstream.target)
+
+        for path, flags in sorted(repo.status().items()):
+            if flags & pygit2.GIT_STATUS_IGNORED:
+                continue
+            if paths and path not in paths and not path.startswith(prefixes):
+                continue
+            if flags & pygit2.GIT_STATUS_CONFLICTED:
+                snapshot.conflicts.append(path)
+                continue
+            if flags == pygit2.GIT_STATUS_WT_NEW:
+                snapshot.untracked.append(path)
+                continue
+
+            staged = self._status_code(flags, pygit2.GIT_STATUS_INDEX_NEW, pygit2.GIT_STATUS_INDEX_MODIFIED,
+                                       pygit2.GIT_STATUS_INDEX_DELETED, pygit2.GIT_STATUS_INDEX_RENAMED,
+                                       pygit2.GIT_STATUS_INDEX_TYPECHANGE)
+            unstaged = self._status_code(flags, pygit2.GIT_STATUS_WT_NEW, pygit2.GIT_STATUS_WT_MODIFIED,
+                                         pygit2.GIT_STATUS_WT_DELETED, pygit2.GIT_STATUS_WT_RENAMED,
+                                         pygit2.GIT_STATUS_WT_TYPECHANGE)
+            if staged:
+                snapshot.staged.append((path, staged))
+            if unstaged:
+                snapshot.unstaged.append((path, unstaged))
+
+        return snapshot
+
+    @staticmethod
+    def _status_code(flags, new, modified, deleted, renamed, typechange):
+        """Converte os flags do libgit2 na letra usada pelo 'git status'"""
+        for flag, code in ((new, "A"), (modified, "M"), (deleted, "D"), (renamed, "R"), (typechange, "T")):
+            if flags & flag:
+                return code
+        return None
+
+    def read_blobs(self, specs):
+        with self._lock:
+            return self._read_blobs(specs)
+
+    def _read_blobs(self, specs):
+        results = []
+        for spec in specs:
+            try:
+                obj = self.repo.revparse_single(spec)
+            except (KeyError, ValueError, pygit2.GitError):
+                results.append(None)
+                continue
+            results.append(obj.data if isinstance(obj, pygit2.Blob) else None)
+        return results
+
+    def diff_tree(self, old, new):
+        with self._lock:
+            return self._diff_tree(old, new)
+
+    def _diff_tree(self, old, new):
+        old_tree = self.repo.revparse_single(old).peel(pygit2.Tree)
+        new_tree = self.repo.revparse_single(new).peel(pygit2.Tree)
+        diff = old_tree.diff_to_tree(new_tree)
+        diff.find_similar()
+
+        changes = []
+        for delta in diff.deltas:
+            status = delta.status_char()
+            changes.append({
+                "status": status,
+                "old_path": delta.old_file.path if status in "RC" else None,
+                "path": delta.new_file.path
+            })
+        return changes
+
+    def list_refs(self):
+        with self._lock:
+            return self._list_refs()
+
+    def _list_refs(self):
+        table = GitBranchTable()
+        repo = self.repo
+        current = None if repo.head_is_detached or repo.head_is_unborn else repo.head.shorthand
+
+        for name in repo.branches.local:
+            branch = repo.branches.local[name]
+            info = self._branch_info(name, False, branch.target)
+            upstream = branch.upstream
+            if upstream is not None:
+                info.upstream = upstream.shorthand
+                info.ahead, info.behind = repo.ahead_behind(branch.target, upstream.target)
+            if name == current:
+                info.current = True
+                table.current = name
+            table.local[name] = info
+
+        for name in repo.branches.remote:
+            if name.endswith("/HEAD"):
+                continue
+            table.remote[name] = self._branch_info(name, True, repo.branches.remote[name].target)
+
+        return table
+
+    def _branch_info(self, name, remote, target):
+        """Cria a linha da tabela de branches para uma referência"""
+        commit = self.repo[target]
+        return BranchInfo(name, remote, str(target), timestamp=commit.commit_time)
+
+def create_backend(name, working_dir, logger):
+    """Cria o backend solicitado ("cli", "pygit2" ou "auto")
+
+    Sem o pygit2 (ou se o libgit2 não abrir o repositório) o backend CLI é
+    usado como fallback.
+    """
+    if name in ("pygit2", "auto") and PYGIT2_AVAILABLE:
+        try:
+            return Pygit2GitBackend(working_dir, logger)
+        except Exception as e:
+            logger.log(f"Could not open repository with pygit2, using git CLI: {str(e)}", "WARNING")
+    elif name == "pygit2":
+        logger.log("pygit2 is not installed, using git CLI backend", "WARNING")
+
+    return CLIGitBackend(working_dir, logger)
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import subprocess
+
+class GitBlobReader:
+    """Leitor de blobs Git baseado em um processo 'git cat-file --batch' persistente
+
+    Um único processo atende todas as leituras. As requisições de um lote
+    são enviadas em pipeline (uma thread escreve enquanto a outra lê as
+    respostas), então ler milhares de blobs custa um processo, não milhares.
+    """
+
+    def __init__(self, working_dir, logger):
+        """Inicializa o leitor (o processo é iniciado sob demanda)"""
+        self.working_dir = working_dir
+        self.logger = logger
+        self.process = None
+        self._lock = threading.Lock()
+
+    def _ensure_process(self):
+        """Inicia (ou reinicia) o processo 'git cat-file --batch'"""
+        if self.process and self.process.poll() is None:
+            return self.process
+
+        self.process = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=self.working_dir
+        )
+        return self.process
+
+    def close(self):
+        """Encerra o processo persistente"""
+        with self._lock:
+            if self.process and self.process.poll() is None:
+                try:
+                    self.process.stdin.close()
+                    self.process.wait(timeout=5)
+                except (OSError, subprocess.TimeoutExpired):
+                    self.process.kill()
+            self.process = None
+
+    def read(self, spec):
+        """Lê um objeto ("HEAD:caminho", SHA etc.); retorna bytes ou None se ausente"""
+        return self.read_many([spec])[0]
+
+    def read_many(self, specs):
+        """Lê vários objetos com uma única ida e volta em pipeline
+
+        Retorna uma lista de bytes (ou None para objetos ausentes) na mesma
+        ordem das especificações.
+        """
+        specs = list(specs)
+        results = [None] * len(specs)
+
+        # Especificações com quebra de linha não podem ser enviadas pelo protocolo em lote
+        batch = [(i, spec) for i, spec in enumerate(specs) if '\n' not in spec]
+        if not batch:
+            return results
+
+        with self._lock:
+            try:
+                self._read_batch(batch, results)
+            except (OSError, ValueError) as e:
+                # Processo morreu no meio do lote: descartar e tentar de novo uma vez
+                self.logger.log(f"git cat-file process failed, restarting: {str(e)}", "WARNING")
+                self.process = None
+                self._read_batch(batch, results)
+
+        return results
+
+    def _read_batch(self, batch, results):
+        """Envia as requisições em uma thread e lê as respostas na thread atual"""
+        process = self._ensure_process()
+        payload = b''.join(spec.encode('utf-8') + b'\n' for _, spec in batch)
+
+        write_error = []
+        def writer():
+            try:
+                process.stdin.write(payload)
+                process.stdin.flush()
+            except OSError as e:
+                write_error.append(e)
+
+        writer_thread = threading.Thread(target=writer, daemon=True)
+        writer_thread.start()
+
+        stdout = process.stdout
+        try:
+            for index, _ in batch:
+                header = stdout.readline()
+                if not header:
+                    raise OSError("git cat-file closed its output")
+
+                parts = header.split()
+                if len(parts) < 3 or parts[-1] in (b'missing', b'ambiguous'):
+                    results[index] = None
+                    continue
+
+                size = int(parts[2])
+                content = stdout.read(size)
+                stdout.read(1)  # Quebra de linha após o conteúdo
+                results[index] = content
+        except (OSError, ValueError):
+            # Encerrar o processo libera a thread de escrita se ela estiver bloqueada
+            process.kill()
+            raise
+        finally:
+            writer_thread.join()
+
+        if write_error:
+            raise write_error[0]
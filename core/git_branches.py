@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+import os
+from datetime import datetime
+
+BRANCH_FORMAT = "%00".join([
+    "%(refname)",
+    "%(objectname)",
+    "%(upstream:short)",
+    "%(upstream:track,nobracket)",
+    "%(committerdate:unix)",
+    "%(HEAD)",
+])
+BRANCH_COMMAND = ["for-each-ref", f"--format={BRANCH_FORMAT}", "refs/heads", "refs/remotes"]
+
+class BranchInfo:
+    """Linha da tabela de branches"""
+
+    def __init__(self, name, remote, tip, upstream=None, ahead=0, behind=0,
+                 timestamp=None, current=False, gone=False):
+        self.name = name
+        self.remote = remote
+        self.tip = tip
+        self.upstream = upstream
+        self.ahead = ahead
+        self.behind = behind
+        self.timestamp = timestamp
+        self.current = current
+        self.gone = gone
+
+    @property
+    def date(self):
+        """Data do último commit da branch"""
+        return datetime.fromtimestamp(self.timestamp) if self.timestamp else None
+
+    def describe(self):
+        """Resumo do rastreamento para exibição"""
+        if not self.upstream:
+            return "No upstream"
+        if self.gone:
+            return f"{self.upstream} (gone)"
+        return f"{self.upstream}, ahead {self.ahead}, behind {self.behind}"
+
+class GitBranchTable:
+    """Tabela de branches locais e remotas obtida com um único 'git for-each-ref'
+
+    Branches ficam em dicionários por nome, então verificações de
+    existência são consultas diretas.
+    """
+
+    def __init__(self):
+        """Inicializa uma tabela vazia"""
+        self.local = {}
+        self.remote = {}
+        self.current = None
+
+    @classmethod
+    def parse(cls, output):
+        """Converte a saída de 'git for-each-ref --format=BRANCH_FORMAT'"""
+        table = cls()
+        for line in output.splitlines():
+            fields = line.split('\0')
+            if len(fields) != 6:
+                continue
+
+            refname, tip, upstream, track, timestamp, head = fields
+            if refname.startswith("refs/heads/"):
+                branch = BranchInfo(refname[len("refs/heads/"):], False, tip)
+                table.local[branch.name] = branch
+                if head == "*":
+                    branch.current = True
+                    table.current = branch.name
+            elif refname.startswith("refs/remotes/"):
+                # Ignorar a referência simbólica <remote>/HEAD
+                if refname.endswith("/HEAD"):
+                    continue
+                branch = BranchInfo(refname[len("refs/remotes/"):], True, tip)
+                table.remote[branch.name] = branch
+            else:
+                continue
+
+            branch.upstream = upstream or None
+            branch.timestamp = int(timestamp) if timestamp.isdigit() else None
+            branch.gone = track == "gone"
+            for part in track.split(", "):
+                if part.startswith("ahead "):
+                    branch.ahead = int(part[6:])
+                elif part.startswith("behind "):
+                    branch.behind = int(part[7:])
+
+        return table
+
+    def has_local(self, name):
+        """Indica se existe uma branch local com o nome"""
+        return name in self.local
+
+    def has_remote(self, name):
+        """Indica se existe uma branch remota com o nome (ex.: 'origin/main')"""
+        return name in self.remote
+
+    def names(self):
+        """Retorna (branches locais, branches remotas) como listas de nomes"""
+        return list(self.local), list(self.remote)
+
+def refs_signature(git_dir):
+    """Assinatura das referências (mtime de packed-refs, HEAD e diretórios em refs/)
+
+    Git atualiza referências gravando um arquivo temporário e renomeando-o,
+    o que altera o mtime do diretório que contém a referência.
+    """
+    signature = []
+    for name in ("packed-refs", "HEAD"):
+        try:
+            signature.append(os.stat(os.path.join(git_dir, name)).st_mtime_ns)
+        except OSError:
+            signature.append(None)
+
+    for root, _, _ in os.walk(os.path.join(git_dir, "refs")):
+        try:
+            signature.append((root, os.stat(root).st_mtime_ns))
+        except OSError:
+            pass
+
+    return tuple(signature)
@@ -1,22 +1,123 @@
 # -*- coding: utf-8 -*-
 
 import os
+import time
+import subprocess
 import git
-from git import GitCommandError
+from git import Actor, GitCommandError, RemoteProgress
+
+from core.async_executor import get_executor
+from core.cancellation import run_command, start_process, finish_process
+from core.git_backends import create_backend
+from core.git_branches import GitBranchTable, refs_signature
+from core.git_status import GitStatusSnapshot, STATUS_COMMAND
+from core.progress import ProgressReporter, iter_progress_lines, parse_git_progress_bytes
+
+# Caminhos por chamada quando o git não suporta --pathspec-from-file
+PATHSPEC_CHUNK_SIZE = 500
+
+# Estratégia de fetch: escopo ("all" ou "current_branch"), profundidade (apenas
+# para repositórios rasos ou vazios), filtro de clone parcial, prune e tags.
+# Os padrões equivalem a um 'git fetch' simples; restringir é opcional.
+DEFAULT_FETCH_OPTIONS = {
+    "scope": "all",
+    "depth": 0,
+    "filter": "",
+    "prune": False,
+    "tags": True
+}
+
+class FetchProgress(RemoteProgress):
+    """Converte o progresso do GitPython em eventos do ProgressReporter"""
+    
+    STAGES = {
+        RemoteProgress.COUNTING: "Counting objects",
+        RemoteProgress.COMPRESSING: "Compressing objects",
+        RemoteProgress.RECEIVING: "Receiving objects",
+        RemoteProgress.RESOLVING: "Resolving deltas",
+        RemoteProgress.WRITING: "Writing objects",
+        RemoteProgress.FINDING_SOURCES: "Finding sources",
+        RemoteProgress.CHECKING_OUT: "Checking out files",
+    }
+    
+    def __init__(self, reporter):
+        super().__init__()
+        self.reporter = reporter
+        self.received_bytes = 0
+    
+    def update(self, op_code, cur_count, max_count=None, message=''):
+        stage = self.STAGES.get(op_code & RemoteProgress.OP_MASK, "Working")
+        
+        # Bytes só aparecem na etapa de recebimento ("1.20 MiB | 512.00 KiB/s")
+        received = parse_git_progress_bytes(message)
+        delta = 0
+        if received is not None and received > self.received_bytes:
+            delta = received - self.received_bytes
+            self.received_bytes = received
+        
+        self.reporter.update(
+            bytes=delta,
+            current=int(cur_count or 0),
+            total=int(max_count) if max_count else None,
+            stage=stage,
+            message=message
+        )
 
 class GitManager:
-    def __init__(self, working_dir, logger):
+    def __init__(self, working_dir, logger, backend="cli"):
         """Inicializa o gerenciador Git"""
         self.working_dir = working_dir
         self.logger = logger
         self.repo = None
         
+        # Funções que recebem eventos de progresso (dicionários)
+        self.progress_listeners = []
+        
+        # Timeout por comando de rede (segundos) e token de cancelamento da operação atual
+        self.command_timeout = None
+        self.cancel_token = None
+        
+        # Backend das leituras (status, blobs, diffs de árvore, refs): "cli",
+        # "pygit2" ou "auto"; criado sob demanda
+        self.backend_name = backend
+        self.backend = None
+        
+        # Último snapshot de status (git status --porcelain=v2) obtido. É reutilizado
+        # até ser invalidado (commit, checkout, sync, watcher), até o índice/HEAD
+        # mudarem no disco ou até expirar o TTL
+        self.last_status_snapshot = None
+        self.status_cache_ttl = 30.0
+        self._status_cache_valid = False
+        self._status_cache_signature = None
+        self._status_cache_time = 0.0
+        
+        # Estatísticas do último staging em lote (arquivos, remoções, tempo)
+        self.last_stage_stats = None
+        
+        # Estratégia de fetch e estatísticas do último fetch (bytes, refs, tempo)
+        self.fetch_options = dict(DEFAULT_FETCH_OPTIONS)
+        self.last_fetch_stats = None
+        
+        # Tabela de branches (git for-each-ref), válida enquanto as referências não mudarem
+        self._branch_table = None
+        self._branch_table_signature = None
+        
         if self.is_git_repo():
             try:
                 self.repo = git.Repo(working_dir)
             except Exception as e:
                 self.logger.log(f"Error initializing Git repo: {str(e)}", "ERROR")
     
+    def add_progress_listener(self, listener):
+        """Registra uma função para receber eventos de progresso"""
+        if listener not in self.progress_listeners:
+            self.progress_listeners.append(listener)
+    
+    def remove_progress_listener(self, listener):
+        """Remove uma função de eventos de progresso"""
+        if listener in self.progress_listeners:
+            self.progress_listeners.remove(listener)
+    
     def is_git_repo(self):
         """Verifica se o diretório é um repositório Git"""
         return os.path.exists(os.path.join(self.working_dir, '.git'))
@@ -55,7 +156,104 @@ class GitManager:
             self.logger.log(f"Error initializing Git repository: {str(e)}", "ERROR")
             return False
     
-    def get_status(self):
+    def set_backend(self, name):
+        """Seleciona o backend de leitura ("cli", "pygit2" ou "auto")"""
+        if name != self.backend_name:
+            self.close()
+            self.backend_name = name
+    
+    def get_backend(self):
+        """Obtém o backend de leitura do repositório"""
+        if self.backend is None:
+            self.backend = create_backend(self.backend_name, self.working_dir, self.logger)
+        return self.backend
+    
+    def close(self):
+        """Libera processos persistentes associados ao repositório"""
+        if self.backend:
+            self.backend.close()
+            self.backend = None
+    
+    def read_files(self, file_paths, revision="HEAD"):
+        """Lê o conteúdo de vários arquivos em uma revisão com um único processo git
+
+        Retorna um dicionário caminho -> texto (None para arquivos ausentes).
+        """
+        if not self.repo:
+            return {}
+        
+        paths = [p.replace(os.sep, '/') for p in file_paths]
+        blobs = self.get_backend().read_blobs([f"{revision}:{p}" for p in paths])
+        return {
+            original: blob.decode('utf-8', errors='replace') if blob is not None else None
+            for original, blob in zip(file_paths, blobs)
+        }
+    
+    def read_file(self, file_path, revision="HEAD"):
+        """Lê o conteúdo de um arquivo em uma revisão (equivalente a 'git show rev:path')"""
+        return self.read_files([file_path], revision).get(file_path)
+    
+    def _status_signature(self):
+        """Assinatura barata (mtime do índice e do HEAD) para detectar mudanças no repositório"""
+        signature = []
+        for name in ("index", "HEAD"):
+            try:
+                signature.append(os.stat(os.path.join(self.working_dir, '.git', name)).st_mtime_ns)
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+    
+    def _store_status_snapshot(self, snapshot):
+        """Guarda um snapshot recém-obtido como cache de status"""
+        self.last_status_snapshot = snapshot
+        self._status_cache_signature = self._status_signature()
+        self._status_cache_time = time.monotonic()
+        self._status_cache_valid = True
+        return snapshot
+    
+    def _status_cache_fresh(self):
+        """Indica se o snapshot em cache ainda pode ser reutilizado"""
+        return (
+            self._status_cache_valid
+            and self.last_status_snapshot is not None
+            and time.monotonic() - self._status_cache_time < self.status_cache_ttl
+            and self._status_signature() == self._status_cache_signature
+        )
+    
+    def invalidate_status(self):
+        """Descarta o snapshot de status em cache
+        
+        Deve ser chamado após commit, checkout, sincronização ou mudança
+        detectada no sistema de arquivos.
+        """
+        self._status_cache_valid = False
+    
+    def get_status_snapshot(self, paths=None):
+        """Obtém o status do repositório com uma única execução do git
+        
+        Com `paths`, apenas esses arquivos/diretórios são verificados e o
+        snapshot parcial não substitui o cache de status.
+        """
+        if not self.repo:
+            return None
+        
+        if paths:
+            return self.get_backend().status_snapshot(paths)
+        return self._store_status_snapshot(self.get_backend().status_snapshot())
+    
+    def get_cached_status_snapshot(self, paths=None):
+        """Retorna o snapshot em cache se ainda válido, senão obtém um novo
+        
+        Se algum dos caminhos informados não aparecer no snapshot (arquivo
+        criado depois dele), o status é obtido novamente.
+        """
+        if self._status_cache_fresh():
+            snapshot = self.last_status_snapshot
+            if not paths or all(snapshot.contains(p) for p in paths):
+                return snapshot
+        return self.get_status_snapshot()
+    
+    def get_status(self, snapshot=None):
         """Obtém o status do repositório"""
         if not self.repo:
             return {
@@ -64,24 +262,7 @@ class GitManager:
             }
         
         try:
-            branch = "Detached" if self.repo.head.is_detached else self.repo.active_branch.name
-            status = "Clean" if not self.repo.is_dirty() else "Modified"
-            
-            # Contar arquivos modificados
-            modified_count = 0
-            untracked_count = len(self.repo.untracked_files)
-            
-            for item in self.repo.index.diff(None):
-                modified_count += 1
-            
-            return {
-                "valid": True,
-                "branch": branch,
-                "status": status,
-                "modified_count": modified_count,
-                "untracked_count": untracked_count,
-                "message": f"Branch: {branch}, {status}"
-            }
+            return (snapshot or self.get_status_snapshot()).to_status()
             
         except Exception as e:
             return {
@@ -89,45 +270,43 @@ class GitManager:
                 "message": f"Error: {str(e)}"
             }
     
-    def get_modified_files(self):
-        """Obtém lista de arquivos modificados e não rastreados"""
-        modified_files = []
+    def get_modified_files(self, snapshot=None, paths=None):
+        """Obtém lista de arquivos modificados e não rastreados
         
+        `paths` restringe a verificação a caminhos já conhecidos como
+        alterados (ex.: informados pelo watcher de arquivos).
+        """
         if not self.repo:
-            return modified_files
+            return []
         
         try:
-            # Arquivos modificados e excluídos (rastreados)
-            for item in self.repo.index.diff(None):
-                change_type = item.change_type  # A, D, M, R
-                modified_files.append({
-                    "path": item.a_path,
-                    "type": change_type,
-                    "tracked": True
-                })
-            
-            # Arquivos não rastreados
-            for item in self.repo.untracked_files:
-                modified_files.append({
-                    "path": item,
-                    "type": "?",
-                    "tracked": False
-                })
-            
-            return modified_files
+            return (snapshot or self.get_status_snapshot(paths)).to_modified_files()
             
         except Exception as e:
             self.logger.log(f"Error getting modified files: {str(e)}", "ERROR")
             return []
 
-    def get_diff(self, file_path):
+    def get_tree_diff(self, old_revision, new_revision="HEAD"):
+        """Lista as alterações entre duas revisões ({"status", "path", "old_path"})"""
+        if not self.repo:
+            return []
+        
+        try:
+            return self.get_backend().diff_tree(old_revision, new_revision)
+        except Exception as e:
+            self.logger.log(f"Error comparing {old_revision} and {new_revision}: {str(e)}", "ERROR")
+            return []
+    
+    def get_diff(self, file_path, snapshot=None):
         """Obtém diferenças de um arquivo"""
         if not self.repo:
             return None
         
         try:
+            snapshot = snapshot or self.get_cached_status_snapshot([file_path])
+            
             # Verificar se o arquivo é rastreado ou não
-            if file_path in self.repo.untracked_files:
+            if file_path in snapshot.untracked_set:
                 # Arquivo não rastreado - ler conteúdo completo
                 with open(os.path.join(self.working_dir, file_path), 'r', encoding='utf-8', errors='replace') as f:
                     content = f.read()
@@ -148,33 +327,265 @@ class GitManager:
             self.logger.log(f"Error getting diff for {file_path}: {str(e)}", "ERROR")
             return None
     
+    def get_diffs(self, file_paths):
+        """Obtém diferenças de vários arquivos reutilizando um único snapshot de status
+        
+        Retorna um dicionário caminho -> dados do diff (None em caso de erro).
+        """
+        if not self.repo:
+            return {}
+        
+        try:
+            snapshot = self.get_cached_status_snapshot(file_paths)
+        except Exception as e:
+            self.logger.log(f"Error getting Git status: {str(e)}", "ERROR")
+            return {path: None for path in file_paths}
+        
+        return {path: self.get_diff(path, snapshot) for path in file_paths}
+    
+    def _run_pathspec_batch(self, args, paths):
+        """Executa um comando git recebendo os caminhos via --pathspec-from-file pelo stdin
+        
+        Gits anteriores à 2.26 não conhecem a opção; nesse caso os caminhos
+        são passados na linha de comando em blocos.
+        """
+        payload = b''.join(p.encode('utf-8') + b'\0' for p in paths)
+        cmd = ["git"] + args + ["--pathspec-from-file=-", "--pathspec-file-nul"]
+        result = run_command(cmd, cwd=self.working_dir, timeout=self.command_timeout,
+                             token=self.cancel_token, text=False, input=payload)
+        stderr = result.stderr.decode('utf-8', errors='replace').strip()
+        
+        if result.returncode != 0 and "pathspec-from-file" in stderr:
+            for start in range(0, len(paths), PATHSPEC_CHUNK_SIZE):
+                chunk = paths[start:start + PATHSPEC_CHUNK_SIZE]
+                result = run_command(["git"] + args + ["--"] + chunk, cwd=self.working_dir,
+                                     timeout=self.command_timeout, token=self.cancel_token)
+                if result.returncode != 0:
+                    raise GitCommandError(["git"] + args, result.returncode, result.stderr.strip())
+            return
+        
+        if result.returncode != 0:
+            raise GitCommandError(cmd, result.returncode, stderr)
+    
+    def _git(self, args, input=None, env=None, cancellable=True):
+        """Executa um comando git ligado ao token de cancelamento e retorna o stdout
+        
+        Lança GitCommandError em caso de falha.
+        """
+        cmd = ["git"] + list(args)
+        result = run_command(cmd, cwd=self.working_dir, timeout=self.command_timeout,
+                             token=self.cancel_token if cancellable else None, input=input, env=env)
+        if result.returncode != 0:
+            raise GitCommandError(cmd, result.returncode, result.stderr.strip())
+        return result.stdout
+    
+    def _run_remote(self, args, progress):
+        """Executa um fetch/push ligado ao token de cancelamento, repassando o progresso
+        
+        O processo roda em um grupo próprio, então cancelamento e timeout
+        encerram também os auxiliares (git-remote-https, ssh). Retorna as
+        linhas de saída que não são de progresso; lança GitCommandError em
+        caso de falha.
+        """
+        cmd = ["git"] + list(args)
+        process, timer = start_process(cmd, cwd=self.working_dir, token=self.cancel_token,
+                                       timeout=self.command_timeout, stdin=subprocess.DEVNULL,
+                                       stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        handler = progress.new_message_handler()
+        try:
+            for line in iter_progress_lines(process.stderr):
+                handler(line)
+        finally:
+            process.stderr.close()
+            returncode = process.wait()
+        
+        finish_process(process, timer, self.cancel_token, cmd, self.command_timeout)
+        if returncode != 0:
+            raise GitCommandError(cmd, returncode, "\n".join(progress.other_lines + progress.error_lines))
+        return progress.other_lines
+    
+    def stash(self, *args):
+        """Executa 'git stash' com os argumentos indicados e retorna a saída
+        
+        'stash pop' não é interrompido pelo cancelamento, para que as
+        alterações locais não fiquem presas no stash.
+        """
+        try:
+            return self._git(["stash"] + list(args), cancellable=args[:1] != ("pop",)).strip()
+        finally:
+            self.invalidate_status()
+    
+    def push(self, remote_name="origin"):
+        """Envia a branch atual ao remoto (lança GitCommandError em caso de falha)"""
+        reporter = ProgressReporter("Git push", self.logger, self.progress_listeners)
+        self._run_remote(["push", "--progress", remote_name], FetchProgress(reporter))
+        reporter.finish(True)
+    
+    def stage_files(self, files):
+        """Adiciona arquivos ao índice em lote
+        
+        Arquivos existentes vão em um único 'git add'; arquivos removidos do
+        disco saem do índice com um único 'git rm --cached'. O tempo gasto
+        fica em last_stage_stats.
+        """
+        started = time.monotonic()
+        paths = [p.replace(os.sep, '/') for p in files]
+        removed = [p for p in paths if not os.path.lexists(os.path.join(self.working_dir, p))]
+        removed_set = set(removed)
+        added = [p for p in paths if p not in removed_set]
+        
+        if added:
+            self._run_pathspec_batch(["add"], added)
+        if removed:
+            self._run_pathspec_batch(["rm", "--cached", "--quiet", "--ignore-unmatch", "-r"], removed)
+        
+        elapsed = time.monotonic() - started
+        self.last_stage_stats = {"added": len(added), "removed": len(removed), "seconds": elapsed}
+        self.logger.log(f"Staged {len(added)} files and {len(removed)} removals in {elapsed:.2f}s")
+        return self.last_stage_stats
+    
     def commit(self, files, message, author=None):
         """Realiza commit de arquivos"""
         if not self.repo:
             return False, "Not a Git repository"
         
         try:
-            # Adicionar arquivos selecionados
-            for file_path in files:
-                self.repo.git.add(file_path)
+            # Adicionar arquivos selecionados (um único processo git para todo o lote)
+            self.stage_files(files)
             
-            # Configurar autor se fornecido
-            if author:
-                commit = self.repo.index.commit(message, author=author)
-            else:
-                commit = self.repo.index.commit(message)
+            # Identidade resolvida como no GitPython (variáveis de ambiente, config
+            # ou usuário@host), para não falhar sem user.name configurado
+            reader = self.repo.config_reader()
+            author = author or Actor.author(reader)
+            committer = Actor.committer(reader)
+            env = dict(os.environ,
+                       GIT_AUTHOR_NAME=author.name, GIT_AUTHOR_EMAIL=author.email,
+                       GIT_COMMITTER_NAME=committer.name, GIT_COMMITTER_EMAIL=committer.email)
+            
+            # Como o commit direto no índice: sem hooks, mensagem literal e mesmo sem alterações
+            self._git(["commit", "--quiet", "--no-verify", "--allow-empty", "--cleanup=verbatim", "-F", "-"],
+                      input=message, env=env)
+            hexsha = self._git(["rev-parse", "HEAD"]).strip()
             
             self.logger.log(f"Committed {len(files)} files with message: {message}", "SUCCESS")
-            self.logger.log(f"Commit hash: {commit.hexsha}")
+            self.logger.log(f"Commit hash: {hexsha}")
             
-            return True, commit.hexsha
+            return True, hexsha
             
         except Exception as e:
             self.logger.log(f"Error committing files: {str(e)}", "ERROR")
             return False, str(e)
+        finally:
+            self.invalidate_status()
+    
+    def set_fetch_options(self, options=None):
+        """Define a estratégia de fetch (chaves de DEFAULT_FETCH_OPTIONS)"""
+        self.fetch_options = dict(DEFAULT_FETCH_OPTIONS)
+        self.fetch_options.update({k: v for k, v in (options or {}).items() if k in DEFAULT_FETCH_OPTIONS})
+    
+    def _is_shallow_or_empty(self):
+        """Indica se o repositório é raso ou ainda não tem commits"""
+        if os.path.exists(os.path.join(self.working_dir, '.git', 'shallow')):
+            return True
+        try:
+            self.repo.head.commit
+            return False
+        except ValueError:
+            return True
+    
+    def _ensure_partial_clone(self, remote_name, blob_filter):
+        """Configura o remote como promissor para permitir fetch com --filter"""
+        try:
+            if self.repo.git.config("--get", f"remote.{remote_name}.partialclonefilter") == blob_filter:
+                return
+        except GitCommandError:
+            pass  # Chave ausente
+        
+        self.repo.git.config("core.repositoryformatversion", "1")
+        self.repo.git.config("extensions.partialClone", remote_name)
+        self.repo.git.config(f"remote.{remote_name}.promisor", "true")
+        self.repo.git.config(f"remote.{remote_name}.partialclonefilter", blob_filter)
+        self.logger.log(f"Enabled partial clone ({blob_filter}) for remote '{remote_name}'")
+    
+    def _fetch_arguments(self, remote_name, remote_branch):
+        """Monta os argumentos do 'git fetch' conforme a estratégia configurada"""
+        options = self.fetch_options
+        args = []
+        
+        if options.get("prune"):
+            args.append("--prune")
+        if not options.get("tags", True):
+            args.append("--no-tags")
+        
+        # Aprofundar com --depth em um repositório completo o tornaria raso
+        if options.get("depth") and self._is_shallow_or_empty():
+            args.append(f"--depth={int(options['depth'])}")
+        
+        if options.get("filter"):
+            self._ensure_partial_clone(remote_name, options["filter"])
+            args.append(f"--filter={options['filter']}")
+        
+        args.append(remote_name)
+        if options.get("scope") == "current_branch" and remote_branch:
+            args.append(f"+refs/heads/{remote_branch}:refs/remotes/{remote_name}/{remote_branch}")
+        return args
+    
+    def _remote_branch_for(self, remote_name, branch_name):
+        """Determina a branch remota que corresponde à branch local"""
+        if branch_name:
+            return branch_name
+        
+        table = self.get_branch_table()
+        branch = table.local.get(table.current) if table.current else None
+        if not branch:
+            return None
+        if branch.upstream and branch.upstream.startswith(f"{remote_name}/"):
+            return branch.upstream[len(remote_name) + 1:]
+        return branch.name
+    
+    def get_remote_tip(self, remote_name="origin", branch_name=None):
+        """Obtém o SHA da branch no remoto com 'git ls-remote' (sem transferir objetos)
+        
+        Retorna None se a branch não existir no remoto.
+        """
+        if not self.repo:
+            return None
+        
+        remote_branch = self._remote_branch_for(remote_name, branch_name)
+        if not remote_branch:
+            return None
+        
+        result = run_command(["git", "ls-remote", remote_name, f"refs/heads/{remote_branch}"],
+                             cwd=self.working_dir, timeout=self.command_timeout, token=self.cancel_token)
+        if result.returncode != 0:
+            raise GitCommandError(["git", "ls-remote", remote_name], result.returncode, result.stderr.strip())
+        
+        line = result.stdout.strip()
+        return line.split()[0] if line else None
+    
+    def count_commits(self, old_revision, new_revision):
+        """Número de commits em new_revision que não estão em old_revision
+        
+        Retorna None se alguma das revisões não estiver disponível localmente.
+        """
+        if not self.repo:
+            return None
+        result = run_command(["git", "rev-list", "--count", f"{old_revision}..{new_revision}"],
+                             cwd=self.working_dir, timeout=self.command_timeout, token=self.cancel_token)
+        if result.returncode != 0:
+            return None
+        try:
+            return int(result.stdout.strip())
+        except ValueError:
+            return None
     
     def sync_with_remote(self, remote_name="origin", branch_name=None):
-        """Sincroniza com o repositório remoto (fetch, pull)"""
+        """Sincroniza com o repositório remoto
+        
+        Um único fetch (com a estratégia configurada) traz os objetos; o merge
+        é feito localmente a partir da referência remota, sem um segundo
+        acesso à rede como no pull.
+        """
         if not self.repo:
             return False, "Not a Git repository"
         
@@ -183,34 +594,66 @@ class GitManager:
             if remote_name not in [r.name for r in self.repo.remotes]:
                 return False, f"Remote '{remote_name}' not found"
             
-            remote = self.repo.remotes[remote_name]
+            if self.cancel_token:
+                self.cancel_token.raise_if_cancelled()
             
-            # Fetch
-            self.logger.log(f"Fetching from {remote_name}...")
-            fetch_info = remote.fetch()
-            self.logger.log(f"Fetch completed: {len(fetch_info)} refs updated")
+            detached = self.repo.head.is_detached
+            remote_branch = None if detached else self._remote_branch_for(remote_name, branch_name)
+            fetch_args = self._fetch_arguments(remote_name, remote_branch)
             
-            # Pull (se branch_name for None, usa a branch atual)
-            if not self.repo.head.is_detached:
-                current_branch = branch_name or self.repo.active_branch.name
-                self.logger.log(f"Pulling from {remote_name}/{current_branch}...")
+            # Fetch (encerrado com os processos filhos em caso de timeout ou cancelamento)
+            scoped = fetch_args[-1] != remote_name
+            self.logger.log(f"Fetching from {remote_name}{f'/{remote_branch}' if scoped else ''}...")
+            reporter = ProgressReporter("Git fetch", self.logger, self.progress_listeners)
+            output = self._run_remote(["fetch", "--progress"] + fetch_args, FetchProgress(reporter))
+            refs = sum(1 for line in output if " -> " in line)
+            event = reporter.finish(True)
+            self.last_fetch_stats = {"bytes": reporter.bytes, "refs": refs, "seconds": event["elapsed"]}
+            self.logger.log(
+                f"Fetch completed: {refs} refs updated, {reporter.bytes} bytes received "
+                f"in {event['elapsed']:.1f}s"
+            )
+            
+            # Merge local da referência remota (se a branch não estiver destacada)
+            if self.cancel_token:
+                self.cancel_token.raise_if_cancelled()
+            
+            if not detached and remote_branch:
+                tracking_ref = f"{remote_name}/{remote_branch}"
+                table = self.get_branch_table()
+                if tracking_ref not in table.remote:
+                    self.logger.log(f"Remote branch '{tracking_ref}' not found, nothing to merge", "WARNING")
+                    return True, "Synchronization completed successfully"
+                
+                # Nada a integrar se a branch já contém a referência remota
+                local = table.local.get(table.current)
+                if local and local.upstream == tracking_ref and local.behind == 0:
+                    self.logger.log(f"Already up to date with {tracking_ref}")
+                    return True, "Synchronization completed successfully"
+                
+                self.logger.log(f"Merging {tracking_ref}...")
                 
                 # Verificar e stash mudanças locais se necessário
                 if self.repo.is_dirty():
                     self.logger.log("Stashing local changes...")
-                    self.repo.git.stash()
+                    self.stash()
                     stashed = True
                 else:
                     stashed = False
                 
-                # Pull
-                pull_info = remote.pull()
-                self.logger.log(f"Pull completed")
+                try:
+                    self._git(["merge", tracking_ref])
+                except Exception:
+                    # Não deixar alterações locais presas no stash se o merge falhar
+                    if stashed:
+                        self.stash('pop')
+                    raise
+                self.logger.log(f"Merge completed")
                 
                 # Recuperar stash se necessário
-                if stashed and self.repo.git.stash('list'):
+                if stashed and self.stash('list'):
                     self.logger.log("Applying stashed changes...")
-                    self.repo.git.stash('pop')
+                    self.stash('pop')
                     self.logger.log("Stashed changes applied")
                 
             return True, "Synchronization completed successfully"
@@ -218,6 +661,24 @@ class GitManager:
         except Exception as e:
             self.logger.log(f"Error syncing with remote: {str(e)}", "ERROR")
             return False, str(e)
+        finally:
+            self.invalidate_status()
+    
+    def get_branch_table(self, refresh=False):
+        """Obtém a tabela de branches (nome, upstream, ahead/behind, tip, data)
+        
+        A tabela vem de um único 'git for-each-ref' e é reutilizada até que
+        packed-refs, HEAD ou algum diretório em refs/ mude.
+        """
+        if not self.repo:
+            return GitBranchTable()
+        
+        signature = refs_signature(os.path.join(self.working_dir, '.git'))
+        if refresh or self._branch_table is None or signature != self._branch_table_signature:
+            self._branch_table = self.get_backend().list_refs()
+            self._branch_table_signature = signature
+        
+        return self._branch_table
     
     def get_branches(self):
         """Obtém lista de branches locais e remotas"""
@@ -225,15 +686,19 @@ class GitManager:
             return [], []
         
         try:
-            local_branches = [b.name for b in self.repo.branches]
-            remote_branches = [b.name for b in self.repo.remote().refs]
-            
-            return local_branches, remote_branches
+            return self.get_branch_table().names()
             
         except Exception as e:
             self.logger.log(f"Error getting branches: {str(e)}", "ERROR")
             return [], []
     
+    def checkout(self, *args):
+        """Executa 'git checkout' e invalida o status em cache"""
+        try:
+            return self.repo.git.checkout(*args)
+        finally:
+            self.invalidate_status()
+    
     def create_branch(self, branch_name, checkout=True):
         """Cria uma nova branch"""
         if not self.repo:
@@ -241,7 +706,7 @@ class GitManager:
         
         try:
             # Verificar se a branch já existe
-            if branch_name in [b.name for b in self.repo.branches]:
+            if self.get_branch_table().has_local(branch_name):
                 return False, f"Branch '{branch_name}' already exists"
             
             # Criar branch
@@ -250,6 +715,7 @@ class GitManager:
             # Checkout se solicitado
             if checkout:
                 new_branch.checkout()
+                self.invalidate_status()
                 self.logger.log(f"Created and switched to branch '{branch_name}'", "SUCCESS")
             else:
                 self.logger.log(f"Created branch '{branch_name}'", "SUCCESS")
@@ -258,4 +724,90 @@ class GitManager:
             
         except Exception as e:
             self.logger.log(f"Error creating branch: {str(e)}", "ERROR")
-            return False, str(e)
\ No newline at end of file
+            return False, str(e)
+    
+    # Variantes assíncronas: devem ser agendadas no executor compartilhado
+    # (get_executor().submit/gather) para rodar concorrentemente no mesmo loop
+    
+    async def _run_git_async(self, args):
+        """Executa um comando git no executor assíncrono"""
+        return await get_executor().run(["git"] + list(args), cwd=self.working_dir)
+    
+    async def get_status_snapshot_async(self):
+        """Variante assíncrona de get_status_snapshot"""
+        if not self.is_git_repo():
+            return None
+        
+        returncode, stdout, stderr = await self._run_git_async(STATUS_COMMAND)
+        if returncode != 0:
+            raise RuntimeError(stderr.strip())
+        
+        return self._store_status_snapshot(GitStatusSnapshot.parse(stdout))
+    
+    async def get_status_async(self):
+        """Variante assíncrona de get_status"""
+        if not self.is_git_repo():
+            return {
+                "valid": False,
+                "message": "Not a Git repository"
+            }
+        
+        try:
+            return (await self.get_status_snapshot_async()).to_status()
+        except Exception as e:
+            return {
+                "valid": False,
+                "message": f"Error: {str(e)}"
+            }
+    
+    async def get_modified_files_async(self):
+        """Variante assíncrona de get_modified_files"""
+        if not self.is_git_repo():
+            return []
+        
+        try:
+            return (await self.get_status_snapshot_async()).to_modified_files()
+        except Exception as e:
+            self.logger.log(f"Error getting modified files: {str(e)}", "ERROR")
+            return []
+    
+    async def get_diff_async(self, file_path):
+        """Variante assíncrona de get_diff"""
+        if not self.is_git_repo():
+            return None
+        
+        try:
+            snapshot = self.last_status_snapshot
+            if not self._status_cache_fresh() or not snapshot.contains(file_path):
+                snapshot = await self.get_status_snapshot_async()
+            
+            if file_path in snapshot.untracked_set:
+                # Arquivo não rastreado - ler conteúdo completo
+                with open(os.path.join(self.working_dir, file_path), 'r', encoding='utf-8', errors='replace') as f:
+                    content = f.read()
+                return {
+                    "type": "new_file",
+                    "content": content,
+                    "diff": None
+                }
+            
+            returncode, stdout, stderr = await self._run_git_async(["diff", "--", file_path])
+            if returncode != 0:
+                self.logger.log(f"Error getting diff for {file_path}: {stderr.strip()}", "ERROR")
+                return None
+            return {
+                "type": "diff",
+                "content": None,
+                "diff": stdout
+            }
+        except Exception as e:
+            self.logger.log(f"Error getting diff for {file_path}: {str(e)}", "ERROR")
+            return None
+    
+    async def show_async(self, file_path, revision="HEAD"):
+        """Obtém o conteúdo de um arquivo em uma revisão (git show rev:path)"""
+        returncode, stdout, stderr = await self._run_git_async(["show", f"{revision}:{file_path}"])
+        if returncode != 0:
+            self.logger.log(f"Error getting Git content for {file_path}: {stderr.strip()}", "ERROR")
+            return None
+        return stdout
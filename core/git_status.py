@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+STATUS_COMMAND = ["status", "--porcelain=v2", "-z", "--branch", "--untracked-files=all"]
+
+class GitStatusSnapshot:
+    """Retrato do status de um repositório obtido com uma única execução de
+    'git status --porcelain=v2 -z --branch'
+
+    Substitui as consultas separadas (is_dirty, untracked_files, index.diff)
+    que percorriam a árvore de trabalho várias vezes.
+    """
+
+    def __init__(self):
+        """Inicializa um snapshot vazio"""
+        self.branch = None
+        self.oid = None
+        self.upstream = None
+        self.ahead = 0
+        self.behind = 0
+        self.staged = []       # (caminho, código) - alterações no índice
+        self.unstaged = []     # (caminho, código) - alterações na árvore de trabalho
+        self.untracked = []
+        self.renames = []      # (caminho original, caminho novo)
+        self.conflicts = []
+
+    @classmethod
+    def parse(cls, output):
+        """Converte a saída de 'git status --porcelain=v2 -z --branch'"""
+        snapshot = cls()
+        records = output.split('\0')
+        i = 0
+        while i < len(records):
+            record = records[i]
+            i += 1
+            if not record:
+                continue
+
+            kind = record[0]
+            if kind == '#':
+                snapshot._parse_header(record)
+            elif kind == '1':
+                fields = record.split(' ', 8)
+                snapshot._add_change(fields[1], fields[8])
+            elif kind == '2':
+                fields = record.split(' ', 9)
+                # Com -z o caminho de origem vem no registro seguinte
+                original = records[i] if i < len(records) else ""
+                i += 1
+                snapshot._add_change(fields[1], fields[9])
+                snapshot.renames.append((original, fields[9]))
+            elif kind == 'u':
+                fields = record.split(' ', 10)
+                snapshot.conflicts.append(fields[10])
+            elif kind == '?':
+                snapshot.untracked.append(record[2:])
+
+        return snapshot
+
+    def _parse_header(self, record):
+        """Interpreta as linhas de cabeçalho '# branch.*'"""
+        parts = record.split(' ')
+        if len(parts) < 3:
+            return
+
+        key, value = parts[1], ' '.join(parts[2:])
+        if key == "branch.oid":
+            self.oid = None if value == "(initial)" else value
+        elif key == "branch.head":
+            self.branch = "Detached" if value == "(detached)" else value
+        elif key == "branch.upstream":
+            self.upstream = value
+        elif key == "branch.ab":
+            ahead, behind = value.split(' ')
+            self.ahead = int(ahead.lstrip('+'))
+            self.behind = int(behind.lstrip('-'))
+
+    def _add_change(self, xy, path):
+        """Classifica uma entrada alterada como staged e/ou unstaged"""
+        if xy[0] != '.':
+            self.staged.append((path, xy[0]))
+        if xy[1] != '.':
+            self.unstaged.append((path, xy[1]))
+
+    @property
+    def is_dirty(self):
+        """Indica alterações rastreadas (equivalente a repo.is_dirty())"""
+        return bool(self.staged or self.unstaged or self.conflicts)
+
+    @property
+    def untracked_set(self):
+        """Conjunto de arquivos não rastreados para consultas O(1)"""
+        if not hasattr(self, "_untracked_set"):
+            self._untracked_set = set(self.untracked)
+        return self._untracked_set
+
+    def contains(self, path):
+        """Indica se o caminho aparece no snapshot (alterado, em conflito ou não rastreado)"""
+        if not hasattr(self, "_paths"):
+            self._paths = set(self.untracked)
+            self._paths.update(p for p, _ in self.staged)
+            self._paths.update(p for p, _ in self.unstaged)
+            self._paths.update(self.conflicts)
+        return path in self._paths
+
+    def to_status(self):
+        """Converte no dicionário retornado por GitManager.get_status"""
+        status = "Modified" if self.is_dirty else "Clean"
+        return {
+            "valid": True,
+            "branch": self.branch,
+            "status": status,
+            "modified_count": len(self.unstaged),
+            "untracked_count": len(self.untracked),
+            "staged_count": len(self.staged),
+            "conflict_count": len(self.conflicts),
+            "upstream": self.upstream,
+            "ahead": self.ahead,
+            "behind": self.behind,
+            "message": f"Branch: {self.branch}, {status}"
+        }
+
+    def to_modified_files(self):
+        """Converte na lista retornada por GitManager.get_modified_files"""
+        modified_files = [
+            {"path": path, "type": code, "tracked": True}
+            for path, code in self.unstaged
+        ]
+        modified_files.extend(
+            {"path": path, "type": "C", "tracked": True}
+            for path in self.conflicts
+        )
+        modified_files.extend(
+            {"path": path, "type": "?", "tracked": False}
+            for path in self.untracked
+        )
+        return modified_files
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import time
+from datetime import datetime
+
+from core.cancellation import run_command
+
+# Tarefas no estilo 'git maintenance', na ordem em que são executadas
+GIT_MAINTENANCE_TASKS = {
+    "commit-graph": [
+        ["commit-graph", "write", "--reachable", "--split"],
+    ],
+    "loose-objects": [
+        ["prune-packed", "--quiet"],
+        ["repack", "-d", "-l", "-q"],
+    ],
+    "incremental-repack": [
+        ["multi-pack-index", "write"],
+        ["multi-pack-index", "expire"],
+        ["multi-pack-index", "repack", "--batch-size={batch_size}"],
+    ],
+    "prune": [
+        ["prune", "--expire=2.weeks.ago"],
+    ],
+}
+
+DEFAULT_TASKS = ["commit-graph", "loose-objects", "incremental-repack", "prune"]
+
+class RepositoryMaintenance:
+    """Manutenção periódica dos repositórios sincronizados
+
+    Commits repetidos da sincronização acumulam objetos soltos e packs,
+    deixando status e fetch mais lentos. As tarefas Git (commit-graph,
+    empacotamento de objetos soltos, repack incremental via multi-pack-index
+    e prune) e o 'svn cleanup --vacuum-pristines' são executados sob
+    demanda, registrando a contagem de objetos antes e depois.
+    """
+
+    STATE_FILE = "svn_sync_maintenance.json"
+    HISTORY_SIZE = 20
+
+    def __init__(self, working_dir, svn_manager, logger):
+        """Inicializa a manutenção para uma cópia de trabalho"""
+        self.working_dir = working_dir
+        self.svn_manager = svn_manager
+        self.logger = logger
+        self.state_path = os.path.join(working_dir, '.git', self.STATE_FILE)
+        self.state = self._load()
+
+    def _load(self):
+        """Carrega o histórico de execuções"""
+        try:
+            if os.path.exists(self.state_path):
+                with open(self.state_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            self.logger.log(f"Error loading maintenance state: {str(e)}", "WARNING")
+        return {"last_run": None, "history": []}
+
+    def _save(self):
+        """Persiste o histórico de execuções"""
+        if not os.path.isdir(os.path.dirname(self.state_path)):
+            return
+        try:
+            tmp_path = self.state_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.state, f, indent=2)
+            os.replace(tmp_path, self.state_path)
+        except Exception as e:
+            self.logger.log(f"Error saving maintenance state: {str(e)}", "WARNING")
+
+    @property
+    def last_run(self):
+        """Momento da última execução (datetime) ou None"""
+        value = self.state.get("last_run")
+        return datetime.fromisoformat(value) if value else None
+
+    def is_due(self, interval_hours):
+        """Indica se já passou o intervalo desde a última execução"""
+        last_run = self.last_run
+        return last_run is None or (datetime.now() - last_run).total_seconds() >= interval_hours * 3600
+
+    def count_git_objects(self):
+        """Retorna as métricas de 'git count-objects -v' (contagens e tamanhos em KiB)"""
+        result = run_command(["git", "count-objects", "-v"], cwd=self.working_dir)
+        metrics = {}
+        if result.returncode != 0:
+            return metrics
+        for line in result.stdout.splitlines():
+            key, _, value = line.partition(':')
+            if value.strip().isdigit():
+                metrics[key.strip().replace('-', '_')] = int(value.strip())
+        return metrics
+
+    def _repack_batch_size(self):
+        """Tamanho de lote do repack incremental (como no 'git maintenance')
+
+        Usa o tamanho do segundo maior pack, de modo que os packs pequenos
+        sejam combinados sem reescrever o pack principal. Retorna None se
+        houver menos de dois packs.
+        """
+        pack_dir = os.path.join(self.working_dir, '.git', 'objects', 'pack')
+        try:
+            sizes = sorted(
+                (os.path.getsize(os.path.join(pack_dir, name))
+                 for name in os.listdir(pack_dir) if name.endswith(".pack")),
+                reverse=True
+            )
+        except OSError:
+            return None
+        if len(sizes) < 2:
+            return None
+        return sizes[1] + 1
+
+    def run(self, tasks=None, svn_vacuum=True, token=None, timeout=None):
+        """Executa as tarefas de manutenção e retorna o registro da execução"""
+        tasks = [t for t in (tasks or DEFAULT_TASKS) if t in GIT_MAINTENANCE_TASKS]
+        started = time.monotonic()
+        record = {
+            "started": datetime.now().isoformat(timespec='seconds'),
+            "before": self.count_git_objects(),
+            "tasks": {},
+            "errors": []
+        }
+
+        for task in tasks:
+            task_started = time.monotonic()
+            for args in GIT_MAINTENANCE_TASKS[task]:
+                if token:
+                    token.raise_if_cancelled()
+                if any("{batch_size}" in arg for arg in args):
+                    batch_size = self._repack_batch_size()
+                    if batch_size is None:
+                        continue
+                    args = [arg.format(batch_size=batch_size) for arg in args]
+                result = run_command(["git"] + args, cwd=self.working_dir, timeout=timeout, token=token)
+                if result.returncode != 0:
+                    error = f"git {' '.join(args)}: {result.stderr.strip()}"
+                    record["errors"].append(error)
+                    self.logger.log(f"Maintenance task '{task}' failed: {error}", "WARNING")
+                    break
+            record["tasks"][task] = round(time.monotonic() - task_started, 3)
+
+        if svn_vacuum and self.svn_manager and self.svn_manager.is_svn_repo():
+            if token:
+                token.raise_if_cancelled()
+            task_started = time.monotonic()
+            result = run_command(["svn", "cleanup", "--vacuum-pristines"], cwd=self.working_dir,
+                                 timeout=timeout, token=token)
+            if result.returncode != 0:
+                error = f"svn cleanup --vacuum-pristines: {result.stderr.strip()}"
+                record["errors"].append(error)
+                self.logger.log(f"Maintenance task 'svn-vacuum' failed: {error}", "WARNING")
+            record["tasks"]["svn-vacuum"] = round(time.monotonic() - task_started, 3)
+
+        record["after"] = self.count_git_objects()
+        record["duration"] = round(time.monotonic() - started, 3)
+
+        self.state["last_run"] = record["started"]
+        self.state["history"] = (self.state.get("history", []) + [record])[-self.HISTORY_SIZE:]
+        self._save()
+
+        self.logger.log(f"Repository maintenance finished in {record['duration']:.1f}s: {self.describe(record)}")
+        return record
+
+    @staticmethod
+    def describe(record):
+        """Resume a variação de objetos soltos e packs de uma execução"""
+        before, after = record.get("before", {}), record.get("after", {})
+        return (
+            f"loose objects {before.get('count', '?')} -> {after.get('count', '?')}, "
+            f"packs {before.get('packs', '?')} -> {after.get('packs', '?')}, "
+            f"pack size {before.get('size_pack', '?')} -> {after.get('size_pack', '?')} KiB"
+        )
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+import os
+import re
+import time
+import threading
+import subprocess
+
+from core.cancellation import start_process, finish_process
+
+# Linha de 'svn update'/'svn checkout': 4 colunas de status, espaço e caminho
+SVN_UPDATE_LINE = re.compile(r'^([ADUCGER ])([ UCG])([ B])([ C]) (.+)$')
+
+# Tamanho recebido nas mensagens de progresso do Git ("1.20 MiB | 512.00 KiB/s")
+GIT_BYTES = re.compile(r'([\d.]+)\s*(bytes|KiB|MiB|GiB)\b')
+BYTE_UNITS = {"bytes": 1, "KiB": 1024, "MiB": 1024 ** 2, "GiB": 1024 ** 3}
+
+class ProgressReporter:
+    """Calcula taxa e ETA de uma operação e distribui eventos de progresso
+
+    Os eventos são dicionários enviados aos listeners (no máximo a cada
+    `emit_interval` segundos) e resumidos no log a cada `log_interval`
+    segundos, sem acumular a saída do processo em memória.
+    """
+
+    def __init__(self, operation, logger=None, listeners=None, total=None,
+                 emit_interval=0.2, log_interval=5.0):
+        """Inicializa o reporter de progresso"""
+        self.operation = operation
+        self.logger = logger
+        self.listeners = list(listeners or [])
+        self.total = total
+        self.emit_interval = emit_interval
+        self.log_interval = log_interval
+
+        self.files = 0
+        self.bytes = 0
+        self.stage = None
+        self.message = ""
+        self.started = time.monotonic()
+        self._last_emit = 0.0
+        self._last_log = self.started
+
+    def update(self, files=0, bytes=0, current=None, total=None, stage=None, message=None):
+        """Registra progresso incremental (files/bytes) ou absoluto (current/total)"""
+        self.files = current if current is not None else self.files + files
+        self.bytes += bytes
+        if total:
+            self.total = total
+        if stage is not None:
+            self.stage = stage
+        if message is not None:
+            self.message = message
+
+        now = time.monotonic()
+        if now - self._last_emit >= self.emit_interval:
+            self._last_emit = now
+            self._emit(self.snapshot(now))
+
+        if self.logger and now - self._last_log >= self.log_interval:
+            self._last_log = now
+            self.logger.log(self.describe(self.snapshot(now)))
+
+    def snapshot(self, now=None):
+        """Retorna o estado atual como evento de progresso"""
+        elapsed = (now or time.monotonic()) - self.started
+        rate = self.files / elapsed if elapsed > 0 else 0.0
+        eta = None
+        if self.total and rate > 0 and self.files < self.total:
+            eta = (self.total - self.files) / rate
+
+        return {
+            "operation": self.operation,
+            "stage": self.stage,
+            "files": self.files,
+            "total": self.total,
+            "bytes": self.bytes,
+            "rate": rate,
+            "bytes_rate": self.bytes / elapsed if elapsed > 0 else 0.0,
+            "eta": eta,
+            "elapsed": elapsed,
+            "message": self.message,
+            "done": False
+        }
+
+    def finish(self, success=True, message=None):
+        """Emite o evento final da operação"""
+        event = self.snapshot()
+        event["done"] = True
+        event["success"] = success
+        if message is not None:
+            event["message"] = message
+        self._emit(event)
+        return event
+
+    @staticmethod
+    def describe(event):
+        """Formata um evento de progresso para exibição"""
+        text = f"{event['operation']}: {event['files']}"
+        if event.get("total"):
+            text += f"/{event['total']}"
+        text += " items"
+        if event.get("bytes"):
+            text += f", {event['bytes'] / 1024 / 1024:.1f} MiB ({event['bytes_rate'] / 1024:.0f} KiB/s)"
+        if event.get("eta") is not None:
+            text += f", ETA {int(event['eta'])}s"
+        return text
+
+    def _emit(self, event):
+        """Envia o evento para os listeners registrados"""
+        for listener in self.listeners:
+            try:
+                listener(event)
+            except Exception:
+                pass
+
+def run_streaming(cmd, cwd, reporter, on_line=None, token=None, timeout=None):
+    """Executa um comando lendo stdout linha a linha, sem acumular a saída
+
+    Retorna (returncode, última linha não vazia, stderr). Timeout e
+    cancelamento encerram o grupo de processos e lançam exceção.
+    """
+    process, timer = start_process(
+        cmd,
+        cwd=cwd,
+        token=token,
+        timeout=timeout,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding='utf-8',
+        errors='replace',
+        bufsize=1
+    )
+
+    # Drenar stderr em paralelo para evitar deadlock com pipes cheios
+    stderr_lines = []
+    stderr_thread = threading.Thread(target=lambda: stderr_lines.extend(process.stderr), daemon=True)
+    stderr_thread.start()
+
+    last_line = ""
+    for line in process.stdout:
+        line = line.rstrip('\r\n')
+        if not line.strip():
+            continue
+        last_line = line
+        if on_line:
+            on_line(line)
+        else:
+            reporter.update(message=line)
+
+    returncode = process.wait()
+    stderr_thread.join()
+    process.stdout.close()
+    process.stderr.close()
+    finish_process(process, timer, token, cmd, timeout)
+    return returncode, last_line, ''.join(stderr_lines)
+
+def svn_update_line_handler(reporter, base_dir):
+    """Cria um handler que conta arquivos e bytes a partir das linhas do 'svn update'"""
+    def handle(line):
+        match = SVN_UPDATE_LINE.match(line)
+        if not match:
+            reporter.update(message=line)
+            return
+
+        path = match.group(5).strip()
+        size = 0
+        if match.group(1) in "AUGR":
+            try:
+                size = os.path.getsize(os.path.join(base_dir, path))
+            except OSError:
+                size = 0
+        reporter.update(files=1, bytes=size, message=path)
+
+    return handle
+
+def parse_git_progress_bytes(message):
+    """Extrai a quantidade de bytes recebidos de uma mensagem de progresso do Git"""
+    match = GIT_BYTES.search(message or "")
+    if not match:
+        return None
+    return int(float(match.group(1)) * BYTE_UNITS[match.group(2)])
+
+def iter_progress_lines(stream):
+    """Itera sobre as linhas de um stream binário separadas por \\r ou \\n
+
+    O Git reescreve as linhas de progresso com \\r; cada atualização vira
+    uma linha.
+    """
+    buffer = b""
+    for chunk in iter(lambda: stream.read1(8192), b""):
+        buffer += chunk
+        parts = re.split(rb'[\r\n]', buffer)
+        buffer = parts.pop()
+        for part in parts:
+            if part.strip():
+                yield part.decode('utf-8', errors='replace')
+    if buffer.strip():
+        yield buffer.decode('utf-8', errors='replace')
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+import re
+import time
+import random
+import threading
+from urllib.parse import urlsplit
+
+# Mensagens de erros de rede transitórios (git, svn e sistema operacional)
+TRANSIENT_ERRORS = re.compile(
+    r"could not resolve host|temporary failure in name resolution|connection (timed out|refused|reset)"
+    r"|operation timed out|timed out|network is unreachable|no route to host"
+    r"|the remote end hung up unexpectedly|early eof|rpc failed|unexpected disconnect"
+    r"|gnutls|ssl_read|ssl_connect|502 bad gateway|503 service unavailable|504 gateway"
+    r"|E170013|E175002|E175012|E731001|E000110|E000111|E000113|E120108|E120171",
+    re.IGNORECASE
+)
+
+def is_transient_error(message):
+    """Indica se uma mensagem de erro descreve uma falha de rede transitória"""
+    return bool(message) and TRANSIENT_ERRORS.search(str(message)) is not None
+
+def remote_key(kind, url):
+    """Chave do circuit breaker de um remoto: tipo e host (ex.: 'svn:svn.example.com')
+
+    Aceita URLs completas e a forma scp do Git ('git@host:caminho').
+    """
+    if not url:
+        return None
+    host = urlsplit(url).hostname
+    if not host and ':' in url:
+        host = url.split(':', 1)[0].rsplit('@', 1)[-1]
+    return f"{kind}:{host or url}"
+
+class RetryPolicy:
+    """Política de novas tentativas com backoff exponencial e jitter
+
+    A espera antes da tentativa n (a partir de 1) é base_delay * 2^(n-1),
+    limitada a max_delay, multiplicada por um fator aleatório em
+    [1 - jitter, 1 + jitter] para que repositórios que falharam juntos não
+    tentem de novo no mesmo instante.
+    """
+
+    def __init__(self, max_attempts=3, base_delay=2.0, max_delay=60.0, jitter=0.5):
+        """Inicializa a política"""
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    @classmethod
+    def from_config(cls, config):
+        """Cria a política a partir da seção 'retry' da configuração"""
+        return cls(
+            max_attempts=config.get("retry.max_attempts", 3),
+            base_delay=config.get("retry.base_delay_seconds", 2.0),
+            max_delay=config.get("retry.max_delay_seconds", 60.0),
+            jitter=config.get("retry.jitter", 0.5)
+        )
+
+    def delay(self, attempt):
+        """Espera em segundos antes da nova tentativa após a falha `attempt`"""
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return delay * (1 + random.uniform(-self.jitter, self.jitter))
+
+class CircuitBreaker:
+    """Circuit breaker de um remoto, compartilhado por todos os repositórios que o usam
+
+    Após `failure_threshold` falhas transitórias seguidas, o circuito abre
+    e nenhuma operação de rede é tentada por `reset_timeout` segundos.
+    Depois disso, uma única tentativa de teste é liberada (meio-aberto): se
+    funcionar o circuito fecha, se falhar abre de novo.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, key, failure_threshold=3, reset_timeout=300.0):
+        """Inicializa o circuito fechado"""
+        self.key = key
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        """Estado atual: closed, open ou half-open"""
+        with self._lock:
+            return self._state()
+
+    def _state(self):
+        """Estado atual (chamado com o lock adquirido)"""
+        if self.opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def retry_after(self):
+        """Segundos até o circuito liberar uma tentativa de teste (0 se não estiver aberto)"""
+        with self._lock:
+            if self.opened_at is None:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def is_blocking(self):
+        """Indica se novas operações serão recusadas agora (aberto, ou teste em andamento)"""
+        with self._lock:
+            state = self._state()
+            return state == self.OPEN or (state == self.HALF_OPEN and self._trial)
+
+    def allow(self):
+        """Indica se uma operação pode ser tentada agora
+
+        No estado meio-aberto apenas o primeiro solicitante recebe True,
+        até que o resultado da tentativa de teste seja registrado.
+        """
+        with self._lock:
+            state = self._state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial:
+                self._trial = True
+                return True
+            return False
+
+    def record_success(self):
+        """Registra sucesso: fecha o circuito"""
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial = False
+
+    def record_failure(self):
+        """Registra uma falha transitória; retorna True se o circuito abriu agora"""
+        with self._lock:
+            self.failures += 1
+            was_trial = self._trial
+            self._trial = False
+            if was_trial or (self.opened_at is None and self.failures >= self.failure_threshold):
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+    def release(self):
+        """Libera uma tentativa de teste que terminou sem falha de rede"""
+        with self._lock:
+            self._trial = False
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+def get_breaker(key, config=None):
+    """Retorna o circuit breaker compartilhado de um remoto, criando-o sob demanda"""
+    with _breakers_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = _breakers[key] = CircuitBreaker(
+                key,
+                failure_threshold=config.get("circuit_breaker.failure_threshold", 3) if config else 3,
+                reset_timeout=config.get("circuit_breaker.reset_seconds", 300) if config else 300
+            )
+        return breaker
+
+def run_with_retry(operation, description, logger, policy, breaker=None, token=None):
+    """Executa uma operação de rede que retorna (sucesso, mensagem) com novas tentativas
+
+    Apenas falhas transitórias (ver is_transient_error) são repetidas e
+    contam para o circuit breaker; as demais retornam imediatamente. Com o
+    circuito aberto a operação nem é iniciada. A espera entre tentativas é
+    interrompida por cancelamento. Exceções da operação (inclusive
+    OperationCancelled) liberam a tentativa de teste do circuito e são
+    propagadas.
+    """
+    for attempt in range(1, policy.max_attempts + 1):
+        if breaker and not breaker.allow():
+            return False, (f"{description} skipped: circuit open for {breaker.key} "
+                           f"(retry in {int(breaker.retry_after())}s)")
+
+        try:
+            success, message = operation()
+        except BaseException:
+            # Cancelamento ou erro inesperado: não deixar a tentativa de teste presa
+            if breaker:
+                breaker.release()
+            raise
+        if success:
+            if breaker:
+                breaker.record_success()
+            return success, message
+
+        if not is_transient_error(message):
+            if breaker:
+                breaker.release()
+            return success, message
+
+        if breaker and breaker.record_failure():
+            logger.log(f"Circuit opened for {breaker.key} after {breaker.failures} network failures; "
+                       f"pausing for {int(breaker.reset_timeout)}s", "WARNING")
+        if attempt == policy.max_attempts:
+            return success, message
+
+        delay = policy.delay(attempt)
+        logger.log(f"{description} failed with a network error (attempt {attempt}/{policy.max_attempts}), "
+                   f"retrying in {delay:.1f}s: {message}", "WARNING")
+        if token:
+            if token.wait(delay):
+                token.raise_if_cancelled()
+        else:
+            time.sleep(delay)
+
+    return False, f"{description} failed"
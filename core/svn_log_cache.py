@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sqlite3
+import threading
+
+class SVNLogCache:
+    """Cache local e incremental do 'svn log' armazenado em SQLite
+
+    Cada repositório é identificado pelo UUID SVN. O cache é somente de
+    acréscimo e cobre um intervalo contíguo de revisões: revisões mais
+    novas que a maior armazenada são buscadas no servidor e, quando uma
+    cópia de trabalho pede revisões anteriores à menor coberta, o
+    intervalo é estendido para trás.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS revisions (
+            repo_uuid TEXT NOT NULL,
+            revision INTEGER NOT NULL,
+            author TEXT,
+            date TEXT,
+            message TEXT,
+            PRIMARY KEY (repo_uuid, revision)
+        );
+        CREATE TABLE IF NOT EXISTS changed_paths (
+            repo_uuid TEXT NOT NULL,
+            revision INTEGER NOT NULL,
+            path TEXT NOT NULL,
+            action TEXT,
+            kind TEXT,
+            copyfrom_path TEXT,
+            copyfrom_rev INTEGER
+        );
+        CREATE INDEX IF NOT EXISTS idx_changed_paths_path
+            ON changed_paths (repo_uuid, path, revision);
+        CREATE INDEX IF NOT EXISTS idx_changed_paths_revision
+            ON changed_paths (repo_uuid, revision);
+        CREATE TABLE IF NOT EXISTS coverage (
+            repo_uuid TEXT PRIMARY KEY,
+            min_revision INTEGER NOT NULL
+        );
+    """
+
+    def __init__(self, svn_manager, db_path, logger):
+        """Inicializa o cache de log SVN"""
+        self.svn_manager = svn_manager
+        self.db_path = db_path
+        self.logger = logger
+        self.repo_uuid = None
+        self.repo_root = None
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.executescript(self.SCHEMA)
+
+    def close(self):
+        """Fecha a conexão com o banco de dados"""
+        with self._lock:
+            self.conn.close()
+
+    def _ensure_repository(self):
+        """Identifica o repositório SVN (UUID e raiz) da cópia de trabalho"""
+        if self.repo_uuid:
+            return True
+
+        info = self.svn_manager.get_info()
+        if not info or not info.get("uuid"):
+            return False
+
+        self.repo_uuid = info["uuid"]
+        self.repo_root = info["root"]
+        return True
+
+    def get_max_revision(self):
+        """Retorna a maior revisão armazenada no cache (0 se vazio)"""
+        if not self._ensure_repository():
+            return 0
+
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT MAX(revision) FROM revisions WHERE repo_uuid = ?",
+                (self.repo_uuid,)
+            ).fetchone()
+        return row[0] or 0
+
+    def get_min_revision(self):
+        """Retorna a menor revisão coberta pelo cache (0 se vazio)"""
+        if not self._ensure_repository():
+            return 0
+
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT min_revision FROM coverage WHERE repo_uuid = ?", (self.repo_uuid,)
+            ).fetchone()
+            if row is None:
+                # Caches criados antes do registro da cobertura
+                row = self.conn.execute(
+                    "SELECT MIN(revision) FROM revisions WHERE repo_uuid = ?", (self.repo_uuid,)
+                ).fetchone()
+        return row[0] or 0
+
+    def _set_min_revision(self, revision):
+        """Registra a menor revisão coberta pelo cache"""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO coverage (repo_uuid, min_revision) VALUES (?, ?)",
+                (self.repo_uuid, revision)
+            )
+
+    def _fetch(self, start_revision, end_revision, on_batch=None):
+        """Busca um intervalo do log no servidor e o armazena em lotes
+
+        `on_batch` recebe a última revisão de cada lote armazenado.
+        """
+        added = 0
+        batch = []
+        for entry in self.svn_manager.iter_log(start_revision, end_revision, target=self.repo_root):
+            batch.append(entry)
+            if len(batch) >= 500:
+                added += self._store(batch)
+                if on_batch:
+                    on_batch(batch[-1]["revision"])
+                batch = []
+        if batch:
+            added += self._store(batch)
+            if on_batch:
+                on_batch(batch[-1]["revision"])
+        return added
+
+    def refresh(self, start_revision=None):
+        """Busca no servidor as revisões que faltam no cache
+
+        Revisões mais novas que a maior armazenada são acrescentadas. Se
+        `start_revision` for anterior à menor revisão coberta, o intervalo
+        que falta é buscado de trás para frente, de modo que a cobertura
+        continue contígua mesmo se a busca for interrompida.
+        """
+        if not self._ensure_repository():
+            return False, "Could not identify SVN repository"
+
+        cached_max = self.get_max_revision()
+        added = 0
+
+        try:
+            if not cached_max:
+                first = start_revision or 1
+                self._set_min_revision(first)
+            else:
+                first = cached_max + 1
+                cached_min = self.get_min_revision()
+                if start_revision and start_revision < cached_min:
+                    self.logger.log(f"Backfilling SVN log cache from r{cached_min - 1} down to r{start_revision}...")
+                    added += self._fetch(cached_min - 1, start_revision, on_batch=self._set_min_revision)
+                    self._set_min_revision(start_revision)
+
+            self.logger.log(f"Fetching SVN log from r{first} to HEAD...")
+            try:
+                added += self._fetch(first, "HEAD")
+            except RuntimeError as e:
+                # Revisão inicial além do HEAD significa que o cache já está em dia
+                if "No such revision" not in str(e):
+                    raise
+                if not added:
+                    return True, "SVN log cache is up to date"
+
+        except RuntimeError as e:
+            self.logger.log(f"Error refreshing SVN log cache: {str(e)}", "ERROR")
+            return False, str(e)
+
+        self.logger.log(f"SVN log cache updated: {added} new revisions")
+        return True, f"{added} new revisions cached"
+
+    def _store(self, entries):
+        """Armazena um lote de entradas de log em uma única transação"""
+        if not entries:
+            return 0
+
+        inserted = 0
+        with self._lock, self.conn:
+            for entry in entries:
+                cursor = self.conn.execute(
+                    "INSERT OR IGNORE INTO revisions (repo_uuid, revision, author, date, message) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (self.repo_uuid, entry["revision"], entry["author"], entry["date"], entry["message"])
+                )
+                if cursor.rowcount == 0:
+                    continue
+                inserted += 1
+
+                self.conn.executemany(
+                    "INSERT INTO changed_paths "
+                    "(repo_uuid, revision, path, action, kind, copyfrom_path, copyfrom_rev) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (self.repo_uuid, entry["revision"], p["path"], p["action"], p["kind"],
+                         p["copyfrom_path"], p["copyfrom_rev"])
+                        for p in entry["paths"]
+                    ]
+                )
+        return inserted
+
+    def _rows_to_entries(self, rows):
+        """Converte linhas de revisão em dicionários com caminhos alterados"""
+        entries = []
+        for revision, author, date, message in rows:
+            paths = self.conn.execute(
+                "SELECT path, action, kind, copyfrom_path, copyfrom_rev FROM changed_paths "
+                "WHERE repo_uuid = ? AND revision = ?",
+                (self.repo_uuid, revision)
+            ).fetchall()
+            entries.append({
+                "revision": revision,
+                "author": author,
+                "date": date,
+                "message": message,
+                "paths": [
+                    {"path": p[0], "action": p[1], "kind": p[2],
+                     "copyfrom_path": p[3], "copyfrom_rev": p[4]}
+                    for p in paths
+                ]
+            })
+        return entries
+
+    def get_revisions(self, start_revision=None, end_revision=None):
+        """Retorna as entradas de log em um intervalo de revisões"""
+        if not self._ensure_repository():
+            return []
+
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT revision, author, date, message FROM revisions "
+                "WHERE repo_uuid = ? AND revision BETWEEN ? AND ? ORDER BY revision",
+                (self.repo_uuid, start_revision or 0, end_revision or 2 ** 62)
+            ).fetchall()
+            return self._rows_to_entries(rows)
+
+    def get_changed_paths(self, path_prefix, start_revision=None, end_revision=None):
+        """Retorna os caminhos alterados sob um prefixo em um intervalo de revisões"""
+        if not self._ensure_repository():
+            return []
+
+        prefix = "/" + path_prefix.strip("/") if path_prefix.strip("/") else ""
+
+        # Consulta por faixa para aproveitar o índice: "<prefixo>/" até "<prefixo>0"
+        query = (
+            "SELECT revision, path, action, kind, copyfrom_path, copyfrom_rev FROM changed_paths "
+            "WHERE repo_uuid = ? AND (path = ? OR (path >= ? AND path < ?)) "
+            "AND revision BETWEEN ? AND ? ORDER BY revision"
+        )
+        params = (self.repo_uuid, prefix or "/", prefix + "/", prefix + "0",
+                  start_revision or 0, end_revision or 2 ** 62)
+
+        with self._lock:
+            rows = self.conn.execute(query, params).fetchall()
+
+        return [
+            {"revision": r[0], "path": r[1], "action": r[2], "kind": r[3],
+             "copyfrom_path": r[4], "copyfrom_rev": r[5]}
+            for r in rows
+        ]
+
+    def get_revisions_for_path(self, path_prefix, start_revision=None, end_revision=None):
+        """Retorna as entradas de log que tocaram um prefixo de caminho"""
+        revisions = sorted({c["revision"] for c in
+                            self.get_changed_paths(path_prefix, start_revision, end_revision)})
+        if not revisions:
+            return []
+
+        entries = []
+        with self._lock:
+            for start in range(0, len(revisions), 500):
+                chunk = revisions[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self.conn.execute(
+                    f"SELECT revision, author, date, message FROM revisions "
+                    f"WHERE repo_uuid = ? AND revision IN ({placeholders}) ORDER BY revision",
+                    (self.repo_uuid, *chunk)
+                ).fetchall()
+                entries.extend(self._rows_to_entries(rows))
+        return entries
@@ -1,15 +1,44 @@
 # -*- coding: utf-8 -*-
 
 import os
+import sqlite3
 import subprocess
+import urllib.parse
+import xml.etree.ElementTree as ET
 from datetime import datetime
 
+from core.async_executor import get_executor
+from core.cancellation import run_command, start_process, finish_process
+from core.progress import ProgressReporter, run_streaming, svn_update_line_handler
+from utils.helpers import SVN_DEPTHS, is_path_in_scope, parse_sparse_include
+
+def peg_escape(path):
+    """Protege um caminho da interpretação de '@' como revisão peg
+
+    O SVN trata o último '@' de um alvo como separador de revisão peg
+    ("a@b.txt" vira "a" na revisão "b.txt"); um '@' final vazio evita isso.
+    """
+    return f"{path}@"
+
 class SVNManager:
     def __init__(self, working_dir, logger):
         """Inicializa o gerenciador SVN"""
         self.working_dir = working_dir
         self.logger = logger
         self.svn_url = None
+        self.last_update_stats = None
+        
+        # Escopo esparso: profundidade da raiz, subdiretórios incluídos e profundidade de cada um
+        self.sparse_depth = None
+        self.sparse_include = []
+        self.sparse_depths = {}
+        
+        # Funções que recebem eventos de progresso (dicionários)
+        self.progress_listeners = []
+        
+        # Timeout por comando (segundos) e token de cancelamento da operação atual
+        self.command_timeout = None
+        self.cancel_token = None
         
     def is_svn_repo(self):
         """Verifica se o diretório é um repositório SVN"""
@@ -18,10 +47,7 @@ class SVNManager:
     def check_svn_command(self):
         """Verifica se o comando SVN está disponível"""
         try:
-            subprocess.run(["svn", "--version"], 
-                          stdout=subprocess.PIPE, 
-                          stderr=subprocess.PIPE, 
-                          check=True)
+            run_command(["svn", "--version"], timeout=30).check_returncode()
             return True
         except (subprocess.SubprocessError, FileNotFoundError):
             self.logger.log("SVN command not found. Please install SVN client.", "ERROR")
@@ -31,6 +57,45 @@ class SVNManager:
         """Define a URL do repositório SVN"""
         self.svn_url = url
         
+    def _run(self, cmd, cwd=None, timeout=None):
+        """Executa um comando svn respeitando timeout e token de cancelamento"""
+        return run_command(
+            cmd,
+            cwd=cwd or self.working_dir,
+            timeout=timeout or self.command_timeout,
+            token=self.cancel_token
+        )
+    
+    def add_progress_listener(self, listener):
+        """Registra uma função para receber eventos de progresso"""
+        if listener not in self.progress_listeners:
+            self.progress_listeners.append(listener)
+    
+    def remove_progress_listener(self, listener):
+        """Remove uma função de eventos de progresso"""
+        if listener in self.progress_listeners:
+            self.progress_listeners.remove(listener)
+    
+    def _create_reporter(self, operation, total=None):
+        """Cria um reporter de progresso ligado ao logger e aos listeners"""
+        return ProgressReporter(operation, self.logger, self.progress_listeners, total=total)
+    
+    def set_sparse_scope(self, include=None, depth="empty"):
+        """Define os subdiretórios incluídos em uma cópia de trabalho esparsa
+        
+        `include` aceita caminhos ou {"path", "depth"} (ver
+        parse_sparse_include); a profundidade padrão de cada subárvore é
+        infinity e `depth` é a da raiz.
+        """
+        self.sparse_depths = {}
+        for path, path_depth in parse_sparse_include(include):
+            if path_depth not in SVN_DEPTHS:
+                self.logger.log(f"Invalid sparse depth '{path_depth}' for {path}, using infinity", "WARNING")
+                path_depth = "infinity"
+            self.sparse_depths[path] = path_depth
+        self.sparse_include = list(self.sparse_depths)
+        self.sparse_depth = depth if self.sparse_include else None
+    
     def checkout(self, url=None, username=None, password=None):
         """Realiza checkout do repositório SVN"""
         if not self.check_svn_command():
@@ -45,24 +110,32 @@ class SVNManager:
         try:
             cmd = ["svn", "checkout", repo_url, self.working_dir]
             
+            # Checkout esparso: raiz com profundidade reduzida, subárvores expandidas depois
+            if self.sparse_depth:
+                cmd.extend(["--depth", self.sparse_depth])
+            
             # Adicionar credenciais se fornecidas
             if username and password:
                 cmd.extend(["--username", username, "--password", password, "--non-interactive"])
                 
-            process = subprocess.run(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=os.path.dirname(self.working_dir)
+            cwd = os.path.dirname(self.working_dir)
+            reporter = self._create_reporter("SVN checkout")
+            returncode, last_line, stderr = run_streaming(
+                cmd, cwd, reporter, on_line=svn_update_line_handler(reporter, cwd),
+                token=self.cancel_token, timeout=self.command_timeout
             )
             
-            if process.returncode == 0:
-                self.logger.log("SVN checkout completed successfully", "SUCCESS")
+            if returncode == 0:
+                reporter.finish(True, last_line)
+                self.logger.log(f"SVN checkout completed successfully: {ProgressReporter.describe(reporter.snapshot())}", "SUCCESS")
                 self.svn_url = repo_url
+                
+                if self.sparse_include:
+                    return self.apply_sparse_scope()
                 return True, "Checkout completed successfully"
             else:
-                error_msg = process.stderr.strip()
+                error_msg = stderr.strip()
+                reporter.finish(False, error_msg)
                 self.logger.log(f"SVN checkout failed: {error_msg}", "ERROR")
                 return False, error_msg
                 
@@ -70,6 +143,60 @@ class SVNManager:
             self.logger.log(f"Error during SVN checkout: {str(e)}", "ERROR")
             return False, str(e)
     
+    @staticmethod
+    def _parse_info_output(returncode, stdout, stderr):
+        """Converte a saída de 'svn info' no dicionário de status"""
+        if returncode != 0:
+            return {
+                "valid": False,
+                "message": f"SVN error: {stderr.strip()}"
+            }
+        
+        # Extrair informações relevantes
+        url = None
+        revision = None
+        
+        for line in stdout.strip().split('\n'):
+            if line.startswith("URL:"):
+                url = line.replace("URL:", "").strip()
+            elif line.startswith("Revision:"):
+                revision = line.replace("Revision:", "").strip()
+        
+        if url and revision:
+            return {
+                "valid": True,
+                "url": url,
+                "revision": revision,
+                "message": f"Working copy at revision {revision}"
+            }
+        else:
+            return {
+                "valid": False,
+                "message": "Could not parse SVN info"
+            }
+    
+    @staticmethod
+    def _parse_status_output(stdout):
+        """Converte a saída de 'svn status' na lista de arquivos modificados"""
+        modified_files = []
+        
+        for line in stdout.strip().split('\n'):
+            if not line.strip():
+                continue
+                
+            status_code = line[0]
+            file_path = line[8:].strip()
+            
+            # Status: A (added), M (modified), D (deleted), ? (unversioned), C (conflict)
+            if status_code in ['A', 'M', 'D', '?', 'C']:
+                modified_files.append({
+                    "path": file_path,
+                    "type": status_code,
+                    "tracked": status_code != '?'
+                })
+        
+        return modified_files
+    
     def get_status(self):
         """Obtém o status do repositório SVN"""
         if not self.check_svn_command():
@@ -85,45 +212,11 @@ class SVNManager:
             }
             
         try:
-            process = subprocess.run(
-                ["svn", "info"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=self.working_dir
+            process = self._run(
+                ["svn", "info"]
             )
             
-            if process.returncode == 0:
-                info_output = process.stdout.strip()
-                
-                # Extrair informações relevantes
-                url = None
-                revision = None
-                
-                for line in info_output.split('\n'):
-                    if line.startswith("URL:"):
-                        url = line.replace("URL:", "").strip()
-                    elif line.startswith("Revision:"):
-                        revision = line.replace("Revision:", "").strip()
-                
-                if url and revision:
-                    return {
-                        "valid": True,
-                        "url": url,
-                        "revision": revision,
-                        "message": f"Working copy at revision {revision}"
-                    }
-                else:
-                    return {
-                        "valid": False,
-                        "message": "Could not parse SVN info"
-                    }
-            else:
-                error_msg = process.stderr.strip()
-                return {
-                    "valid": False,
-                    "message": f"SVN error: {error_msg}"
-                }
+            return self._parse_info_output(process.returncode, process.stdout, process.stderr)
                 
         except Exception as e:
             return {
@@ -131,40 +224,104 @@ class SVNManager:
                 "message": f"Error: {str(e)}"
             }
     
-    def get_modified_files(self):
-        """Obtém lista de arquivos modificados"""
+    def get_info(self, target=None, revision=None):
+        """Obtém informações estruturadas via 'svn info --xml'"""
+        cmd = ["svn", "info", "--xml"]
+        if revision:
+            cmd.extend(["-r", str(revision)])
+        if target:
+            cmd.append(target)
+            
+        try:
+            process = self._run(
+                cmd
+            )
+            
+            if process.returncode != 0:
+                self.logger.log(f"SVN info error: {process.stderr.strip()}", "ERROR")
+                return None
+                
+            entry = ET.fromstring(process.stdout).find("entry")
+            if entry is None:
+                return None
+                
+            commit = entry.find("commit")
+            return {
+                "url": entry.findtext("url"),
+                "relative_url": entry.findtext("relative-url"),
+                "root": entry.findtext("repository/root"),
+                "uuid": entry.findtext("repository/uuid"),
+                "revision": int(entry.get("revision", 0)),
+                "last_changed_revision": int(commit.get("revision", 0)) if commit is not None else None
+            }
+            
+        except Exception as e:
+            self.logger.log(f"Error getting SVN info: {str(e)}", "ERROR")
+            return None
+    
+    def iter_log(self, start_revision, end_revision="HEAD", target=None):
+        """Itera sobre entradas de 'svn log --xml -v' sem carregar toda a saída em memória"""
+        cmd = ["svn", "log", "--xml", "-v", "-r", f"{start_revision}:{end_revision}"]
+        cmd.append(target or self.svn_url or ".")
+        
+        process, timer = start_process(
+            cmd,
+            cwd=self.working_dir,
+            token=self.cancel_token,
+            timeout=self.command_timeout,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        
+        try:
+            for event, element in ET.iterparse(process.stdout, events=("end",)):
+                if element.tag != "logentry":
+                    continue
+                    
+                paths = []
+                for path_el in element.iterfind("paths/path"):
+                    copyfrom_rev = path_el.get("copyfrom-rev")
+                    paths.append({
+                        "path": path_el.text,
+                        "action": path_el.get("action"),
+                        "kind": path_el.get("kind"),
+                        "copyfrom_path": path_el.get("copyfrom-path"),
+                        "copyfrom_rev": int(copyfrom_rev) if copyfrom_rev else None
+                    })
+                    
+                yield {
+                    "revision": int(element.get("revision")),
+                    "author": element.findtext("author"),
+                    "date": element.findtext("date"),
+                    "message": element.findtext("msg") or "",
+                    "paths": paths
+                }
+                element.clear()
+        except ET.ParseError:
+            # Saída vazia ou interrompida - o erro real vem do stderr
+            pass
+        finally:
+            process.stdout.close()
+            stderr = process.stderr.read().decode('utf-8', errors='replace')
+            process.stderr.close()
+            returncode = process.wait()
+        
+        finish_process(process, timer, self.cancel_token, cmd, self.command_timeout)
+        if returncode != 0:
+            raise RuntimeError(stderr.strip() or f"svn log exited with code {returncode}")
+    
+    def get_modified_files(self, quiet=False):
+        """Obtém lista de arquivos modificados (quiet: apenas arquivos versionados)"""
         if not self.check_svn_command() or not self.is_svn_repo():
             return []
             
         try:
-            process = subprocess.run(
-                ["svn", "status"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=self.working_dir
+            process = self._run(
+                ["svn", "status", "-q"] if quiet else ["svn", "status"]
             )
             
             if process.returncode == 0:
-                status_output = process.stdout.strip()
-                modified_files = []
-                
-                for line in status_output.split('\n'):
-                    if not line.strip():
-                        continue
-                        
-                    status_code = line[0]
-                    file_path = line[8:].strip()
-                    
-                    # Status: A (added), M (modified), D (deleted), ? (unversioned), C (conflict)
-                    if status_code in ['A', 'M', 'D', '?', 'C']:
-                        modified_files.append({
-                            "path": file_path,
-                            "type": status_code,
-                            "tracked": status_code != '?'
-                        })
-                
-                return modified_files
+                return self._parse_status_output(process.stdout)
             else:
                 self.logger.log(f"SVN status error: {process.stderr.strip()}", "ERROR")
                 return []
@@ -173,7 +330,88 @@ class SVNManager:
             self.logger.log(f"Error getting SVN status: {str(e)}", "ERROR")
             return []
     
-    def update(self, revision=None):
+    def apply_sparse_scope(self, paths=None):
+        """Aplica a profundidade configurada às subárvores incluídas
+        
+        Os caminhos são processados dos mais rasos para os mais profundos
+        (reduzir a profundidade de um diretório remove as subárvores
+        incluídas abaixo dele), com uma chamada por sequência de caminhos
+        de mesma profundidade.
+        """
+        if not self.sparse_include:
+            return True, "No sparse scope configured"
+        
+        paths = sorted(self.sparse_include if paths is None else paths, key=lambda p: (p.count('/'), p))
+        self.logger.log(f"Applying sparse scope: {', '.join(f'{p} ({self.sparse_depths[p]})' for p in paths)}")
+        
+        success, message = True, "Sparse scope applied"
+        group = []
+        for index, path in enumerate(paths):
+            group.append(path)
+            depth = self.sparse_depths[path]
+            if index + 1 < len(paths) and self.sparse_depths[paths[index + 1]] == depth:
+                continue
+            success, message = self.update(paths=group, parents=True, set_depth=depth)
+            if not success:
+                break
+            group = []
+        return success, message
+    
+    def get_depths(self, paths):
+        """Profundidade persistente (sticky depth) de caminhos da cópia de trabalho
+        
+        Caminhos ausentes da cópia de trabalho não aparecem no resultado.
+        """
+        process = self._run(["svn", "info", "--xml", "--"] + [peg_escape(p) for p in paths])
+        depths = {}
+        try:
+            info = ET.fromstring(process.stdout)
+        except ET.ParseError:
+            return depths
+        for entry in info.iter("entry"):
+            path = entry.get("path", "").replace('\\', '/')
+            depths[path] = entry.findtext("wc-info/depth") or "infinity"
+        return depths
+    
+    def ensure_sparse_scope(self):
+        """Aplica o escopo esparso configurado onde a cópia de trabalho ainda não o tem
+        
+        Compara a profundidade da raiz e de cada subárvore incluída com a da
+        cópia de trabalho e executa 'svn update --set-depth' apenas onde ela
+        difere, de modo que cópias de trabalho existentes deixem de buscar
+        as subárvores excluídas. Alterar a profundidade de caminhos já
+        presentes pode remover arquivos, então isso é adiado enquanto houver
+        alterações locais não enviadas.
+        """
+        if not self.sparse_include:
+            return True, "No sparse scope configured"
+        
+        current = self.get_depths(["."] + self.sparse_include)
+        if "." not in current:
+            self.logger.log("Could not read SVN working copy depth, sparse scope not checked", "WARNING")
+            return True, "Sparse scope not checked"
+        root_changed = current.get(".") != self.sparse_depth
+        changed = [p for p in self.sparse_include if root_changed or current.get(p) != self.sparse_depths[p]]
+        if not changed:
+            return True, "Sparse scope already applied"
+        
+        # Subárvores incluídas abaixo de um caminho alterado precisam ser reaplicadas
+        pending = [p for p in self.sparse_include
+                   if p in changed or any(p.startswith(c + '/') for c in changed)]
+        if (root_changed or any(p in current for p in pending)) and self.get_modified_files(quiet=True):
+            self.logger.log("SVN working copy has local modifications, sparse scope will be applied later",
+                            "WARNING")
+            return True, "Sparse scope pending"
+        
+        if root_changed:
+            self.logger.log(f"Setting SVN working copy root depth to {self.sparse_depth}; "
+                            f"subtrees outside the sparse scope are removed")
+            success, message = self.update(paths=["."], set_depth=self.sparse_depth)
+            if not success:
+                return success, message
+        return self.apply_sparse_scope(pending)
+    
+    def update(self, revision=None, paths=None, parents=False, depth=None, set_depth=None, progress_total=None):
         """Atualiza o repositório SVN para a última revisão ou revisão específica"""
         if not self.check_svn_command() or not self.is_svn_repo():
             return False, "Not an SVN working copy"
@@ -184,21 +422,38 @@ class SVNManager:
             # Atualizar para revisão específica
             if revision:
                 cmd.extend(["-r", str(revision)])
+            
+            # Criar diretórios intermediários ausentes para caminhos específicos
+            if parents:
+                cmd.append("--parents")
+            
+            if depth:
+                cmd.extend(["--depth", depth])
+            
+            # Alterar a profundidade persistente (sticky depth) dos alvos
+            if set_depth:
+                cmd.extend(["--set-depth", set_depth])
+            
+            # Atualizar apenas os caminhos indicados (em uma única chamada)
+            if paths:
+                cmd.append("--")
+                cmd.extend(peg_escape(p) for p in paths)
                 
-            process = subprocess.run(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=self.working_dir
+            # Ler a saída linha a linha em vez de acumulá-la em memória
+            reporter = self._create_reporter("SVN update", total=progress_total)
+            returncode, last_line, stderr = run_streaming(
+                cmd, self.working_dir, reporter, on_line=svn_update_line_handler(reporter, self.working_dir),
+                token=self.cancel_token, timeout=self.command_timeout
             )
             
-            if process.returncode == 0:
-                update_info = process.stdout.strip()
+            if returncode == 0:
+                reporter.finish(True, last_line)
+                update_info = f"{last_line} ({reporter.files} items)"
                 self.logger.log(f"SVN update completed: {update_info}", "SUCCESS")
                 return True, update_info
             else:
-                error_msg = process.stderr.strip()
+                error_msg = stderr.strip()
+                reporter.finish(False, error_msg)
                 self.logger.log(f"SVN update failed: {error_msg}", "ERROR")
                 return False, error_msg
                 
@@ -206,6 +461,128 @@ class SVNManager:
             self.logger.log(f"Error during SVN update: {str(e)}", "ERROR")
             return False, str(e)
     
+    def count_versioned_paths(self):
+        """Conta os nós versionados da cópia de trabalho (custo de um update completo)"""
+        wc_db = os.path.join(self.working_dir, '.svn', 'wc.db')
+        try:
+            conn = sqlite3.connect(f"file:{wc_db}?mode=ro", uri=True)
+            try:
+                row = conn.execute("SELECT COUNT(*) FROM nodes WHERE op_depth = 0").fetchone()
+                return row[0]
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return None
+    
+    def _cached_log_changes(self, log_cache, wc_prefix, start_revision, end_revision):
+        """Alterações sob `wc_prefix` lidas do cache local de 'svn log' (None se indisponível)"""
+        success, message = log_cache.refresh(start_revision=start_revision)
+        if success and log_cache.get_min_revision() > start_revision:
+            success, message = False, f"revisions before r{log_cache.get_min_revision()} are not cached"
+        if not success:
+            self.logger.log(f"SVN log cache unavailable, reading log from server: {message}", "WARNING")
+            return None
+        return log_cache.get_changed_paths(wc_prefix, start_revision, end_revision)
+    
+    def get_upstream_changes(self, log_cache=None):
+        """Lista os caminhos da cópia de trabalho alterados no servidor entre BASE e HEAD
+        
+        Com `log_cache` (SVNLogCache) apenas as revisões ainda não armazenadas
+        são buscadas no servidor. Retorna (revisão HEAD, caminhos), ou
+        caminhos None quando a lista não é confiável e um update completo é
+        necessário.
+        """
+        info = self.get_info()
+        head_info = self.get_info(target=info["url"], revision="HEAD") if info else None
+        if not info or not head_info or not info.get("relative_url"):
+            return None, None
+        
+        base_revision = info["revision"]
+        head_revision = head_info["revision"]
+        if head_revision <= base_revision:
+            return head_revision, []
+        
+        # Caminhos do log são relativos à raiz do repositório ("/trunk/...") e
+        # decodificados; a URL relativa vem codificada ("%20", "%C3%A9")
+        wc_prefix = urllib.parse.unquote(info["relative_url"].lstrip("^")).rstrip("/")
+        
+        first = base_revision + 1
+        changes = self._cached_log_changes(log_cache, wc_prefix, first, head_revision) if log_cache else None
+        if changes is None:
+            changes = (change for entry in self.iter_log(first, head_revision, target=info["url"])
+                       for change in entry["paths"])
+        
+        changed = {}
+        for change in changes:
+            repo_path = change["path"]
+            if repo_path == wc_prefix:
+                rel_path = "."
+            elif repo_path.startswith(wc_prefix + "/"):
+                rel_path = repo_path[len(wc_prefix) + 1:]
+            else:
+                continue
+            changed[rel_path] = change["action"]
+        
+        # A URL da cópia de trabalho mudou depois de BASE: se nenhum caminho
+        # foi mapeado, o mapeamento falhou e o update direcionado pularia tudo
+        last_changed = head_info.get("last_changed_revision") or head_revision
+        if last_changed > base_revision and not changed:
+            self.logger.log(f"Upstream SVN changes up to r{last_changed} did not map into the working copy "
+                            f"({wc_prefix}), running full update", "WARNING")
+            return head_revision, None
+        
+        # Descendentes de diretórios adicionados/substituídos vêm junto com o diretório
+        # Ignorar caminhos fora do escopo esparso para não trazê-los com --parents
+        # (os diretórios intermediários são criados pelo próprio --parents)
+        changed = {p: a for p, a in changed.items()
+                   if p == "." or is_path_in_scope(p, list(self.sparse_depths.items()))}
+        
+        copied_dirs = sorted(p for p, action in changed.items() if action in ("A", "R") and p != ".")
+        paths = []
+        for rel_path in sorted(changed):
+            if rel_path == ".":
+                continue
+            if any(rel_path.startswith(d + "/") for d in copied_dirs):
+                continue
+            paths.append(rel_path)
+        
+        return head_revision, paths
+    
+    def update_changed_paths(self, max_paths=200, log_cache=None):
+        """Atualiza apenas os caminhos alterados no servidor, com fallback para update completo"""
+        if not self.check_svn_command() or not self.is_svn_repo():
+            return False, "Not an SVN working copy"
+        
+        full_count = self.count_versioned_paths()
+        
+        try:
+            head_revision, paths = self.get_upstream_changes(log_cache=log_cache)
+        except Exception as e:
+            self.logger.log(f"Could not list upstream SVN changes, running full update: {str(e)}", "WARNING")
+            head_revision, paths = None, None
+        
+        if paths is None or len(paths) > max_paths:
+            if paths is not None:
+                self.logger.log(f"{len(paths)} paths changed upstream (limit {max_paths}), running full update")
+            self.last_update_stats = {"mode": "full", "paths": full_count, "full_paths": full_count}
+            return self.update(revision=head_revision)
+        
+        if paths:
+            success, message = self.update(revision=head_revision, paths=paths, parents=True,
+                                           progress_total=len(paths))
+            if not success:
+                return success, message
+        
+        # Atualizar apenas o próprio diretório raiz para registrar a nova revisão BASE
+        success, message = self.update(revision=head_revision, paths=["."], depth="empty")
+        
+        self.last_update_stats = {"mode": "targeted", "paths": len(paths), "full_paths": full_count}
+        self.logger.log(
+            f"Targeted SVN update to r{head_revision}: {len(paths)} paths updated "
+            f"(full update would crawl {full_count if full_count is not None else 'unknown'} paths)"
+        )
+        return success, message
+    
     def commit(self, files, message, username=None, password=None):
         """Realiza commit de arquivos para o repositório SVN"""
         if not self.check_svn_command() or not self.is_svn_repo():
@@ -221,24 +598,16 @@ class SVNManager:
             # Adicionar arquivos não versionados primeiro
             for file_path in files:
                 # Verificar se o arquivo está não versionado
-                status_process = subprocess.run(
-                    ["svn", "status", file_path],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    cwd=self.working_dir
+                status_process = self._run(
+                    ["svn", "status", file_path]
                 )
                 
                 if status_process.returncode == 0 and status_process.stdout.strip():
                     status_line = status_process.stdout.strip()
                     if status_line.startswith('?'):
                         # Adicionar arquivo
-                        add_process = subprocess.run(
-                            ["svn", "add", file_path],
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.PIPE,
-                            text=True,
-                            cwd=self.working_dir
+                        add_process = self._run(
+                            ["svn", "add", file_path]
                         )
                         
                         if add_process.returncode == 0:
@@ -260,12 +629,8 @@ class SVNManager:
                 cmd.extend(["--username", username, "--password", password, "--non-interactive"])
             
             # Executar commit
-            process = subprocess.run(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=self.working_dir
+            process = self._run(
+                cmd
             )
             
             if process.returncode == 0:
@@ -288,12 +653,8 @@ class SVNManager:
             
         try:
             # Verificar status do arquivo
-            status_process = subprocess.run(
-                ["svn", "status", file_path],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=self.working_dir
+            status_process = self._run(
+                ["svn", "status", file_path]
             )
             
             if status_process.returncode != 0:
@@ -323,12 +684,8 @@ class SVNManager:
                     return None
             
             # Arquivo modificado, obter diff
-            diff_process = subprocess.run(
-                ["svn", "diff", file_path],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=self.working_dir
+            diff_process = self._run(
+                ["svn", "diff", file_path]
             )
             
             if diff_process.returncode == 0:
@@ -344,4 +701,98 @@ class SVNManager:
                 
         except Exception as e:
             self.logger.log(f"Error getting diff for {file_path}: {str(e)}", "ERROR")
-            return None
\ No newline at end of file
+            return None
+    
+    # Variantes assíncronas: devem ser agendadas no executor compartilhado
+    # (get_executor().submit/gather) para rodar concorrentemente no mesmo loop
+    
+    async def _run_svn_async(self, args):
+        """Executa um comando svn no executor assíncrono"""
+        return await get_executor().run(["svn"] + list(args), cwd=self.working_dir)
+    
+    async def get_status_async(self):
+        """Variante assíncrona de get_status"""
+        if not self.is_svn_repo():
+            return {
+                "valid": False,
+                "message": "Not an SVN working copy"
+            }
+        
+        try:
+            returncode, stdout, stderr = await self._run_svn_async(["info"])
+            return self._parse_info_output(returncode, stdout, stderr)
+        except Exception as e:
+            return {
+                "valid": False,
+                "message": f"Error: {str(e)}"
+            }
+    
+    async def get_modified_files_async(self):
+        """Variante assíncrona de get_modified_files"""
+        if not self.is_svn_repo():
+            return []
+        
+        try:
+            returncode, stdout, stderr = await self._run_svn_async(["status"])
+            if returncode == 0:
+                return self._parse_status_output(stdout)
+            self.logger.log(f"SVN status error: {stderr.strip()}", "ERROR")
+            return []
+        except Exception as e:
+            self.logger.log(f"Error getting SVN status: {str(e)}", "ERROR")
+            return []
+    
+    async def get_diff_async(self, file_path):
+        """Variante assíncrona de get_diff"""
+        if not self.is_svn_repo():
+            return None
+        
+        try:
+            returncode, stdout, stderr = await self._run_svn_async(["status", file_path])
+            if returncode != 0:
+                self.logger.log(f"Error checking status for {file_path}: {stderr.strip()}", "ERROR")
+                return None
+            
+            status_line = stdout.strip()
+            if not status_line:
+                return None
+            
+            # Arquivo não versionado
+            if status_line[0] == '?':
+                file_full_path = os.path.join(self.working_dir, file_path)
+                if not os.path.exists(file_full_path):
+                    return None
+                with open(file_full_path, 'r', encoding='utf-8', errors='replace') as f:
+                    content = f.read()
+                return {
+                    "type": "new_file",
+                    "content": content,
+                    "diff": None
+                }
+            
+            returncode, stdout, stderr = await self._run_svn_async(["diff", file_path])
+            if returncode == 0:
+                return {
+                    "type": "diff",
+                    "content": None,
+                    "diff": stdout.strip()
+                }
+            self.logger.log(f"Error getting diff for {file_path}: {stderr.strip()}", "ERROR")
+            return None
+            
+        except Exception as e:
+            self.logger.log(f"Error getting diff for {file_path}: {str(e)}", "ERROR")
+            return None
+    
+    async def cat_async(self, file_path, revision=None):
+        """Obtém o conteúdo de um arquivo no repositório SVN (svn cat)"""
+        args = ["cat"]
+        if revision:
+            args.extend(["-r", str(revision)])
+        args.append(file_path)
+        
+        returncode, stdout, stderr = await self._run_svn_async(args)
+        if returncode != 0:
+            self.logger.log(f"Error getting SVN content for {file_path}: {stderr.strip()}", "ERROR")
+            return None
+        return stdout
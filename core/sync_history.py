@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import math
+import time
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+def percentile(values, fraction):
+    """Percentil por posição mais próxima de uma lista de valores (None se vazia)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+class SyncHistory:
+    """Histórico persistente das sincronizações em SQLite
+
+    Cada execução é gravada (somente acréscimo) com direção, início e fim,
+    duração de cada fase, arquivos alterados, bytes transferidos, resultado
+    e fase em que falhou. Na mesma transação, um rollup diário por
+    repositório e direção é atualizado, de modo que contagens e taxas de
+    falha de semanas inteiras não exigem varrer todas as execuções.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS sync_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            repo TEXT NOT NULL,
+            direction TEXT NOT NULL,
+            started REAL NOT NULL,
+            finished REAL NOT NULL,
+            duration REAL NOT NULL,
+            outcome TEXT NOT NULL,
+            error_phase TEXT,
+            message TEXT,
+            files_changed INTEGER NOT NULL DEFAULT 0,
+            bytes INTEGER NOT NULL DEFAULT 0,
+            phases TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_sync_runs_repo_started
+            ON sync_runs (repo, started);
+        CREATE TABLE IF NOT EXISTS sync_rollups (
+            repo TEXT NOT NULL,
+            day TEXT NOT NULL,
+            direction TEXT NOT NULL,
+            runs INTEGER NOT NULL,
+            failures INTEGER NOT NULL,
+            total_duration REAL NOT NULL,
+            max_duration REAL NOT NULL,
+            files_changed INTEGER NOT NULL,
+            bytes INTEGER NOT NULL,
+            PRIMARY KEY (repo, day, direction)
+        );
+    """
+
+    def __init__(self, db_path, logger):
+        """Inicializa o histórico, criando o banco se necessário"""
+        self.db_path = db_path
+        self.logger = logger
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.executescript(self.SCHEMA)
+
+    def close(self):
+        """Fecha a conexão com o banco de dados"""
+        with self._lock:
+            self.conn.close()
+
+    def record(self, repo, direction, started, finished, outcome, error_phase=None,
+               message=None, files_changed=0, bytes=0, phases=None):
+        """Grava uma execução e atualiza o rollup do dia
+
+        `started`/`finished` são timestamps Unix; `outcome` é "success",
+        "failed" ou "cancelled"; `phases` mapeia nome da fase -> segundos.
+        """
+        duration = max(0.0, finished - started)
+        failed = 0 if outcome == "success" else 1
+        day = datetime.fromtimestamp(started).strftime('%Y-%m-%d')
+        try:
+            with self._lock, self.conn:
+                self.conn.execute(
+                    "INSERT INTO sync_runs (repo, direction, started, finished, duration, outcome, "
+                    "error_phase, message, files_changed, bytes, phases) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (repo, direction, started, finished, duration, outcome, error_phase,
+                     message, files_changed, bytes, json.dumps(phases or {}))
+                )
+                # INSERT OR IGNORE + UPDATE em vez de UPSERT, que exige SQLite >= 3.24
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO sync_rollups (repo, day, direction, runs, failures, "
+                    "total_duration, max_duration, files_changed, bytes) VALUES (?, ?, ?, 0, 0, 0, 0, 0, 0)",
+                    (repo, day, direction)
+                )
+                self.conn.execute(
+                    "UPDATE sync_rollups SET runs = runs + 1, failures = failures + ?, "
+                    "total_duration = total_duration + ?, max_duration = MAX(max_duration, ?), "
+                    "files_changed = files_changed + ?, bytes = bytes + ? "
+                    "WHERE repo = ? AND day = ? AND direction = ?",
+                    (failed, duration, duration, files_changed, bytes, repo, day, direction)
+                )
+        except sqlite3.Error as e:
+            self.logger.log(f"Error recording sync history: {str(e)}", "WARNING")
+
+    def count_runs(self, repo=None):
+        """Total de execuções registradas (de um repositório ou de todos)"""
+        query = "SELECT COALESCE(SUM(runs), 0) FROM sync_rollups"
+        params = ()
+        if repo:
+            query += " WHERE repo = ?"
+            params = (repo,)
+        with self._lock:
+            return self.conn.execute(query, params).fetchone()[0]
+
+    def recent_runs(self, repo=None, limit=20):
+        """Últimas execuções, da mais recente para a mais antiga"""
+        query = ("SELECT repo, direction, started, duration, outcome, error_phase, message, "
+                 "files_changed, bytes, phases FROM sync_runs")
+        params = []
+        if repo:
+            query += " WHERE repo = ?"
+            params.append(repo)
+        query += " ORDER BY started DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self.conn.execute(query, params).fetchall()
+        keys = ("repo", "direction", "started", "duration", "outcome", "error_phase", "message",
+                "files_changed", "bytes", "phases")
+        runs = [dict(zip(keys, row)) for row in rows]
+        for run in runs:
+            run["phases"] = json.loads(run["phases"] or "{}")
+        return runs
+
+    @staticmethod
+    def _period_start(day, period):
+        """Início do período (dia ou semana ISO, iniciando na segunda) de uma data"""
+        if period == "week":
+            return day - timedelta(days=day.weekday())
+        return day
+
+    def report(self, period="day", days=14, repo=None, now=None):
+        """Relatório por repositório e período: execuções, taxa de falha, p50/p95 e tendência
+
+        Retorna uma lista de dicionários (repo, period, runs, failures,
+        failure_rate, p50, p95, files_changed, bytes, trend), ordenada por
+        repositório e período. `trend` é a variação relativa do p50 em
+        relação ao período anterior do mesmo repositório (None no primeiro).
+        """
+        now = now or datetime.now()
+        first_day = self._period_start((now - timedelta(days=days - 1)).date(), period)
+        since = datetime.combine(first_day, datetime.min.time())
+
+        # Contagens e volumes vêm dos rollups diários
+        query = ("SELECT repo, day, SUM(runs), SUM(failures), SUM(files_changed), SUM(bytes) "
+                 "FROM sync_rollups WHERE day >= ?")
+        params = [first_day.isoformat()]
+        if repo:
+            query += " AND repo = ?"
+            params.append(repo)
+        query += " GROUP BY repo, day"
+
+        # Percentis exigem as durações individuais (execuções bem-sucedidas na janela)
+        runs_query = "SELECT repo, started, duration FROM sync_runs WHERE started >= ? AND outcome = 'success'"
+        runs_params = [since.timestamp()]
+        if repo:
+            runs_query += " AND repo = ?"
+            runs_params.append(repo)
+
+        with self._lock:
+            rollups = self.conn.execute(query, params).fetchall()
+            runs = self.conn.execute(runs_query, runs_params).fetchall()
+
+        rows = {}
+        for repo_name, day, count, failures, files_changed, bytes in rollups:
+            start = self._period_start(datetime.strptime(day, '%Y-%m-%d').date(), period)
+            row = rows.setdefault((repo_name, start), {
+                "repo": repo_name, "period": start, "runs": 0, "failures": 0,
+                "files_changed": 0, "bytes": 0, "durations": []
+            })
+            row["runs"] += count
+            row["failures"] += failures
+            row["files_changed"] += files_changed
+            row["bytes"] += bytes
+
+        for repo_name, started, duration in runs:
+            start = self._period_start(datetime.fromtimestamp(started).date(), period)
+            if (repo_name, start) in rows:
+                rows[(repo_name, start)]["durations"].append(duration)
+
+        report = []
+        previous = {}
+        for key in sorted(rows):
+            row = rows[key]
+            durations = row.pop("durations")
+            row["failure_rate"] = row["failures"] / row["runs"] if row["runs"] else 0.0
+            row["p50"] = percentile(durations, 0.5)
+            row["p95"] = percentile(durations, 0.95)
+
+            last_p50 = previous.get(row["repo"])
+            row["trend"] = (row["p50"] - last_p50) / last_p50 if last_p50 and row["p50"] is not None else None
+            previous[row["repo"]] = row["p50"]
+            report.append(row)
+        return report
+
+class SyncRunRecorder:
+    """Acumula os dados de uma execução em andamento para o SyncHistory
+
+    Mede a duração de cada fase (repetições somam), conta arquivos
+    alterados e soma os bytes informados pelos eventos de progresso finais.
+    """
+
+    def __init__(self, direction):
+        """Inicia a medição de uma execução"""
+        self.direction = direction
+        self.started = time.time()
+        self.phases = {}
+        self.phase = None
+        self.files_changed = 0
+        self.bytes = 0
+        self._phase_started = time.monotonic()
+
+    def enter_phase(self, name):
+        """Encerra a fase atual e inicia a medição de `name`"""
+        self._close_phase()
+        self.phase = name
+
+    def _close_phase(self):
+        """Acumula a duração da fase atual"""
+        now = time.monotonic()
+        if self.phase:
+            self.phases[self.phase] = round(self.phases.get(self.phase, 0.0) + now - self._phase_started, 3)
+        self._phase_started = now
+
+    def on_progress(self, event):
+        """Listener de progresso: soma os bytes dos eventos finais"""
+        if event.get("done"):
+            self.bytes += event.get("bytes") or 0
+
+    def finish(self):
+        """Encerra a última fase e retorna o instante de término (timestamp Unix)"""
+        self._close_phase()
+        return time.time()
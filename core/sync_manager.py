@@ -5,6 +5,20 @@ import shutil
 import time
 from datetime import datetime
 import tempfile
+import sqlite3
+import threading
+import subprocess
+
+from core.cancellation import CancellationToken, OperationCancelled, PhaseWatchdog
+
+from core.content_identity import ContentIdentityIndex
+from core.svn_log_cache import SVNLogCache
+from core.sync_history import SyncHistory, SyncRunRecorder
+from core.retry import RetryPolicy, get_breaker, remote_key, run_with_retry
+from utils.helpers import is_path_in_scope, parse_sparse_include
+
+# Acima deste número de caminhos sujos, um status completo é mais barato
+DIRTY_PATHS_LIMIT = 2000
 
 class SyncManager:
     def __init__(self, git_manager, svn_manager, logger, config_manager):
@@ -14,7 +28,89 @@ class SyncManager:
         self.logger = logger
         self.config = config_manager
         self.working_dir = git_manager.working_dir if git_manager else None
+        self.identity_index = ContentIdentityIndex(self.working_dir, logger) if self.working_dir else None
+        self.svn_log_cache = None
+        
+        # Histórico persistente das execuções (SQLite) e medição da execução atual
+        self.sync_history = None
+        self.current_run = None
+        self.closed = False
+        
+        # Cancelamento, timeouts por comando e watchdog de fases travadas
+        self.cancel_token = None
+        self._remote_keys = {}
+        self.watchdog = PhaseWatchdog(logger, stuck_after=self.config.get("sync.watchdog_stuck_seconds", 300))
+        
+        # Escopo esparso compartilhado entre checkout/update SVN e detecção de alterações
+        self.sparse_include = self.config.get("sparse.include", []) or []
+        if svn_manager:
+            svn_manager.set_sparse_scope(self.sparse_include, self.config.get("sparse.root_depth", "empty"))
+        
+        # Caminhos alterados informados pelo watcher de arquivos desde a última
+        # sincronização Git -> SVN (None: desconhecido, é preciso varrer a árvore)
+        self.dirty_tracking = False
+        self.dirty_paths = None
+        self._dirty_lock = threading.Lock()
+        
+        # Backend de leitura e estratégia de fetch do Git (escopo, profundidade, filtro parcial, prune, tags)
+        if git_manager:
+            git_manager.set_backend(self.config.get("git_backend", "cli"))
+            git_manager.set_fetch_options(self.config.get("git_fetch", {}))
+        
+        for manager in (git_manager, svn_manager):
+            if manager:
+                manager.add_progress_listener(self._on_progress)
+        
+    def get_svn_log_cache(self):
+        """Obtém o cache local de 'svn log', criando-o sob demanda"""
+        if self.svn_log_cache is None and self.svn_manager and not self.closed:
+            db_path = self.config.get_data_path("svn_log_cache.sqlite")
+            try:
+                self.svn_log_cache = SVNLogCache(self.svn_manager, db_path, self.logger)
+            except (sqlite3.Error, OSError) as e:
+                self.logger.log(f"SVN log cache unavailable ({db_path}): {str(e)}", "WARNING")
+        return self.svn_log_cache
         
+    def get_sync_history(self):
+        """Obtém o histórico de sincronizações, criando-o sob demanda
+        
+        Retorna None se o histórico estiver desativado ou não puder ser
+        aberto (diretório sem permissão de escrita, banco bloqueado).
+        """
+        if self.sync_history is None and not self.closed and self.config.get("history.enabled", True):
+            db_path = self.config.get_data_path("sync_history.sqlite")
+            try:
+                self.sync_history = SyncHistory(db_path, self.logger)
+            except (sqlite3.Error, OSError) as e:
+                self.logger.log(f"Sync history unavailable ({db_path}): {str(e)}", "WARNING")
+        return self.sync_history
+    
+    def close(self):
+        """Libera os recursos do gerenciador (chamado ao substituí-lo ou ao fechar a aplicação)
+        
+        Uma execução ainda em andamento termina normalmente, mas não é
+        mais gravada no histórico.
+        """
+        self.closed = True
+        self.watchdog.stop()
+        if self.sync_history:
+            self.sync_history.close()
+            self.sync_history = None
+        if self.svn_log_cache:
+            self.svn_log_cache.close()
+            self.svn_log_cache = None
+    
+    def _on_progress(self, event):
+        """Repassa eventos de progresso dos gerenciadores à execução em andamento"""
+        run = self.current_run
+        if run:
+            run.on_progress(event)
+    
+    def _count_files(self, count):
+        """Registra arquivos alterados pela execução em andamento"""
+        if self.current_run:
+            self.current_run.files_changed += count
+    
     def check_prerequisites(self):
         """Verifica se todos os pré-requisitos para sincronização estão disponíveis"""
         if not self.git_manager or not self.svn_manager:
@@ -33,8 +129,235 @@ class SyncManager:
             
         return True, "Prerequisites met"
     
+    def cancel(self, reason="Synchronization cancelled"):
+        """Cancela a sincronização em andamento, encerrando os processos VCS"""
+        token = self.cancel_token
+        if token and not token.is_cancelled:
+            self.logger.log(f"Cancelling synchronization: {reason}", "WARNING")
+            token.cancel(reason)
+    
+    def is_running(self):
+        """Indica se há uma sincronização em andamento"""
+        return self.cancel_token is not None
+    
+    def _enter_phase(self, name):
+        """Inicia uma fase monitorada, interrompendo se houve cancelamento"""
+        if self.cancel_token:
+            self.cancel_token.raise_if_cancelled()
+        self.watchdog.enter(name)
+        if self.current_run:
+            self.current_run.enter_phase(name)
+    
+    def _run_operation(self, operation, direction):
+        """Executa uma sincronização com token de cancelamento, timeouts e watchdog
+        
+        Cada execução é gravada no histórico de sincronizações.
+        """
+        token = CancellationToken()
+        run = self.current_run = SyncRunRecorder(direction)
+        result = (False, "Synchronization did not finish")
+        timeout = self.config.get("sync.command_timeout_seconds", 600)
+        self.cancel_token = token
+        for manager in (self.git_manager, self.svn_manager):
+            if manager:
+                manager.cancel_token = token
+                manager.command_timeout = timeout
+        
+        try:
+            result = operation()
+            token.raise_if_cancelled()
+            return result
+        except OperationCancelled as e:
+            self.logger.log(f"Synchronization cancelled: {str(e)}", "WARNING")
+            result = (False, f"Synchronization cancelled: {str(e)}")
+            return result
+        finally:
+            self.current_run = None
+            self.watchdog.clear()
+            if self.closed:
+                # Execução que terminou depois de close(): não manter a thread viva
+                self.watchdog.stop()
+            for manager in (self.git_manager, self.svn_manager):
+                if manager:
+                    manager.cancel_token = None
+            if self.git_manager:
+                self.git_manager.invalidate_status()
+            self.cancel_token = None
+            if token.is_cancelled:
+                self._release_working_copy(token)
+            # Por último: uma falha no histórico não pode substituir o resultado
+            try:
+                self._record_run(run, result, token.is_cancelled)
+            except Exception as e:
+                self.logger.log(f"Error recording sync history: {str(e)}", "WARNING")
+    
+    def _record_run(self, run, result, cancelled):
+        """Grava a execução encerrada no histórico"""
+        history = self.get_sync_history()
+        if not history:
+            return
+        
+        finished = run.finish()
+        success, message = result if isinstance(result, tuple) else (bool(result), "")
+        if cancelled:
+            outcome = "cancelled"
+        else:
+            outcome = "success" if success else "failed"
+        history.record(
+            os.path.realpath(self.working_dir) if self.working_dir else "",
+            run.direction,
+            run.started,
+            finished,
+            outcome,
+            error_phase=None if outcome == "success" else run.phase,
+            message=message,
+            files_changed=run.files_changed,
+            bytes=run.bytes,
+            phases=run.phases
+        )
+    
+    def _release_working_copy(self, token):
+        """Deixa a cópia de trabalho em estado conhecido após um cancelamento"""
+        # Processos svn encerrados deixam locks no wc.db - 'svn cleanup' os remove
+        if self.svn_manager and self.svn_manager.is_svn_repo():
+            try:
+                process = self.svn_manager._run(["svn", "cleanup"], timeout=120)
+                if process.returncode == 0:
+                    self.logger.log("SVN working copy cleaned up after cancellation")
+                else:
+                    self.logger.log(f"SVN cleanup failed: {process.stderr.strip()}", "ERROR")
+            except (subprocess.SubprocessError, OSError) as e:
+                self.logger.log(f"SVN cleanup failed: {str(e)}", "ERROR")
+        
+        # Processos git encerrados podem deixar o index.lock para trás. Removê-lo
+        # apenas se um git desta operação foi encerrado e o lock é anterior ao
+        # kill; um lock mais novo pertence a outro processo git
+        killed_at = token.killed_command("git")
+        index_lock = os.path.join(self.working_dir, '.git', 'index.lock')
+        if killed_at is None or not os.path.exists(index_lock):
+            return
+        try:
+            if os.path.getmtime(index_lock) > killed_at:
+                self.logger.log("Git index.lock is newer than the cancelled git process, leaving it", "WARNING")
+                return
+            os.remove(index_lock)
+            self.logger.log("Removed stale Git index.lock after cancellation")
+        except OSError as e:
+            self.logger.log(f"Could not remove Git index.lock: {str(e)}", "ERROR")
+    
+    def _remote_breaker(self, kind):
+        """Circuit breaker do remoto Git ('git') ou SVN ('svn') desta cópia de trabalho
+        
+        A URL é resolvida uma vez por instância; o breaker é compartilhado
+        com outros repositórios que usam o mesmo host.
+        """
+        if kind not in self._remote_keys:
+            url = None
+            try:
+                if kind == "git":
+                    repo = self.git_manager.repo
+                    if repo is not None and "origin" in [r.name for r in repo.remotes]:
+                        url = repo.remotes["origin"].url
+                else:
+                    url = self.svn_manager.svn_url or (self.svn_manager.get_info() or {}).get("url")
+            except Exception as e:
+                self.logger.log(f"Could not resolve {kind} remote URL: {str(e)}", "WARNING")
+            if not url:
+                return None
+            self._remote_keys[kind] = remote_key(kind, url)
+        return get_breaker(self._remote_keys[kind], self.config)
+    
+    def circuit_open_message(self):
+        """Mensagem descrevendo um circuito de remoto aberto (None se ambos estiverem liberados)"""
+        for kind in ("git", "svn"):
+            manager = self.git_manager if kind == "git" else self.svn_manager
+            breaker = self._remote_breaker(kind) if manager else None
+            if breaker and breaker.is_blocking():
+                host = breaker.key.split(':', 1)[1]
+                if breaker.state == breaker.HALF_OPEN:
+                    return f"{kind.upper()} remote {host} is unreachable; a trial connection is in progress"
+                return (f"{kind.upper()} remote {host} is unreachable; "
+                        f"retrying in {int(breaker.retry_after())}s")
+        return None
+    
+    def _with_retry(self, kind, description, operation):
+        """Executa uma fase de rede idempotente com backoff e circuit breaker"""
+        return run_with_retry(operation, description, self.logger, RetryPolicy.from_config(self.config),
+                              breaker=self._remote_breaker(kind), token=self.cancel_token)
+    
+    def _update_git(self):
+        """Fetch/merge do remoto Git, repetindo falhas de rede transitórias"""
+        return self._with_retry("git", "Git update", self.git_manager.sync_with_remote)
+    
+    def _update_svn(self):
+        """Atualiza a cópia de trabalho SVN usando o modo configurado, repetindo falhas de rede transitórias
+        
+        Antes do update, o escopo esparso configurado é aplicado à cópia de
+        trabalho se ela ainda não o tiver (ex.: checkout completo existente).
+        """
+        if self.config.get("sync.svn_targeted_update", True):
+            max_paths = self.config.get("sync.svn_targeted_update_max_paths", 200)
+            update = lambda: self.svn_manager.update_changed_paths(
+                max_paths=max_paths, log_cache=self.get_svn_log_cache())
+        else:
+            update = self.svn_manager.update
+        
+        def operation():
+            success, message = self.svn_manager.ensure_sparse_scope()
+            if not success:
+                return success, message
+            return update()
+        return self._with_retry("svn", "SVN update", operation)
+    
+    def set_dirty_tracking(self, enabled):
+        """Ativa ou desativa o uso dos caminhos informados pelo watcher de arquivos"""
+        with self._dirty_lock:
+            self.dirty_tracking = enabled
+            self.dirty_paths = None
+    
+    def add_dirty_paths(self, paths):
+        """Registra caminhos alterados (None: alterações desconhecidas, exige varredura completa)
+        
+        Também invalida o status do Git em cache, que não reflete mais a
+        árvore de trabalho.
+        """
+        if self.git_manager:
+            self.git_manager.invalidate_status()
+        with self._dirty_lock:
+            if paths is None:
+                self.dirty_paths = None
+            elif self.dirty_paths is not None:
+                self.dirty_paths.update(paths)
+    
+    def _take_dirty_paths(self):
+        """Retira os caminhos acumulados, iniciando um novo conjunto para a próxima sincronização"""
+        with self._dirty_lock:
+            paths = self.dirty_paths
+            self.dirty_paths = set() if self.dirty_tracking else None
+            return paths
+    
+    def _restore_dirty_paths(self, paths):
+        """Devolve caminhos retirados quando a sincronização não foi concluída"""
+        with self._dirty_lock:
+            if paths is None or self.dirty_paths is None:
+                self.dirty_paths = None
+            else:
+                self.dirty_paths.update(paths)
+    
     def sync_git_to_svn(self):
         """Sincroniza alterações do Git para o SVN"""
+        dirty_paths = self._take_dirty_paths()
+        success, message = self._run_operation(lambda: self._sync_git_to_svn(dirty_paths), "git_to_svn")
+        if not success:
+            self._restore_dirty_paths(dirty_paths)
+        return success, message
+    
+    def _sync_git_to_svn(self, dirty_paths=None):
+        """Implementação de sync_git_to_svn (executada dentro de _run_operation)
+        
+        `dirty_paths` restringe o status do Git aos caminhos alterados
+        informados pelo watcher; None varre a árvore inteira.
+        """
         self.logger.log("\n=== Synchronizing Git to SVN ===")
         
         # Verificar pré-requisitos
@@ -45,8 +368,9 @@ class SyncManager:
             
         try:
             # 1. Atualizar do Git remoto primeiro
+            self._enter_phase("git fetch/pull")
             self.logger.log("Updating from Git remote...")
-            git_success, git_message = self.git_manager.sync_with_remote()
+            git_success, git_message = self._update_git()
             
             if not git_success:
                 self.logger.log(f"Error updating from Git: {git_message}", "ERROR")
@@ -55,15 +379,20 @@ class SyncManager:
             self.logger.log("Git update completed successfully")
             
             # 2. Obter lista de arquivos modificados no Git
-            git_files = self.git_manager.get_modified_files()
+            self._enter_phase("git status")
+            if dirty_paths is not None:
+                self.logger.log(f"Checking {len(dirty_paths)} paths reported by the file system watcher")
+            git_files = [f for f in self._git_modified_files(dirty_paths)
+                         if is_path_in_scope(f["path"], self.sparse_include)]
             
             if not git_files:
                 self.logger.log("No files modified in Git repository", "WARNING")
                 return True, "No changes to synchronize"
                 
             # 3. Atualizar do SVN para garantir que estamos trabalhando com a versão mais recente
+            self._enter_phase("svn update")
             self.logger.log("Updating from SVN remote...")
-            svn_update_success, svn_update_message = self.svn_manager.update()
+            svn_update_success, svn_update_message = self._update_svn()
             
             if not svn_update_success:
                 self.logger.log(f"Error updating from SVN: {svn_update_message}", "ERROR")
@@ -72,6 +401,7 @@ class SyncManager:
             self.logger.log("SVN update completed successfully")
             
             # 4. Comparar arquivos modificados para sincronizar apenas o que foi alterado no Git
+            self._enter_phase("plan")
             files_to_sync = []
             
             for git_file in git_files:
@@ -88,6 +418,7 @@ class SyncManager:
                 return True, "No changes to synchronize"
                 
             # 5. Commitar alterações no SVN
+            self._enter_phase("svn commit")
             self.logger.log(f"Committing {len(files_to_sync)} files to SVN...")
             
             # Gerar mensagem de commit com base na configuração
@@ -107,6 +438,7 @@ class SyncManager:
             
             if svn_commit_success:
                 self.logger.log(f"SVN commit completed successfully: {svn_commit_message}", "SUCCESS")
+                self._count_files(len(files_to_sync))
                 return True, "Synchronization completed successfully"
             else:
                 self.logger.log(f"SVN commit failed: {svn_commit_message}", "ERROR")
@@ -116,8 +448,20 @@ class SyncManager:
             self.logger.log(f"Error during Git to SVN synchronization: {str(e)}", "ERROR")
             return False, str(e)
     
+    def _git_modified_files(self, dirty_paths):
+        """Arquivos modificados no Git, restritos aos caminhos sujos quando conhecidos"""
+        if dirty_paths is None or len(dirty_paths) > DIRTY_PATHS_LIMIT:
+            return self.git_manager.get_modified_files()
+        if not dirty_paths:
+            return []
+        return self.git_manager.get_modified_files(paths=dirty_paths)
+    
     def sync_svn_to_git(self):
         """Sincroniza alterações do SVN para o Git"""
+        return self._run_operation(self._sync_svn_to_git, "svn_to_git")
+    
+    def _sync_svn_to_git(self):
+        """Implementação de sync_svn_to_git (executada dentro de _run_operation)"""
         self.logger.log("\n=== Synchronizing SVN to Git ===")
         
         # Verificar pré-requisitos
@@ -125,11 +469,13 @@ class SyncManager:
         if not prereq_met:
             self.logger.log(f"Cannot synchronize: {message}", "ERROR")
             return False, message
-            
+        
+        stashed = False
         try:
             # 1. Atualizar do SVN remoto primeiro
+            self._enter_phase("svn update")
             self.logger.log("Updating from SVN remote...")
-            svn_success, svn_message = self.svn_manager.update()
+            svn_success, svn_message = self._update_svn()
             
             if not svn_success:
                 self.logger.log(f"Error updating from SVN: {svn_message}", "ERROR")
@@ -138,13 +484,16 @@ class SyncManager:
             self.logger.log("SVN update completed successfully")
             
             # 2. Obter lista de arquivos modificados no SVN
-            svn_files = self.svn_manager.get_modified_files()
+            self._enter_phase("svn status")
+            svn_files = [f for f in self.svn_manager.get_modified_files()
+                         if is_path_in_scope(f["path"], self.sparse_include)]
             
             if not svn_files:
                 self.logger.log("No files modified in SVN repository", "WARNING")
                 return True, "No changes to synchronize"
                 
             # 3. Verificar se há alterações conflitantes no Git
+            self._enter_phase("git stash")
             git_status = self.git_manager.get_status()
             
             if git_status["valid"] and "status" in git_status and git_status["status"] == "Modified":
@@ -154,7 +503,7 @@ class SyncManager:
                 if self.config.get("sync.auto_stash", False):
                     self.logger.log("Auto-stashing Git changes...")
                     try:
-                        self.git_manager.repo.git.stash()
+                        self.git_manager.stash()
                         self.logger.log("Git changes stashed successfully")
                         stashed = True
                     except Exception as e:
@@ -167,6 +516,7 @@ class SyncManager:
                 stashed = False
             
             # 4. Preparar arquivos para commit no Git
+            self._enter_phase("plan")
             files_to_sync = []
             
             for svn_file in svn_files:
@@ -183,7 +533,7 @@ class SyncManager:
                 if stashed:
                     self.logger.log("Restoring stashed Git changes...")
                     try:
-                        self.git_manager.repo.git.stash("pop")
+                        self.git_manager.stash("pop")
                         self.logger.log("Git stash restored successfully")
                     except Exception as e:
                         self.logger.log(f"Error restoring Git stash: {str(e)}", "ERROR")
@@ -192,6 +542,7 @@ class SyncManager:
                 return True, "No changes to synchronize"
                 
             # 5. Commitar alterações no Git
+            self._enter_phase("git commit")
             self.logger.log(f"Committing {len(files_to_sync)} files to Git...")
             
             # Gerar mensagem de commit com base na configuração
@@ -205,12 +556,14 @@ class SyncManager:
             
             if git_commit_success:
                 self.logger.log(f"Git commit completed successfully: {git_commit_message}", "SUCCESS")
+                self._count_files(len(files_to_sync))
                 
                 # 6. Enviar alterações para o Git remoto (se configurado)
+                self._enter_phase("git push")
                 if self.config.get("sync.auto_push", False):
                     self.logger.log("Pushing changes to Git remote...")
                     try:
-                        self.git_manager.repo.remotes.origin.push()
+                        self.git_manager.push()
                         self.logger.log("Git push completed successfully", "SUCCESS")
                     except Exception as e:
                         self.logger.log(f"Error pushing to Git remote: {str(e)}", "ERROR")
@@ -220,7 +573,7 @@ class SyncManager:
                 if stashed:
                     self.logger.log("Restoring stashed Git changes...")
                     try:
-                        self.git_manager.repo.git.stash("pop")
+                        self.git_manager.stash("pop")
                         self.logger.log("Git stash restored successfully")
                     except Exception as e:
                         self.logger.log(f"Error restoring Git stash: {str(e)}", "ERROR")
@@ -231,7 +584,7 @@ class SyncManager:
                 if stashed:
                     self.logger.log("Restoring stashed Git changes...")
                     try:
-                        self.git_manager.repo.git.stash("pop")
+                        self.git_manager.stash("pop")
                         self.logger.log("Git stash restored successfully")
                     except Exception as e:
                         self.logger.log(f"Error restoring Git stash: {str(e)}", "ERROR")
@@ -241,10 +594,22 @@ class SyncManager:
                 
         except Exception as e:
             self.logger.log(f"Error during SVN to Git synchronization: {str(e)}", "ERROR")
+            
+            # Não deixar alterações locais presas no stash
+            if stashed:
+                try:
+                    self.git_manager.stash("pop")
+                    self.logger.log("Git stash restored successfully")
+                except Exception as stash_error:
+                    self.logger.log(f"Error restoring Git stash: {str(stash_error)}", "ERROR")
             return False, str(e)
     
     def bidirectional_sync(self):
         """Sincroniza em ambas as direções com detecção de conflitos"""
+        return self._run_operation(self._bidirectional_sync, "bidirectional")
+    
+    def _bidirectional_sync(self):
+        """Implementação de bidirectional_sync (executada dentro de _run_operation)"""
         self.logger.log("\n=== Starting Bidirectional Synchronization ===")
         
         # Verificar pré-requisitos
@@ -252,28 +617,39 @@ class SyncManager:
         if not prereq_met:
             self.logger.log(f"Cannot synchronize: {message}", "ERROR")
             return False, message
-            
+        
+        temp_dir = None
         try:
             # 1. Criar cópia temporária do diretório de trabalho para detecção de conflitos
+            self._enter_phase("snapshot")
             temp_dir = tempfile.mkdtemp(prefix="git_svn_sync_")
             self.logger.log(f"Created temporary directory for conflict detection: {temp_dir}")
             
-            # Copiar todo o diretório (exceto .git e .svn)
-            for item in os.listdir(self.working_dir):
-                if item in ['.git', '.svn']:
-                    continue
-                    
-                source = os.path.join(self.working_dir, item)
-                destination = os.path.join(temp_dir, item)
-                
-                if os.path.isdir(source):
-                    shutil.copytree(source, destination)
+            # Copiar o escopo sincronizado (exceto .git e .svn)
+            for scope_root in self._scope_roots():
+                source_root = os.path.join(self.working_dir, scope_root)
+                if scope_root == '.':
+                    items = [i for i in os.listdir(self.working_dir) if i not in ['.git', '.svn']]
+                    pairs = [(os.path.join(source_root, i), os.path.join(temp_dir, i)) for i in items]
+                elif os.path.exists(source_root):
+                    pairs = [(source_root, os.path.join(temp_dir, scope_root))]
+                    os.makedirs(os.path.dirname(pairs[0][1]), exist_ok=True)
                 else:
-                    shutil.copy2(source, destination)
+                    pairs = []
+                
+                for source, destination in pairs:
+                    if os.path.isdir(source):
+                        shutil.copytree(source, destination, ignore=shutil.ignore_patterns('.svn'))
+                    else:
+                        shutil.copy2(source, destination)
+            
+            # Conteúdo das cópias comprovado pelo índice Git/wc.db (copy2 preserva os mtimes)
+            base_ids = self._working_ids(temp_dir)
             
             # 2. Atualizar do Git remoto
+            self._enter_phase("git fetch/pull")
             self.logger.log("Updating from Git remote...")
-            git_success, git_message = self.git_manager.sync_with_remote()
+            git_success, git_message = self._update_git()
             
             if not git_success:
                 self.logger.log(f"Error updating from Git: {git_message}", "ERROR")
@@ -284,12 +660,14 @@ class SyncManager:
             self.logger.log("Git update completed successfully")
             
             # 3. Detectar alterações do Git (comparando com o temporário)
-            git_changes = self._detect_changes(temp_dir, self.working_dir)
+            self._enter_phase("detect git changes")
+            git_changes = self._detect_changes(temp_dir, self.working_dir, base_ids)
             self.logger.log(f"Detected {len(git_changes)} files changed by Git update")
             
             # 4. Atualizar do SVN remoto
+            self._enter_phase("svn update")
             self.logger.log("Updating from SVN remote...")
-            svn_success, svn_message = self.svn_manager.update()
+            svn_success, svn_message = self._update_svn()
             
             if not svn_success:
                 self.logger.log(f"Error updating from SVN: {svn_message}", "ERROR")
@@ -300,10 +678,12 @@ class SyncManager:
             self.logger.log("SVN update completed successfully")
             
             # 5. Detectar alterações finais (após ambas as atualizações)
-            final_changes = self._detect_changes(temp_dir, self.working_dir)
+            self._enter_phase("detect changes")
+            final_changes = self._detect_changes(temp_dir, self.working_dir, base_ids)
             self.logger.log(f"Detected {len(final_changes)} files changed after both updates")
             
             # 6. Detectar possíveis conflitos
+            self._enter_phase("detect conflicts")
             svn_changes = []
             conflicts = []
             
@@ -315,6 +695,13 @@ class SyncManager:
                     # Alterado apenas pelo SVN
                     svn_changes.append(file_path)
             
+            # Descartar conflitos em que Git e SVN comprovadamente têm o mesmo conteúdo
+            if conflicts and self.identity_index and self.git_manager.repo:
+                agreed = self.identity_index.paths_in_agreement(self.git_manager.repo, conflicts)
+                if agreed:
+                    self.logger.log(f"{len(agreed)} files changed on both sides have identical content")
+                    conflicts = [p for p in conflicts if p.replace(os.sep, '/') not in agreed]
+            
             # Limpar diretório temporário
             shutil.rmtree(temp_dir)
             self.logger.log("Cleaned up temporary directory")
@@ -360,6 +747,7 @@ class SyncManager:
                     return False, "Synchronization encountered conflicts that need manual resolution"
             
             # 8. Se não houver conflitos não resolvidos, commitar alterações
+            self._enter_phase("commit")
             if git_changes and not conflicts:
                 # Commitar no SVN as mudanças do Git
                 self.logger.log("Committing Git changes to SVN...")
@@ -370,6 +758,7 @@ class SyncManager:
                 
                 if svn_commit_success:
                     self.logger.log("SVN commit completed successfully", "SUCCESS")
+                    self._count_files(len(git_changes))
                 else:
                     self.logger.log(f"SVN commit failed: {svn_commit_message}", "ERROR")
             
@@ -383,12 +772,13 @@ class SyncManager:
                 
                 if git_commit_success:
                     self.logger.log("Git commit completed successfully", "SUCCESS")
+                    self._count_files(len(svn_changes))
                     
                     # Push para Git se configurado
                     if self.config.get("sync.auto_push", False):
                         self.logger.log("Pushing changes to Git remote...")
                         try:
-                            self.git_manager.repo.remotes.origin.push()
+                            self.git_manager.push()
                             self.logger.log("Git push completed successfully", "SUCCESS")
                         except Exception as e:
                             self.logger.log(f"Error pushing to Git remote: {str(e)}", "ERROR")
@@ -400,13 +790,43 @@ class SyncManager:
             
         except Exception as e:
             self.logger.log(f"Error during bidirectional synchronization: {str(e)}", "ERROR")
+            if temp_dir and os.path.exists(temp_dir):
+                shutil.rmtree(temp_dir, ignore_errors=True)
             return False, str(e)
     
-    def _detect_changes(self, base_dir, compare_dir):
-        """Detecta arquivos modificados entre dois diretórios"""
+    def _scope_roots(self):
+        """Retorna as raízes relativas a percorrer de acordo com o escopo esparso"""
+        if not self.sparse_include:
+            return ['.']
+        
+        roots = sorted(path for path, _ in parse_sparse_include(self.sparse_include))
+        # Remover raízes contidas em outras para não percorrer a mesma subárvore duas vezes
+        return [r.replace('/', os.sep) for i, r in enumerate(roots)
+                if not any(r.startswith(o + '/') for o in roots[:i])]
+    
+    def _working_ids(self, root=None):
+        """IDs de blob comprovados pelo índice Git/wc.db sem ler os arquivos ({} se indisponível)"""
+        if not self.identity_index:
+            return {}
+        try:
+            return self.identity_index.working_ids(self.git_manager.repo, root)
+        except Exception as e:
+            self.logger.log(f"Could not read content identities: {str(e)}", "WARNING")
+            return {}
+    
+    def _detect_changes(self, base_dir, compare_dir, base_ids=None):
+        """Detecta arquivos modificados entre dois diretórios
+        
+        `base_ids` são os IDs de blob comprovados dos arquivos de `base_dir`
+        (ver _working_ids); arquivos cujo ID também é comprovado em
+        `compare_dir` são comparados pelo ID, sem ler o conteúdo.
+        """
         changes = []
+        compare_ids = self._working_ids() if base_ids and compare_dir == self.working_dir else {}
+        
+        walk_roots = [os.path.join(compare_dir, r) if r != '.' else compare_dir for r in self._scope_roots()]
         
-        for root, dirs, files in os.walk(compare_dir):
+        for root, dirs, files in (entry for walk_root in walk_roots for entry in os.walk(walk_root)):
             # Ignorar diretórios .git e .svn
             if '.git' in dirs:
                 dirs.remove('.git')
@@ -425,12 +845,24 @@ class SyncManager:
                 # Obter path relativo para o arquivo
                 rel_file_path = os.path.relpath(compare_file, compare_dir)
                 
+                # Subárvores com profundidade reduzida: ignorar o que o SVN não busca
+                if self.sparse_include and not is_path_in_scope(rel_file_path, self.sparse_include):
+                    continue
+                
                 # Verificar se o arquivo existe no diretório base
                 if not os.path.exists(base_file):
                     # Arquivo novo ou deletado
                     changes.append(rel_file_path)
                     continue
                 
+                # Conteúdo comprovado dos dois lados: comparar os IDs de blob
+                key = rel_file_path.replace(os.sep, '/')
+                base_id, compare_id = base_ids.get(key) if base_ids else None, compare_ids.get(key)
+                if base_id and compare_id:
+                    if base_id != compare_id:
+                        changes.append(rel_file_path)
+                    continue
+                
                 # Comparar conteúdo
                 try:
                     with open(base_file, 'rb') as f1, open(compare_file, 'rb') as f2:
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+
+import os
+import heapq
+import time
+import itertools
+import threading
+from collections import deque
+
+# Prioridades (menor valor executa primeiro)
+PRIORITY_MANUAL = 0
+PRIORITY_SCHEDULED = 1
+PRIORITY_MAINTENANCE = 2
+
+PRIORITY_NAMES = {
+    PRIORITY_MANUAL: "manual",
+    PRIORITY_SCHEDULED: "scheduled",
+    PRIORITY_MAINTENANCE: "maintenance",
+}
+
+class SyncRequest:
+    """Pedido de execução na fila de uma cópia de trabalho
+
+    Pedidos com a mesma chave que chegam enquanto um deles ainda aguarda
+    são agrupados neste mesmo objeto; todos os solicitantes recebem o
+    mesmo resultado.
+    """
+
+    def __init__(self, key, function, priority, source):
+        """Inicializa o pedido"""
+        self.key = key
+        self.function = function
+        self.priority = priority
+        self.sources = [source]
+        self.enqueued_at = time.monotonic()
+        self.started_at = None
+        self.finished_at = None
+        self.result = None
+        self.error = None
+        self.coalesced = 0
+        self._done = threading.Event()
+        self._callbacks = []
+        self._callbacks_lock = threading.Lock()
+
+    @property
+    def wait_time(self):
+        """Tempo na fila em segundos (até agora, se ainda não começou)"""
+        return (self.started_at or time.monotonic()) - self.enqueued_at
+
+    @property
+    def done(self):
+        """Indica se o pedido já terminou"""
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """Aguarda o término e retorna o resultado da operação
+
+        Exceções da operação são relançadas para o solicitante. Retorna None
+        se o tempo limite expirar.
+        """
+        if not self._done.wait(timeout):
+            return None
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+    def add_done_callback(self, callback):
+        """Chama `callback(request)` quando o pedido terminar (imediatamente, se já terminou)"""
+        with self._callbacks_lock:
+            if not self._done.is_set():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def _finish(self, result=None, error=None):
+        """Registra o resultado e libera quem aguarda"""
+        self.result = result
+        self.error = error
+        self.finished_at = time.monotonic()
+        with self._callbacks_lock:
+            self._done.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+class SyncQueue:
+    """Fila de sincronizações de uma cópia de trabalho com execução única
+
+    Sincronizações manuais (GUI, "Force Sync Now"), agendadas e a
+    manutenção passam por aqui, de modo que nunca duas operações rodam ao
+    mesmo tempo na mesma cópia de trabalho. Pedidos iguais que chegam
+    enquanto outro aguarda são agrupados em uma única execução seguinte,
+    e a ordem respeita manual > agendado > manutenção.
+    """
+
+    WAIT_HISTORY_SIZE = 100
+
+    _queues = {}
+    _queues_lock = threading.Lock()
+
+    @classmethod
+    def for_working_copy(cls, working_dir, logger):
+        """Retorna a fila compartilhada da cópia de trabalho, criando-a sob demanda"""
+        key = os.path.realpath(working_dir)
+        with cls._queues_lock:
+            queue = cls._queues.get(key)
+            if queue is None:
+                queue = cls._queues[key] = cls(key, logger)
+            return queue
+
+    def __init__(self, working_dir, logger):
+        """Inicializa a fila (a thread de execução é criada sob demanda)"""
+        self.working_dir = working_dir
+        self.logger = logger
+
+        self._heap = []
+        self._pending = {}
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._thread = None
+        self.running = None
+
+        # Tempos de espera recentes (segundos) por prioridade
+        self.wait_times = {priority: deque(maxlen=self.WAIT_HISTORY_SIZE) for priority in PRIORITY_NAMES}
+
+    def submit(self, key, function, priority=PRIORITY_SCHEDULED, source=None):
+        """Enfileira `function` sob a chave `key` e retorna o SyncRequest
+
+        Se já houver um pedido com a mesma chave aguardando, ele é
+        reaproveitado: a prioridade sobe para a maior das duas e, se o novo
+        pedido for mais prioritário, sua função substitui a anterior.
+        """
+        source = source or PRIORITY_NAMES.get(priority, str(priority))
+        with self._lock:
+            request = self._pending.get(key)
+            if request is not None:
+                request.coalesced += 1
+                request.sources.append(source)
+                if priority < request.priority:
+                    request.priority = priority
+                    request.function = function
+                    heapq.heappush(self._heap, (priority, next(self._sequence), request))
+                self.logger.log(f"Sync request '{key}' from {source} coalesced with a pending request")
+                return request
+
+            request = SyncRequest(key, function, priority, source)
+            self._pending[key] = request
+            heapq.heappush(self._heap, (priority, next(self._sequence), request))
+
+            if self.running is not None:
+                self.logger.log(f"Sync request '{key}' from {source} queued behind '{self.running.key}'")
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="sync-queue", daemon=True)
+                self._thread.start()
+            return request
+
+    def _next_request(self):
+        """Retira o próximo pedido válido do heap (None se a fila estiver vazia)"""
+        while self._heap:
+            priority, _, request = heapq.heappop(self._heap)
+            # Entradas antigas de pedidos promovidos ou descartados
+            if self._pending.get(request.key) is request and request.priority == priority:
+                del self._pending[request.key]
+                return request
+        return None
+
+    def _run(self):
+        """Função da thread: executa os pedidos um de cada vez"""
+        while True:
+            with self._lock:
+                request = self._next_request()
+                self.running = request
+                if request is None:
+                    self._thread = None
+                    return
+
+            request.started_at = time.monotonic()
+            self.wait_times[request.priority].append(request.wait_time)
+            try:
+                result = request.function()
+            except Exception as e:
+                self.logger.log(f"Error running sync request '{request.key}': {str(e)}", "ERROR")
+                request._finish(error=e)
+            else:
+                request._finish(result=result)
+
+    def discard(self, priorities):
+        """Descarta pedidos pendentes das prioridades indicadas"""
+        with self._lock:
+            discarded = [r for r in self._pending.values() if r.priority in priorities]
+            for request in discarded:
+                del self._pending[request.key]
+        for request in discarded:
+            request._finish(result=(False, "Sync request discarded"))
+        return len(discarded)
+
+    def is_busy(self):
+        """Indica se há uma operação em execução ou aguardando"""
+        with self._lock:
+            return self.running is not None or bool(self._pending)
+
+    def pending(self):
+        """Pedidos aguardando, na ordem em que serão executados"""
+        with self._lock:
+            return sorted(self._pending.values(), key=lambda r: (r.priority, r.enqueued_at))
+
+    def stats(self):
+        """Resumo da fila: operação em execução, pendentes e tempos de espera por prioridade"""
+        waits = {}
+        for priority, times in self.wait_times.items():
+            samples = list(times)
+            if samples:
+                waits[PRIORITY_NAMES[priority]] = {
+                    "count": len(samples),
+                    "average": sum(samples) / len(samples),
+                    "max": max(samples),
+                }
+        running = self.running
+        return {
+            "running": running.key if running else None,
+            "pending": [(r.key, PRIORITY_NAMES.get(r.priority), r.wait_time) for r in self.pending()],
+            "wait_times": waits,
+        }
+
+    def describe(self):
+        """Resume o estado da fila em uma linha"""
+        stats = self.stats()
+        parts = [f"running: {stats['running'] or 'idle'}", f"pending: {len(stats['pending'])}"]
+        for name, wait in stats["wait_times"].items():
+            parts.append(f"{name} wait avg {wait['average']:.1f}s / max {wait['max']:.1f}s")
+        return ", ".join(parts)
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+
+import heapq
+import time
+import itertools
+import threading
+from datetime import datetime, timedelta
+
+# Espera máxima com tarefas de horário fixo: o relógio monotônico não avança
+# durante a suspensão e ignora ajustes do relógio de parede (horário de verão)
+WALL_CLOCK_RESYNC_SECONDS = 60.0
+
+class ScheduledJob:
+    """Tarefa agendada no TimerScheduler
+
+    Os callbacks rodam na thread do agendador e devem ser curtos
+    (tipicamente apenas enfileiram uma operação na SyncQueue).
+    """
+
+    def __init__(self, key, callback, due, owner=None, description="", wall_time=None):
+        """Inicializa a tarefa
+
+        due: instante em time.monotonic(); wall_time: horário local (datetime)
+        das tarefas ancoradas no relógio de parede, para as quais `due` é
+        apenas uma estimativa recalculada pelo agendador.
+        """
+        self.key = key
+        self.callback = callback
+        self.due = due
+        self.owner = owner
+        self.description = description
+        self.wall_time = wall_time
+        self.cancelled = False
+
+    @property
+    def remaining(self):
+        """Segundos até a execução (0 se já venceu)"""
+        return max(0.0, self.due - time.monotonic())
+
+    @property
+    def due_at(self):
+        """Horário de execução como datetime local"""
+        if self.wall_time is not None:
+            return self.wall_time
+        return datetime.now() + timedelta(seconds=self.due - time.monotonic())
+
+class TimerScheduler:
+    """Agendador de tarefas baseado em heap com uma única thread
+
+    Substitui as threads que acordavam a cada poucos segundos para comparar
+    horários: a thread dorme exatamente até a próxima tarefa vencer e é
+    acordada quando uma tarefa é agendada, reagendada ou cancelada. Uma
+    única instância atende todos os repositórios.
+
+    Intervalos (schedule) são contados no relógio monotônico. Tarefas de
+    horário fixo (schedule_at, usadas pelos agendamentos cron) são
+    ancoradas no relógio de parede: enquanto existirem, a thread acorda
+    pelo menos a cada WALL_CLOCK_RESYNC_SECONDS e recalcula seus prazos
+    com datetime.now(), de modo que suspensão e mudanças de horário de
+    verão não as atrasem nem adiantem.
+    """
+
+    def __init__(self, logger=None):
+        """Inicializa o agendador (a thread é criada no primeiro agendamento)"""
+        self.logger = logger
+        self._heap = []
+        self._jobs = {}
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._stopped = False
+
+    def schedule(self, key, callback, delay, owner=None, description=""):
+        """Agenda `callback` para daqui a `delay` segundos
+
+        Uma tarefa existente com a mesma chave é substituída (reagendamento).
+        Retorna o ScheduledJob.
+        """
+        return self._add(ScheduledJob(key, callback, time.monotonic() + max(0.0, delay), owner, description))
+
+    def schedule_at(self, key, callback, when, owner=None, description=""):
+        """Agenda `callback` para o horário local `when` (datetime ingênuo)
+
+        Como schedule(), substitui uma tarefa existente com a mesma chave.
+        """
+        delay = max(0.0, (when - datetime.now()).total_seconds())
+        return self._add(ScheduledJob(key, callback, time.monotonic() + delay, owner, description, wall_time=when))
+
+    def _add(self, job):
+        """Insere uma tarefa no heap, substituindo a de mesma chave"""
+        key = job.key
+        with self._condition:
+            previous = self._jobs.get(key)
+            if previous:
+                previous.cancelled = True
+            self._jobs[key] = job
+            heapq.heappush(self._heap, (job.due, next(self._sequence), job))
+
+            self._stopped = False
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="timer-scheduler", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return job
+
+    def cancel(self, key):
+        """Cancela a tarefa com a chave indicada (se existir)"""
+        with self._condition:
+            job = self._jobs.pop(key, None)
+            if job:
+                job.cancelled = True
+                self._condition.notify()
+        return job is not None
+
+    def cancel_owner(self, owner):
+        """Cancela todas as tarefas de um dono (ex.: o AutoSyncManager de um repositório)"""
+        with self._condition:
+            keys = [key for key, job in self._jobs.items() if job.owner is owner]
+            for key in keys:
+                self._jobs.pop(key).cancelled = True
+            if keys:
+                self._condition.notify()
+        return len(keys)
+
+    def get(self, key):
+        """Retorna a tarefa agendada com a chave indicada, ou None"""
+        with self._condition:
+            return self._jobs.get(key)
+
+    def jobs(self, owner=None):
+        """Tabela das tarefas agendadas, da mais próxima para a mais distante
+
+        Cada linha é um dicionário com key, description, due_at e
+        remaining (segundos). Consulta barata, pensada para a interface.
+        """
+        with self._condition:
+            jobs = [job for job in self._jobs.values() if owner is None or job.owner is owner]
+        return [
+            {"key": job.key, "description": job.description, "due_at": job.due_at, "remaining": job.remaining}
+            for job in sorted(jobs, key=lambda j: j.due)
+        ]
+
+    def stop(self):
+        """Cancela todas as tarefas e encerra a thread"""
+        with self._condition:
+            for job in self._jobs.values():
+                job.cancelled = True
+            self._jobs.clear()
+            self._heap.clear()
+            self._stopped = True
+            self._condition.notify()
+            thread = self._thread
+        if thread:
+            thread.join(timeout=5.0)
+
+    def _reanchor(self):
+        """Recalcula os prazos das tarefas de horário fixo a partir do relógio de parede
+
+        Retorna True se houver alguma tarefa desse tipo (chamado com o lock).
+        """
+        now, monotonic = datetime.now(), time.monotonic()
+        anchored = False
+        moved = False
+        for job in self._jobs.values():
+            if job.wall_time is None:
+                continue
+            anchored = True
+            due = monotonic + max(0.0, (job.wall_time - now).total_seconds())
+            if abs(due - job.due) > 1.0:
+                job.due = due
+                moved = True
+        if moved:
+            self._heap = [(job.due, sequence, job) for _, sequence, job in self._heap]
+            heapq.heapify(self._heap)
+        return anchored
+
+    def _run(self):
+        """Função da thread: dorme até a próxima tarefa vencer e a executa"""
+        while True:
+            with self._condition:
+                while not self._stopped:
+                    anchored = self._reanchor()
+                    # Descartar entradas de tarefas canceladas ou reagendadas
+                    while self._heap and self._heap[0][2].cancelled:
+                        heapq.heappop(self._heap)
+                    if not self._heap:
+                        self._condition.wait()
+                        continue
+                    timeout = self._heap[0][0] - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    if anchored:
+                        timeout = min(timeout, WALL_CLOCK_RESYNC_SECONDS)
+                    self._condition.wait(timeout)
+
+                if self._stopped:
+                    self._thread = None
+                    return
+
+                _, _, job = heapq.heappop(self._heap)
+                if self._jobs.get(job.key) is job:
+                    del self._jobs[job.key]
+
+            try:
+                job.callback()
+            except Exception as e:
+                if self.logger:
+                    self.logger.log(f"Error running scheduled job '{job.key}': {str(e)}", "ERROR")
+
+_default_scheduler = None
+_default_lock = threading.Lock()
+
+def get_scheduler(logger=None):
+    """Retorna o agendador compartilhado pela aplicação"""
+    global _default_scheduler
+    with _default_lock:
+        if _default_scheduler is None:
+            _default_scheduler = TimerScheduler(logger)
+        elif _default_scheduler.logger is None:
+            _default_scheduler.logger = logger
+        return _default_scheduler
@@ -2,11 +2,51 @@
 
 import tkinter as tk
 from tkinter import ttk
-import threading
 import time
 import os
+import random
 from datetime import datetime, timedelta
 
+from core.cancellation import CancellationToken, OperationCancelled
+from core.change_probe import ChangeProbe, SIDES, SYNCED_SIDES
+from core.adaptive_schedule import AdaptiveSyncInterval
+from core.fs_watcher import InotifyWatcher
+from core.maintenance import RepositoryMaintenance, DEFAULT_TASKS
+from core.sync_queue import SyncQueue, PRIORITY_MANUAL, PRIORITY_SCHEDULED, PRIORITY_MAINTENANCE
+from core.timer_scheduler import get_scheduler
+from core.cron import CronExpression
+from features.notifications import get_dispatcher, repo_label
+
+class SyncSchedule:
+    """Agendamento cron de sincronização com direção e opções próprias
+    
+    Definido em auto_sync.schedules, por exemplo:
+    {"name": "business hours", "cron": "*/5 8-18 * * mon-fri", "direction": "git_to_svn"}.
+    A direção "maintenance" agenda a manutenção dos repositórios.
+    """
+    
+    DIRECTIONS = ("bidirectional", "git_to_svn", "svn_to_git", "maintenance")
+    MISFIRE_POLICIES = ("skip", "run_once")
+    
+    def __init__(self, spec):
+        """Valida a definição, lançando ValueError se for inválida"""
+        if not spec.get("cron"):
+            raise ValueError("Schedule without a cron expression")
+        self.cron = CronExpression(spec["cron"])
+        self.name = spec.get("name") or str(self.cron)
+        self.direction = spec.get("direction", "bidirectional")
+        if self.direction not in self.DIRECTIONS:
+            raise ValueError(f"Invalid direction '{self.direction}' in schedule '{self.name}'")
+        self.misfire = spec.get("misfire", "skip")
+        if self.misfire not in self.MISFIRE_POLICIES:
+            raise ValueError(f"Invalid misfire policy '{self.misfire}' in schedule '{self.name}'")
+        self.force = spec.get("force", False)
+        self.next_fire = None
+    
+    def describe(self):
+        """Descrição curta para a tabela de tarefas agendadas"""
+        return f"Schedule '{self.name}': {self.direction} ({self.cron})"
+
 class AutoSyncManager:
     def __init__(self, sync_manager, config_manager, logger):
         """Inicializa o gerenciador de sincronização automática"""
@@ -14,10 +54,33 @@ class AutoSyncManager:
         self.config = config_manager
         self.logger = logger
         
-        self.sync_thread = None
-        self.stop_event = threading.Event()
-        self.next_sync_time = None
+        self.running = False
+        self.schedules = []
+        self.next_sync_reason = None
         self.sync_count = 0
+        self.last_sync_finished = None
+        
+        # Agendador compartilhado por todos os repositórios e fila da cópia de
+        # trabalho (compartilhada com a GUI: uma operação por vez)
+        self.scheduler = get_scheduler(logger)
+        self.queue = SyncQueue.for_working_copy(sync_manager.working_dir, logger)
+        
+        # Notificações de desktop agrupadas entre repositórios, fora da thread de sincronização
+        self.notifier = get_dispatcher(logger, config_manager)
+        
+        # Sonda de alterações que evita sincronizações sem efeito
+        self.change_probe = None
+        
+        # Intervalo adaptativo, estimado a partir do histórico de sondagens
+        self.adaptive_interval = None
+        
+        # Watcher de arquivos que dispara sincronizações Git -> SVN após edições locais
+        self.watcher = None
+        
+        # Manutenção dos repositórios em janelas ociosas
+        self.maintenance = None
+        self.maintenance_token = None
+        self.last_maintenance = None
         
         # Carregar configurações iniciais
         self.enabled = self.config.get("auto_sync.enabled", False)
@@ -25,7 +88,7 @@ class AutoSyncManager:
     
     def start(self):
         """Inicia a sincronização automática"""
-        if self.sync_thread and self.sync_thread.is_alive():
+        if self.running:
             return
         
         self.enabled = self.config.get("auto_sync.enabled", False)
@@ -35,48 +98,410 @@ class AutoSyncManager:
             self.logger.log("Automatic synchronization is disabled", "WARNING")
             return
         
-        self.stop_event.clear()
-        self.sync_thread = threading.Thread(target=self._sync_worker, daemon=True)
-        self.sync_thread.start()
+        self.running = True
+        if self.config.get("auto_sync.watch_changes", False):
+            self._start_watcher()
         
-        self.next_sync_time = datetime.now() + timedelta(minutes=self.interval)
-        self.logger.log(f"Automatic synchronization started. Next sync at {self.next_sync_time.strftime('%H:%M:%S')}")
+        self.adaptive_interval = None
+        self.schedules = self._load_schedules()
+        if self.schedules:
+            for schedule in self.schedules:
+                self._schedule_cron(schedule)
+        else:
+            self._schedule_next()
+        if not any(schedule.direction == "maintenance" for schedule in self.schedules):
+            self._schedule_maintenance_check()
+        
+        if self.next_sync_time is None:
+            self.logger.log("Automatic synchronization started with no upcoming sync", "WARNING")
+            return
+        self.logger.log(f"Automatic synchronization started. Next sync at "
+                        f"{self.next_sync_time.strftime('%H:%M:%S')} ({self.next_sync_reason})")
     
     def stop(self):
         """Para a sincronização automática"""
-        if self.sync_thread and self.sync_thread.is_alive():
-            self.stop_event.set()
-            self.sync_thread.join(timeout=1.0)
+        self._stop_watcher()
+        if self.running:
+            self.running = False
+            self.scheduler.cancel_owner(self)
+            # Pedidos agendados ainda na fila perdem o sentido; os manuais continuam
+            self.queue.discard({PRIORITY_SCHEDULED, PRIORITY_MAINTENANCE})
+            # Interromper uma sincronização em andamento em vez de abandonar a thread
+            self.sync_manager.cancel("Automatic synchronization stopped")
+            if self.maintenance_token:
+                self.maintenance_token.cancel("Automatic synchronization stopped")
             self.logger.log("Automatic synchronization stopped")
     
-    def _sync_worker(self):
-        """Função de trabalho para a thread de sincronização"""
-        self.logger.log("Auto-sync thread started")
+    def _job_key(self, name):
+        """Chave da tarefa no agendador compartilhado (única por cópia de trabalho)"""
+        return (self.queue.working_dir, name)
+    
+    def next_sync_job(self):
+        """Linha da tabela de tarefas da próxima sincronização (intervalo ou cron), ou None"""
+        return next((job for job in self.scheduled_jobs() if job["key"][1].startswith("sync")), None)
+    
+    @property
+    def next_sync_time(self):
+        """Horário da próxima sincronização agendada (None se não houver)"""
+        job = self.next_sync_job()
+        return job["due_at"] if job else None
+    
+    def scheduled_jobs(self):
+        """Tabela das tarefas agendadas deste repositório (ver TimerScheduler.jobs)"""
+        return self.scheduler.jobs(owner=self)
+    
+    def _on_sync_due(self):
+        """Tarefa do agendador: enfileira a sincronização agendada
+        
+        O próximo horário é calculado quando ela terminar, para que o
+        intervalo reflita a sondagem que ela acabou de fazer.
+        """
+        self.next_sync_reason = "sync in progress"
+        self.request_sync().add_done_callback(self._on_scheduled_sync_done)
+    
+    def _on_scheduled_sync_done(self, request):
+        """Agenda a próxima sincronização após o término da atual"""
+        if not self.running:
+            return
+        self._schedule_next()
+        self._schedule_maintenance_check()
+        self.logger.log(f"Next automatic sync at {self.next_sync_time.strftime('%H:%M:%S')} "
+                        f"({self.next_sync_reason})")
+    
+    def _load_schedules(self):
+        """Lê os agendamentos cron da configuração, descartando os inválidos
+        
+        O nome identifica a tarefa no agendador; nomes repetidos (ou
+        agendamentos sem nome com a mesma expressão) recebem um sufixo para
+        que um não substitua o outro.
+        """
+        schedules = []
+        names = set()
+        for spec in self.config.get("auto_sync.schedules", []) or []:
+            try:
+                schedule = SyncSchedule(spec)
+            except (ValueError, TypeError, AttributeError) as e:
+                self.logger.log(f"Ignoring invalid auto-sync schedule {spec!r}: {str(e)}", "ERROR")
+                continue
+            if schedule.name in names:
+                name, suffix = schedule.name, 2
+                while f"{name} #{suffix}" in names:
+                    suffix += 1
+                schedule.name = f"{name} #{suffix}"
+                self.logger.log(f"Duplicate auto-sync schedule name '{name}', using '{schedule.name}'", "WARNING")
+            names.add(schedule.name)
+            schedules.append(schedule)
+        return schedules
+    
+    def _schedule_cron(self, schedule, after=None):
+        """Agenda o próximo disparo de um agendamento cron
+        
+        O disparo é ancorado no relógio de parede (TimerScheduler.schedule_at),
+        pois os horários do cron são locais. `after` é o disparo que acabou de
+        acontecer: o próximo vem depois dele mesmo que o relógio tenha
+        voltado (fim do horário de verão), para não repetir o mesmo horário.
+        """
+        now = datetime.now()
+        schedule.next_fire = schedule.cron.next_after(max(after or now, now))
+        if schedule.next_fire is None:
+            self.logger.log(f"Schedule '{schedule.name}' never fires again", "WARNING")
+            return
         
-        while not self.stop_event.is_set():
-            # Verificar se é hora de sincronizar
-            if datetime.now() >= self.next_sync_time:
-                self._perform_sync()
-                
-                # Calcular próximo tempo de sincronização
-                self.next_sync_time = datetime.now() + timedelta(minutes=self.interval)
-                self.logger.log(f"Next automatic sync at {self.next_sync_time.strftime('%H:%M:%S')}")
-            
-            # Aguardar um pouco (verificar a cada 10 segundos)
-            self.stop_event.wait(10)
+        key = "maintenance" if schedule.direction == "maintenance" else "sync"
+        self.scheduler.schedule_at(
+            self._job_key(f"{key}:{schedule.name}"),
+            lambda: self._on_cron_due(schedule),
+            schedule.next_fire,
+            owner=self,
+            description=schedule.describe()
+        )
+        self._update_schedule_reason()
+    
+    def _update_schedule_reason(self):
+        """Motivo da próxima sincronização: o agendamento cron que dispara primeiro"""
+        upcoming = [s for s in self.schedules if s.next_fire and s.direction != "maintenance"]
+        if upcoming:
+            first = min(upcoming, key=lambda s: s.next_fire)
+            self.next_sync_reason = f"schedule '{first.name}' ({first.cron})"
+    
+    def _on_cron_due(self, schedule):
+        """Tarefa do agendador: dispara um agendamento cron e agenda o próximo
+        
+        Um disparo atrasado além de auto_sync.misfire_grace_seconds (máquina
+        suspensa, sobrecarga) é um misfire: com a política "skip" ele é
+        descartado; com "run_once" roda uma única vez. Em ambos os casos os
+        disparos perdidos não são repetidos e o próximo é calculado a partir
+        de agora.
+        """
+        fired = schedule.next_fire
+        lateness = (datetime.now() - fired).total_seconds()
+        grace = self.config.get("auto_sync.misfire_grace_seconds", 300)
+        run = True
+        if lateness > grace:
+            self.logger.log(f"Schedule '{schedule.name}' missed its {fired.strftime('%H:%M')} run "
+                            f"by {int(lateness)}s (misfire policy: {schedule.misfire})", "WARNING")
+            run = schedule.misfire == "run_once"
+        
+        if run:
+            if schedule.direction == "maintenance":
+                self.queue.submit("maintenance", self.run_maintenance, PRIORITY_MAINTENANCE)
+            else:
+                self.request_sync(force=schedule.force, direction=schedule.direction)
+        self._schedule_cron(schedule, after=fired)
+    
+    def _get_adaptive_interval(self):
+        """Obtém o estimador de intervalo adaptativo, criando-o sob demanda"""
+        working_dir = self.sync_manager.working_dir
+        if self.adaptive_interval is None and working_dir:
+            self.adaptive_interval = AdaptiveSyncInterval(
+                working_dir,
+                self.logger,
+                min_minutes=self.config.get("auto_sync.min_interval_minutes", 5),
+                max_minutes=self.config.get("auto_sync.max_interval_minutes", 120),
+                jitter=self.config.get("auto_sync.jitter_fraction", 0.1)
+            )
+        return self.adaptive_interval
     
-    def _perform_sync(self):
-        """Realiza a sincronização automática"""
+    def _schedule_next(self):
+        """Agenda a próxima sincronização e registra o motivo do horário escolhido"""
+        adaptive = self._get_adaptive_interval() if self.config.get("auto_sync.adaptive_interval", False) else None
+        if adaptive:
+            minutes, reason = adaptive.next_interval(self.interval)
+        else:
+            jitter = self.config.get("auto_sync.jitter_fraction", 0.1)
+            minutes = self.interval * (1 + random.uniform(-jitter, jitter))
+            reason = f"fixed interval of {self.interval} min"
+        
+        self.next_sync_reason = reason
+        self.scheduler.schedule(self._job_key("sync"), self._on_sync_due, minutes * 60,
+                                owner=self, description=f"Automatic sync ({reason})")
+    
+    def _schedule_maintenance_check(self):
+        """Agenda a próxima verificação da janela de manutenção
+        
+        Sem manutenção pendente, a verificação vai direto para o horário em
+        que ela vence; caso contrário, ocorre após `idle_minutes`.
+        """
+        if not self.config.get("maintenance.enabled", True):
+            return
+        
+        delay = self.config.get("maintenance.idle_minutes", 5) * 60
+        maintenance = self._get_maintenance()
+        if maintenance and maintenance.last_run:
+            due = maintenance.last_run + timedelta(hours=self.config.get("maintenance.interval_hours", 24))
+            delay = max(delay, (due - datetime.now()).total_seconds())
+        self.scheduler.schedule(self._job_key("maintenance"), self._on_maintenance_check, delay,
+                                owner=self, description="Repository maintenance check")
+    
+    def _on_maintenance_check(self):
+        """Tarefa do agendador: enfileira a manutenção se o repositório estiver ocioso"""
+        if self._is_maintenance_window():
+            self.queue.submit("maintenance", self.run_maintenance, PRIORITY_MAINTENANCE)
+        self._schedule_maintenance_check()
+    
+    def _start_watcher(self):
+        """Inicia o watcher de arquivos na cópia de trabalho sincronizada"""
+        working_dir = self.sync_manager.working_dir
+        if not working_dir or not os.path.isdir(working_dir):
+            return
+        
+        self.watcher = InotifyWatcher(
+            working_dir,
+            self.logger,
+            self._on_local_changes,
+            debounce=self.config.get("auto_sync.watch_debounce_seconds", 2.0),
+            max_delay=self.config.get("auto_sync.watch_max_delay_seconds", 30.0)
+        )
+        if self.watcher.start():
+            self.sync_manager.set_dirty_tracking(True)
+        else:
+            self.watcher = None
+    
+    def _stop_watcher(self):
+        """Para o watcher de arquivos e volta às varreduras completas"""
+        if self.watcher:
+            self.watcher.stop()
+            self.watcher = None
+            self.sync_manager.set_dirty_tracking(False)
+    
+    def _on_local_changes(self, paths):
+        """Recebe um lote de alterações do watcher (None: varredura completa necessária)
+        
+        Os caminhos sempre entram no conjunto sujo do SyncManager e disparam
+        uma sincronização Git -> SVN (ver _request_local_sync).
+        """
+        self.sync_manager.add_dirty_paths(paths)
+        
+        count = "unknown number of" if paths is None else str(len(paths))
+        self.logger.log(f"Detected {count} changed paths in the working copy, scheduling Git to SVN sync")
+        self._request_local_sync()
+    
+    def _request_local_sync(self):
+        """Enfileira a sincronização Git -> SVN das alterações locais
+        
+        Lotes que chegam durante uma sincronização, ou logo após ela, vêm em
+        grande parte dos próprios fetch/update, mas podem conter edições
+        reais: o pedido é adiado até a cópia de trabalho assentar, em vez de
+        esperar o próximo intervalo. Pedidos repetidos são agrupados pelo
+        agendador (mesma chave) e pela fila.
+        """
+        settle = self.config.get("auto_sync.watch_debounce_seconds", 2.0)
+        delay = None
+        if self.sync_manager.is_running():
+            delay = settle
+        elif self.last_sync_finished:
+            remaining = settle - (datetime.now() - self.last_sync_finished).total_seconds()
+            if remaining > 0:
+                delay = remaining
+        
+        if delay is not None:
+            self.scheduler.schedule(self._job_key("local_changes"), self._request_local_sync, delay,
+                                    owner=self, description="Git to SVN sync after local changes")
+            return
+        self.request_sync(force=True, direction="git_to_svn")
+    
+    def _get_maintenance(self):
+        """Obtém a manutenção da cópia de trabalho sincronizada, criando-a sob demanda"""
+        working_dir = self.sync_manager.working_dir
+        if self.maintenance is None and working_dir and os.path.isdir(os.path.join(working_dir, '.git')):
+            self.maintenance = RepositoryMaintenance(working_dir, self.sync_manager.svn_manager, self.logger)
+        return self.maintenance
+    
+    def _is_maintenance_window(self):
+        """Indica se a manutenção está pendente e o repositório está ocioso
+        
+        Ocioso: nenhuma sincronização em andamento, a última terminou há pelo
+        menos `idle_minutes` e a próxima não começa antes desse mesmo prazo.
+        """
+        if not self.config.get("maintenance.enabled", True) or self.queue.is_busy():
+            return False
+        
+        idle = timedelta(minutes=self.config.get("maintenance.idle_minutes", 5))
+        now = datetime.now()
+        if self.last_sync_finished and now - self.last_sync_finished < idle:
+            return False
+        if self.next_sync_time and self.next_sync_time - now < idle:
+            return False
+        
+        maintenance = self._get_maintenance()
+        return bool(maintenance and maintenance.is_due(self.config.get("maintenance.interval_hours", 24)))
+    
+    def run_maintenance(self):
+        """Executa a manutenção dos repositórios Git e SVN"""
+        maintenance = self._get_maintenance()
+        if not maintenance:
+            return None
+        
+        self.logger.log("\n=== Starting Repository Maintenance ===")
+        self.maintenance_token = CancellationToken()
+        try:
+            self.last_maintenance = maintenance.run(
+                tasks=self.config.get("maintenance.tasks", DEFAULT_TASKS),
+                svn_vacuum=self.config.get("maintenance.svn_vacuum_pristines", True),
+                token=self.maintenance_token,
+                timeout=self.config.get("sync.command_timeout_seconds", 600)
+            )
+            return self.last_maintenance
+        except OperationCancelled as e:
+            self.logger.log(f"Repository maintenance cancelled: {str(e)}", "WARNING")
+            return None
+        except Exception as e:
+            self.logger.log(f"Error during repository maintenance: {str(e)}", "ERROR")
+            return None
+        finally:
+            self.maintenance_token = None
+    
+    def _get_change_probe(self):
+        """Obtém a sonda de alterações, criando-a sob demanda"""
+        sync_manager = self.sync_manager
+        if (self.change_probe is None and sync_manager.git_manager and sync_manager.svn_manager
+                and sync_manager.git_manager.is_git_repo()):
+            self.change_probe = ChangeProbe(sync_manager.git_manager, sync_manager.svn_manager, self.logger)
+        return self.change_probe
+    
+    def _probe_changes(self):
+        """Sonda Git, SVN e alterações locais antes de uma sincronização
+        
+        Retorna o resultado da sondagem, ou None se ela estiver desativada
+        (skip_unchanged e intervalo adaptativo desligados) ou indisponível.
+        A sondagem roda também antes de sincronizações forçadas, pois o
+        estado dos remotos que ela lê é o que fica registrado ao final.
+        """
+        skip_unchanged = self.config.get("auto_sync.skip_unchanged", True)
+        adaptive = self._get_adaptive_interval() if self.config.get("auto_sync.adaptive_interval", False) else None
+        if not skip_unchanged and not adaptive:
+            return None
+        
+        probe = self._get_change_probe()
+        if not probe:
+            return None
+        
+        result = probe.probe()
+        self.logger.log(probe.describe(result))
+        return result
+    
+    def _observe_changes(self, probe_result):
+        """Alimenta o intervalo adaptativo com as alterações contadas pela sondagem
+        
+        Chamado depois da sincronização (ou de pulá-la), para que os commits
+        buscados do remoto Git possam ser contados. Vale para sincronizações
+        agendadas, forçadas e disparadas pelo watcher.
+        """
+        adaptive = self._get_adaptive_interval() if self.config.get("auto_sync.adaptive_interval", False) else None
+        probe = self._get_change_probe()
+        if not (adaptive and probe and probe_result):
+            return
+        try:
+            probe.count_changes(probe_result)
+        except Exception as e:
+            self.logger.log(f"Could not count changes for the adaptive interval: {str(e)}", "WARNING")
+        adaptive.observe(probe_result)
+    
+    def describe_sync_count(self):
+        """Resume as sincronizações desta sessão e as registradas no histórico"""
+        text = f"{self.sync_count} this session"
+        history = self.sync_manager.get_sync_history()
+        if history and self.sync_manager.working_dir:
+            # Consulta barata: soma os rollups diários do repositório
+            text += f", {history.count_runs(os.path.realpath(self.sync_manager.working_dir))} recorded"
+        return text
+    
+    def request_sync(self, force=False, direction=None, priority=PRIORITY_SCHEDULED):
+        """Enfileira uma sincronização automática e retorna o SyncRequest
+        
+        Pedidos para a mesma direção que chegam enquanto outro aguarda são
+        agrupados em uma única execução.
+        """
+        key = direction or self.config.get("sync.direction", "bidirectional")
+        return self.queue.submit(key, lambda: self._perform_sync(force, direction), priority)
+    
+    def _perform_sync(self, force=False, direction=None):
+        """Realiza a sincronização automática
+        
+        force: não pula a sincronização mesmo sem alterações; direction: sobrepõe sync.direction.
+        """
+        # Remoto inacessível: não sondar nem tentar até o circuito liberar um teste
+        circuit_message = self.sync_manager.circuit_open_message()
+        if circuit_message:
+            self.logger.log(f"Automatic synchronization skipped: {circuit_message}", "WARNING")
+            return False, circuit_message
+        
+        probe_result = self._probe_changes()
+        if (not force and probe_result and not probe_result["changed"]
+                and self.config.get("auto_sync.skip_unchanged", True)):
+            self.logger.log("Automatic synchronization skipped: nothing changed since the last sync")
+            self._observe_changes(probe_result)
+            return True, "Nothing changed since the last sync"
+        
         self.sync_count += 1
         self.logger.log(f"\n=== Starting Automatic Synchronization (#{self.sync_count}) ===")
         
         # Obter direção de sincronização das configurações
-        sync_direction = self.config.get("sync.direction", "bidirectional")
+        sync_direction = direction or self.config.get("sync.direction", "bidirectional")
         
+        result = False
+        message = ""
         try:
-            result = False
-            message = ""
-            
             if sync_direction == "git_to_svn":
                 self.logger.log("Auto-sync: Git to SVN")
                 result, message = self.sync_manager.sync_git_to_svn()
@@ -90,6 +515,12 @@ class AutoSyncManager:
             if result:
                 self.logger.log(f"Automatic synchronization completed successfully: {message}", "SUCCESS")
                 
+                # Registrar o estado lido antes da sincronização para a próxima sondagem
+                # (apenas os lados que esta direção sincronizou)
+                probe = self._get_change_probe()
+                if probe and probe_result:
+                    probe.record(probe_result, sides=SYNCED_SIDES.get(sync_direction, SIDES))
+                
                 # Mostrar notificação de desktop se configurado
                 if self.config.get("ui.show_notifications", True):
                     self._show_notification("Sync Successful", "Automatic synchronization completed successfully")
@@ -106,54 +537,16 @@ class AutoSyncManager:
             # Mostrar notificação de desktop para erro
             if self.config.get("ui.show_notifications", True):
                 self._show_notification("Sync Error", f"Error: {str(e)}", error=True)
+            message = str(e)
+        finally:
+            self.last_sync_finished = datetime.now()
+            self._observe_changes(probe_result)
+        
+        return result, message
     
     def _show_notification(self, title, message, error=False):
-        """Mostra uma notificação de desktop"""
-        try:
-            # Verificar plataforma
-            import platform
-            system = platform.system()
-            
-            if system == "Windows":
-                # Windows - usar win10toast
-                try:
-                    from win10toast import ToastNotifier
-                    toaster = ToastNotifier()
-                    toaster.show_toast(
-                        title,
-                        message,
-                        icon_path=None,
-                        duration=5,
-                        threaded=True
-                    )
-                    return
-                except ImportError:
-                    pass
-            
-            elif system == "Darwin":  # macOS
-                # Usar AppleScript
-                try:
-                    import subprocess
-                    script = f'display notification "{message}" with title "{title}"'
-                    subprocess.run(["osascript", "-e", script])
-                    return
-                except Exception:
-                    pass
-            
-            else:  # Linux e outros
-                # Tentar usar notify-send
-                try:
-                    import subprocess
-                    subprocess.run(["notify-send", title, message])
-                    return
-                except Exception:
-                    pass
-            
-            # Fallback - registrar apenas no log
-            self.logger.log(f"Notification: {title} - {message}")
-            
-        except Exception as e:
-            self.logger.log(f"Error showing notification: {str(e)}", "ERROR")
+        """Enfileira uma notificação de desktop (entregue em lote pelo dispatcher)"""
+        self.notifier.notify(repo_label(self.sync_manager.working_dir), title, message, error)
 
 class AutoSyncDialog(tk.Toplevel):
     def __init__(self, parent, auto_sync_manager, config_manager):
@@ -206,9 +599,21 @@ class AutoSyncDialog(tk.Toplevel):
         self.sync_count_label = ttk.Label(status_frame, text="0")
         self.sync_count_label.grid(row=2, column=1, sticky=tk.W, pady=2)
         
+        ttk.Label(status_frame, text="Queue:").grid(row=3, column=0, sticky=tk.W, pady=2)
+        self.queue_label = ttk.Label(status_frame, text="idle", wraplength=300)
+        self.queue_label.grid(row=3, column=1, sticky=tk.W, pady=2)
+        
+        ttk.Label(status_frame, text="Reason:").grid(row=4, column=0, sticky=tk.W, pady=2)
+        self.next_sync_reason_label = ttk.Label(status_frame, text="N/A", wraplength=300)
+        self.next_sync_reason_label.grid(row=4, column=1, sticky=tk.W, pady=2)
+        
+        ttk.Label(status_frame, text="Scheduled:").grid(row=5, column=0, sticky=tk.NW, pady=2)
+        self.scheduled_label = ttk.Label(status_frame, text="None", wraplength=300, justify=tk.LEFT)
+        self.scheduled_label.grid(row=5, column=1, sticky=tk.W, pady=2)
+        
         # Ações
         action_frame = ttk.Frame(status_frame)
-        action_frame.grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=(10, 0))
+        action_frame.grid(row=6, column=0, columnspan=2, sticky=tk.W, pady=(10, 0))
         
         self.start_btn = ttk.Button(action_frame, text="Start Now", command=self.start_sync)
         self.start_btn.pack(side=tk.LEFT)
@@ -278,7 +683,7 @@ class AutoSyncDialog(tk.Toplevel):
             return
         
         # Status atual
-        if self.auto_sync_manager.enabled and self.auto_sync_manager.sync_thread and self.auto_sync_manager.sync_thread.is_alive():
+        if self.auto_sync_manager.enabled and self.auto_sync_manager.running:
             self.status_label.config(text="Enabled and running")
             self.start_btn.config(state=tk.DISABLED)
             self.stop_btn.config(state=tk.NORMAL)
@@ -287,19 +692,24 @@ class AutoSyncDialog(tk.Toplevel):
             self.start_btn.config(state=tk.NORMAL)
             self.stop_btn.config(state=tk.DISABLED)
         
-        # Próxima sincronização
-        if self.auto_sync_manager.next_sync_time:
-            time_left = self.auto_sync_manager.next_sync_time - datetime.now()
-            if time_left.total_seconds() > 0:
-                minutes, seconds = divmod(int(time_left.total_seconds()), 60)
-                self.next_sync_label.config(text=f"{minutes:02d}:{seconds:02d} (at {self.auto_sync_manager.next_sync_time.strftime('%H:%M:%S')})")
-            else:
-                self.next_sync_label.config(text="Due now")
+        # Próxima sincronização e demais tarefas, lidas da tabela do agendador
+        jobs = self.auto_sync_manager.scheduled_jobs()
+        sync_job = self.auto_sync_manager.next_sync_job()
+        if sync_job:
+            minutes, seconds = divmod(int(sync_job["remaining"]), 60)
+            self.next_sync_label.config(text=f"{minutes:02d}:{seconds:02d} (at {sync_job['due_at'].strftime('%H:%M:%S')})")
         else:
             self.next_sync_label.config(text="N/A")
+        self.scheduled_label.config(text="\n".join(
+            f"{job['due_at'].strftime('%H:%M:%S')}  {job['description']}" for job in jobs
+        ) or "None")
+        self.next_sync_reason_label.config(text=self.auto_sync_manager.next_sync_reason or "N/A")
+        
+        # Contador de sincronizações (sessão atual e total gravado no histórico)
+        self.sync_count_label.config(text=self.auto_sync_manager.describe_sync_count())
         
-        # Contador de sincronizações
-        self.sync_count_label.config(text=str(self.auto_sync_manager.sync_count))
+        # Fila de sincronização (operação em execução, pendentes e tempos de espera)
+        self.queue_label.config(text=self.auto_sync_manager.queue.describe())
         
         # Atualizar novamente em 1 segundo
         self.after(1000, self.update_status)
@@ -346,4 +756,4 @@ class AutoSyncDialog(tk.Toplevel):
     
     def force_sync(self):
         """Força uma sincronização imediata"""
-        threading.Thread(target=self.auto_sync_manager._perform_sync, daemon=True).start()
\ No newline at end of file
+        self.auto_sync_manager.request_sync(force=True, priority=PRIORITY_MANUAL)
\ No newline at end of file
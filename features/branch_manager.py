@@ -141,8 +141,8 @@ class BranchManagerDialog(tk.Toplevel):
             for branch in self.remote_branches:
                 self.remote_listbox.insert(tk.END, branch)
             
-            # Destacar branch atual
-            git_status = self.git_manager.get_status()
+            # Destacar branch atual (reaproveitando o snapshot de status em cache)
+            git_status = self.git_manager.get_status(self.git_manager.get_cached_status_snapshot())
             if git_status["valid"] and "branch" in git_status:
                 self.current_branch = git_status["branch"]
                 self.current_branch_label.config(text=self.current_branch)
@@ -207,7 +207,7 @@ class BranchManagerDialog(tk.Toplevel):
             
             # Fazer checkout
             self.logger.log(f"Checking out branch '{branch_name}'...")
-            self.git_manager.repo.git.checkout(branch_name)
+            self.git_manager.checkout(branch_name)
             self.logger.log(f"Switched to branch '{branch_name}'", "SUCCESS")
             
             # Atualizar interface
@@ -352,7 +352,7 @@ class BranchManagerDialog(tk.Toplevel):
             if messagebox.askyesno("Local Branch Exists", 
                                f"A local branch '{branch_name}' already exists. Checkout the local branch?"):
                 try:
-                    self.git_manager.repo.git.checkout(branch_name)
+                    self.git_manager.checkout(branch_name)
                     self.logger.log(f"Switched to branch '{branch_name}'", "SUCCESS")
                     self.refresh_branches()
                 except Exception as e:
@@ -363,7 +363,7 @@ class BranchManagerDialog(tk.Toplevel):
         # Criar branch de rastreamento
         try:
             self.logger.log(f"Creating tracking branch for '{remote_branch}'...")
-            self.git_manager.repo.git.checkout('-b', branch_name, remote_branch)
+            self.git_manager.checkout('-b', branch_name, remote_branch)
             self.logger.log(f"Switched to new branch '{branch_name}' tracking '{remote_branch}'", "SUCCESS")
             
             # Atualizar interface
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+import os
+import time
+import queue
+import platform
+import threading
+import subprocess
+
+class NotificationDispatcher:
+    """Entrega notificações de desktop em uma thread própria, agrupadas e com limite por repositório
+
+    As sincronizações apenas enfileiram eventos (notify). A thread junta os
+    eventos que chegam em uma janela de `window` segundos e mostra uma
+    única notificação ("12 repos synced, 1 failed"). Cada repositório
+    notifica no máximo uma vez a cada `repo_interval` segundos por tipo de
+    resultado (sucesso ou falha); eventos acima do limite apenas entram na
+    contagem do log. Com a GUI aberta, as notificações usam a bandeja do
+    sistema do Qt; caso contrário, notify-send/osascript/win10toast.
+    """
+
+    def __init__(self, logger, window=10.0, repo_interval=300.0):
+        """Inicializa o dispatcher (a thread é criada na primeira notificação)"""
+        self.logger = logger
+        self.window = window
+        self.repo_interval = repo_interval
+        self.tray = None
+
+        self._events = queue.Queue()
+        self._last_shown = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def set_tray(self, show):
+        """Registra (ou remove, com None) a função da bandeja: show(title, message, error)
+
+        A função é chamada na thread do dispatcher; na GUI ela deve apenas
+        emitir um sinal Qt.
+        """
+        self.tray = show
+
+    def notify(self, repo, title, message, error=False):
+        """Enfileira uma notificação (não bloqueia a thread de sincronização)"""
+        self._events.put((repo, title, message, error))
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="notifications", daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        """Encerra a thread após entregar o lote pendente"""
+        with self._lock:
+            thread = self._thread
+            if thread is None or not thread.is_alive():
+                return
+            self._events.put(None)
+        thread.join(timeout=5.0)
+
+    def _run(self):
+        """Função da thread: agrupa eventos por janela e os entrega"""
+        while True:
+            try:
+                event = self._events.get(timeout=60)
+            except queue.Empty:
+                # Ociosa: encerrar a thread (notify cria outra quando necessário)
+                with self._lock:
+                    if self._events.empty():
+                        self._thread = None
+                        return
+                continue
+            if event is None:
+                return
+
+            batch = [event]
+            deadline = time.monotonic() + self.window
+            stopping = False
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    event = self._events.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if event is None:
+                    stopping = True
+                    break
+                batch.append(event)
+
+            self._deliver(batch)
+            if stopping:
+                return
+
+    def _rate_limited(self, batch):
+        """Remove eventos de repositórios que já notificaram recentemente"""
+        now = time.monotonic()
+        allowed = []
+        for repo, title, message, error in batch:
+            key = (repo, error)
+            last = self._last_shown.get(key)
+            if last is not None and now - last < self.repo_interval:
+                continue
+            self._last_shown[key] = now
+            allowed.append((repo, title, message, error))
+        return allowed
+
+    def _deliver(self, batch):
+        """Agrega o lote em uma notificação e a mostra"""
+        events = self._rate_limited(batch)
+        if len(events) < len(batch):
+            self.logger.log(f"{len(batch) - len(events)} notifications suppressed by the per-repository rate limit")
+        if not events:
+            return
+
+        if len(events) == 1:
+            repo, title, message, error = events[0]
+            title = f"{title} ({repo})" if repo else title
+        else:
+            failed = sorted({repo for repo, _, _, error in events if error})
+            synced = len({repo for repo, _, _, error in events if not error})
+            parts = []
+            if synced:
+                parts.append(f"{synced} repos synced")
+            if failed:
+                parts.append(f"{len(failed)} failed: {', '.join(failed[:3])}" + ("..." if len(failed) > 3 else ""))
+            title = "Git-SVN Sync"
+            message = ", ".join(parts)
+            error = bool(failed)
+
+        self._show(title, message, error)
+
+    def _show(self, title, message, error=False):
+        """Mostra a notificação na bandeja do Qt ou com a ferramenta da plataforma"""
+        try:
+            tray = self.tray
+            if tray:
+                tray(title, message, error)
+                return
+
+            # Verificar plataforma
+            system = platform.system()
+
+            if system == "Windows":
+                # Windows - usar win10toast
+                try:
+                    from win10toast import ToastNotifier
+                    toaster = ToastNotifier()
+                    toaster.show_toast(
+                        title,
+                        message,
+                        icon_path=None,
+                        duration=5,
+                        threaded=True
+                    )
+                    return
+                except ImportError:
+                    pass
+
+            elif system == "Darwin":  # macOS
+                # Usar AppleScript
+                try:
+                    script = f'display notification "{message}" with title "{title}"'
+                    subprocess.run(["osascript", "-e", script])
+                    return
+                except Exception:
+                    pass
+
+            else:  # Linux e outros
+                # Tentar usar notify-send
+                try:
+                    subprocess.run(["notify-send", title, message])
+                    return
+                except Exception:
+                    pass
+
+            # Fallback - registrar apenas no log
+            self.logger.log(f"Notification: {title} - {message}")
+
+        except Exception as e:
+            self.logger.log(f"Error showing notification: {str(e)}", "ERROR")
+
+_default_dispatcher = None
+_default_lock = threading.Lock()
+
+def get_dispatcher(logger, config=None):
+    """Retorna o dispatcher de notificações compartilhado por todos os repositórios"""
+    global _default_dispatcher
+    with _default_lock:
+        if _default_dispatcher is None:
+            _default_dispatcher = NotificationDispatcher(
+                logger,
+                window=config.get("notifications.window_seconds", 10) if config else 10,
+                repo_interval=config.get("notifications.repo_interval_seconds", 300) if config else 300
+            )
+        return _default_dispatcher
+
+def repo_label(working_dir):
+    """Nome curto de um repositório para as notificações"""
+    return os.path.basename(os.path.normpath(working_dir)) if working_dir else ""
@@ -24,6 +24,7 @@ setup(
         "optional": [
             "pygments>=2.12.0",  # Para destacar sintaxe
             "win10toast>=0.9.0;platform_system=='Windows'",  # Notificações no Windows
+            "pygit2>=1.12.0",  # Backend libgit2 para leituras Git
         ],
     },
     entry_points={
@@ -37,7 +38,6 @@ setup(
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
@@ -45,5 +45,5 @@ setup(
         "Topic :: Software Development :: Version Control :: Git",
         "Topic :: Software Development :: Version Control :: SVN",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.8",
 )
\ No newline at end of file
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from datetime import datetime
+
+from core.cron import CronExpression
+
+class CronParseTest(unittest.TestCase):
+
+    def test_fields(self):
+        cron = CronExpression("*/15 8-18/2 1,15 jan-mar mon-fri")
+        self.assertEqual(cron.minutes, {0, 15, 30, 45})
+        self.assertEqual(cron.hours, {8, 10, 12, 14, 16, 18})
+        self.assertEqual(cron.days, {1, 15})
+        self.assertEqual(cron.months, {1, 2, 3})
+        self.assertEqual(cron.weekdays, {1, 2, 3, 4, 5})
+
+    def test_sunday_as_seven(self):
+        self.assertEqual(CronExpression("0 0 * * 7").weekdays, {0})
+
+    def test_aliases(self):
+        self.assertEqual(CronExpression("@hourly").minutes, {0})
+        self.assertEqual(CronExpression("@daily").hours, {0})
+
+    def test_start_with_step(self):
+        self.assertEqual(CronExpression("5/20 * * * *").minutes, {5, 25, 45})
+
+    def test_invalid_expressions(self):
+        for expression in ("* * * *", "60 * * * *", "* 24 * * *", "5-1 * * * *", "*/0 * * * *",
+                           "* * * foo *", "a b c d e"):
+            with self.subTest(expression=expression):
+                with self.assertRaises(ValueError):
+                    CronExpression(expression)
+
+class CronNextAfterTest(unittest.TestCase):
+
+    def assertNext(self, expression, moment, expected):
+        self.assertEqual(CronExpression(expression).next_after(moment), expected)
+
+    def test_strictly_after(self):
+        self.assertNext("30 9 * * *", datetime(2026, 3, 2, 9, 30), datetime(2026, 3, 3, 9, 30))
+        self.assertNext("30 9 * * *", datetime(2026, 3, 2, 9, 29, 59), datetime(2026, 3, 2, 9, 30))
+
+    def test_every_five_minutes(self):
+        self.assertNext("*/5 * * * *", datetime(2026, 3, 2, 10, 7, 12), datetime(2026, 3, 2, 10, 10))
+
+    def test_rolls_over_hour_day_and_year(self):
+        self.assertNext("0 * * * *", datetime(2026, 3, 2, 23, 30), datetime(2026, 3, 3, 0, 0))
+        self.assertNext("0 0 1 1 *", datetime(2026, 6, 1), datetime(2027, 1, 1))
+
+    def test_weekdays(self):
+        # 2026-03-06 é uma sexta-feira
+        self.assertNext("0 9 * * mon-fri", datetime(2026, 3, 6, 10, 0), datetime(2026, 3, 9, 9, 0))
+
+    def test_day_of_month_or_weekday(self):
+        # Ambos restritos: basta um coincidir (dia 13 ou sexta-feira)
+        self.assertNext("0 0 13 * fri", datetime(2026, 3, 1), datetime(2026, 3, 6))
+
+    def test_leap_day(self):
+        self.assertNext("0 0 29 2 *", datetime(2026, 3, 1), datetime(2028, 2, 29))
+
+    def test_impossible_date(self):
+        self.assertIsNone(CronExpression("0 0 31 2 *").next_after(datetime(2026, 1, 1)))
+
+if __name__ == "__main__":
+    unittest.main()
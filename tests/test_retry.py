@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from unittest import mock
+
+from core.cancellation import CancellationToken, OperationCancelled
+from core.retry import CircuitBreaker, RetryPolicy, is_transient_error, remote_key, run_with_retry
+
+NETWORK_ERROR = "fatal: unable to access 'https://h/': Could not resolve host: h"
+
+class _NullLogger:
+    def log(self, message, level="INFO"):
+        pass
+
+class _Clock:
+    """Relógio controlado para substituir time.monotonic"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+class CircuitBreakerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = _Clock()
+        patcher = mock.patch("core.retry.time.monotonic", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.breaker = CircuitBreaker("git:h", failure_threshold=3, reset_timeout=60)
+
+    def _open(self):
+        for _ in range(3):
+            self.breaker.record_failure()
+
+    def test_opens_after_threshold(self):
+        self.assertFalse(self.breaker.record_failure())
+        self.assertFalse(self.breaker.record_failure())
+        self.assertTrue(self.breaker.record_failure())
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(self.breaker.allow())
+        self.assertTrue(self.breaker.is_blocking())
+
+    def test_success_resets_failure_count(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.assertFalse(self.breaker.record_failure())
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+
+    def test_half_open_allows_single_trial(self):
+        self._open()
+        self.clock.now += 60
+        self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertTrue(self.breaker.allow())
+        self.assertFalse(self.breaker.allow())
+        self.assertTrue(self.breaker.is_blocking())
+
+    def test_trial_success_closes(self):
+        self._open()
+        self.clock.now += 60
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        self.assertTrue(self.breaker.allow())
+
+    def test_trial_failure_reopens(self):
+        self._open()
+        self.clock.now += 60
+        self.assertTrue(self.breaker.allow())
+        self.assertTrue(self.breaker.record_failure())
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        self.assertAlmostEqual(self.breaker.retry_after(), 60)
+
+    def test_release_frees_trial(self):
+        self._open()
+        self.clock.now += 60
+        self.assertTrue(self.breaker.allow())
+        self.breaker.release()
+        self.assertTrue(self.breaker.allow())
+
+class RunWithRetryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = _Clock()
+        patcher = mock.patch("core.retry.time.monotonic", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.policy = RetryPolicy(max_attempts=3, base_delay=0, max_delay=0, jitter=0)
+        self.breaker = CircuitBreaker("git:h", failure_threshold=3, reset_timeout=60)
+
+    def test_retries_transient_failures(self):
+        results = iter([(False, NETWORK_ERROR), (True, "ok")])
+        self.assertEqual(run_with_retry(lambda: next(results), "op", _NullLogger(), self.policy, self.breaker),
+                         (True, "ok"))
+        self.assertEqual(self.breaker.failures, 0)
+
+    def test_does_not_retry_other_failures(self):
+        calls = []
+        def operation():
+            calls.append(1)
+            return False, "CONFLICT (content): Merge conflict in a.txt"
+        result = run_with_retry(operation, "op", _NullLogger(), self.policy, self.breaker)
+        self.assertEqual(result, (False, "CONFLICT (content): Merge conflict in a.txt"))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+
+    def test_open_circuit_skips_operation(self):
+        run_with_retry(lambda: (False, NETWORK_ERROR), "op", _NullLogger(), self.policy, self.breaker)
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        operation = mock.Mock(return_value=(True, "ok"))
+        success, message = run_with_retry(operation, "op", _NullLogger(), self.policy, self.breaker)
+        self.assertFalse(success)
+        self.assertIn("circuit open", message)
+        operation.assert_not_called()
+
+    def test_exception_during_trial_releases_breaker(self):
+        run_with_retry(lambda: (False, NETWORK_ERROR), "op", _NullLogger(), self.policy, self.breaker)
+        self.clock.now += 60
+
+        def cancelled():
+            raise OperationCancelled("Synchronization cancelled")
+        with self.assertRaises(OperationCancelled):
+            run_with_retry(cancelled, "op", _NullLogger(), self.policy, self.breaker)
+
+        self.assertFalse(self.breaker.is_blocking())
+        self.assertEqual(run_with_retry(lambda: (True, "ok"), "op", _NullLogger(), self.policy, self.breaker),
+                         (True, "ok"))
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+
+    def test_cancellation_interrupts_backoff(self):
+        token = CancellationToken()
+        token.cancel("stop")
+        policy = RetryPolicy(max_attempts=3, base_delay=30, max_delay=30, jitter=0)
+        with self.assertRaises(OperationCancelled):
+            run_with_retry(lambda: (False, NETWORK_ERROR), "op", _NullLogger(), policy, token=token)
+
+class HelpersTest(unittest.TestCase):
+
+    def test_transient_errors(self):
+        self.assertTrue(is_transient_error(NETWORK_ERROR))
+        self.assertTrue(is_transient_error("svn: E170013: Unable to connect to a repository at URL"))
+        self.assertFalse(is_transient_error("svn: E155015: Commit failed: conflict"))
+        self.assertFalse(is_transient_error(None))
+
+    def test_remote_key(self):
+        self.assertEqual(remote_key("svn", "https://svn.example.com/repo/trunk"), "svn:svn.example.com")
+        self.assertEqual(remote_key("git", "git@github.com:org/repo.git"), "git:github.com")
+        self.assertIsNone(remote_key("git", ""))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -353,9 +353,10 @@ class MainWindow:
             messagebox.showerror("Error", "Git repository not initialized")
             return
         
-        # Mostrar diff para cada arquivo selecionado (limite a 5 por vez)
+        # Mostrar diff para cada arquivo selecionado (limite a 5 por vez, um único status)
+        diffs = self.git_manager.get_diffs(selected_files[:5])
         for file_path in selected_files[:5]:
-            diff_data = self.git_manager.get_diff(file_path)
+            diff_data = diffs.get(file_path)
             
             if diff_data:
                 DiffViewer(self.root, f"Diff: {file_path}", file_path, diff_data)
@@ -103,6 +103,9 @@ class BranchManagerDialog(QDialog):
         self.current_status_label = QLabel("...")
         current_layout.addRow("Status:", self.current_status_label)
         
+        self.current_tracking_label = QLabel("...")
+        current_layout.addRow("Tracking:", self.current_tracking_label)
+        
         main_layout.addWidget(current_group)
         
         # Frame de ações
@@ -163,24 +166,25 @@ class BranchManagerDialog(QDialog):
             
         self.logger.log("Fetching branches...")
         
-        # Iniciar thread para obter branches
-        worker = WorkerThread(self.git_manager.get_branches)
+        # Iniciar thread para obter branches e status em uma única consulta
+        worker = WorkerThread(self._load_branches)
         worker.finished.connect(self._on_branches_fetched)
         worker.log.connect(self.logger.log)
         worker.start()
-        
-        # Também atualizar status do Git
-        status_worker = WorkerThread(self.git_manager.get_status)
-        status_worker.finished.connect(self._on_status_fetched)
-        status_worker.log.connect(self.logger.log)
-        status_worker.start()
+    
+    def _load_branches(self):
+        """Obtém a tabela de branches e o status (reaproveitando o snapshot em cache)"""
+        table = self.git_manager.get_branch_table()
+        status = self.git_manager.get_status(self.git_manager.get_cached_status_snapshot())
+        return table, status
     
     @pyqtSlot(bool, object)
     def _on_branches_fetched(self, success, result):
         """Callback quando branches são obtidas"""
         if success and isinstance(result, tuple) and len(result) == 2:
             # Descompactar resultado
-            self.local_branches, self.remote_branches = result
+            table, status = result
+            self.local_branches, self.remote_branches = table.names()
             
             # Atualizar listbox de branches locais
             self.local_list.clear()
@@ -190,23 +194,30 @@ class BranchManagerDialog(QDialog):
             self.remote_list.clear()
             self.remote_list.addItems(self.remote_branches)
             
+            # Detalhes de cada branch (upstream, ahead/behind, tip, data) como dica
+            for list_widget, branches in ((self.local_list, table.local), (self.remote_list, table.remote)):
+                for row in range(list_widget.count()):
+                    item = list_widget.item(row)
+                    branch = branches[item.text()]
+                    date = branch.date.strftime("%Y-%m-%d %H:%M") if branch.date else "unknown"
+                    item.setToolTip(f"{branch.describe()}\nTip: {branch.tip[:10]}\nLast commit: {date}")
+            
+            # Atualizar informações da branch atual
+            if table.current:
+                self.current_branch = table.current
+                self.current_branch_label.setText(self.current_branch)
+                self.current_tracking_label.setText(table.local[table.current].describe())
+            
+            if status.get("valid", False):
+                self.current_status_label.setText(status.get("status", "Unknown"))
+            
             # Destacar branch atual se conhecida
-            if self.current_branch and self.current_branch in self.local_branches:
+            if self.current_branch and self.current_branch in table.local:
                 # Encontrar e selecionar o item
                 items = self.local_list.findItems(self.current_branch, Qt.MatchFlag.MatchExactly)
                 if items:
                     self.local_list.setCurrentItem(items[0])
     
-    @pyqtSlot(bool, object)
-    def _on_status_fetched(self, success, result):
-        """Callback quando status é obtido"""
-        if success and isinstance(result, dict) and result.get("valid", False):
-            # Atualizar informações da branch atual
-            if "branch" in result:
-                self.current_branch = result["branch"]
-                self.current_branch_label.setText(self.current_branch)
-                self.current_status_label.setText(result.get("status", "Unknown"))
-    
     def on_local_branch_select(self):
         """Manipula a seleção de uma branch local"""
         # Limpar seleção na lista de branches remotas
@@ -250,7 +261,7 @@ class BranchManagerDialog(QDialog):
         self.logger.log(f"Checking out branch '{branch_name}'...")
         
         try:
-            worker = WorkerThread(self.git_manager.repo.git.checkout, branch_name)
+            worker = WorkerThread(self.git_manager.checkout, branch_name)
             worker.finished.connect(lambda success, result: self._on_checkout_completed(success, result, branch_name))
             worker.log.connect(self.logger.log)
             worker.start()
@@ -438,7 +449,7 @@ class BranchManagerDialog(QDialog):
         self.logger.log(f"Creating tracking branch for '{remote_branch}'...")
         
         try:
-            worker = WorkerThread(self.git_manager.repo.git.checkout, '-b', branch_name, remote_branch)
+            worker = WorkerThread(self.git_manager.checkout, '-b', branch_name, remote_branch)
             worker.finished.connect(lambda success, result: self._on_remote_checkout_completed(success, result, branch_name, remote_branch))
             worker.log.connect(self.logger.log)
             worker.start()
@@ -449,7 +460,7 @@ class BranchManagerDialog(QDialog):
     def checkout_local_branch(self, branch_name):
         """Faz checkout de uma branch local"""
         try:
-            worker = WorkerThread(self.git_manager.repo.git.checkout, branch_name)
+            worker = WorkerThread(self.git_manager.checkout, branch_name)
             worker.finished.connect(lambda success, result: self._on_checkout_completed(success, result, branch_name))
             worker.log.connect(self.logger.log)
             worker.start()
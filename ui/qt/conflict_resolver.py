@@ -97,7 +97,9 @@ class ConflictResolver(QDialog):
             # Versão Git (versão HEAD)
             try:
                 if self.git_manager and self.git_manager.repo:
-                    git_content = self.git_manager.repo.git.show(f"HEAD:{self.file_path}")
+                    git_content = self.git_manager.read_file(self.file_path, "HEAD")
+                    if git_content is None:
+                        raise ValueError(f"'{self.file_path}' does not exist in HEAD")
                     self.git_content = git_content
                 else:
                     self.git_content = "Git content not available"
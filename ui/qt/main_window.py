@@ -12,7 +12,7 @@ from PyQt6.QtWidgets import (QMainWindow, QApplication, QWidget, QVBoxLayout, QH
                              QLabel, QPushButton, QToolBar, QStatusBar, QFileDialog,
                              QTreeWidget, QTreeWidgetItem, QTextEdit, QSplitter, QMessageBox,
                              QTabWidget, QMenu, QMenuBar, QComboBox, QHeaderView, QGroupBox,
-                             QDialog)
+                             QDialog, QSystemTrayIcon)
 from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QSize, QThread
 from PyQt6.QtGui import QIcon, QAction, QFont, QColor, QTextCharFormat
 
@@ -20,6 +20,10 @@ from utils.logger import LogManager
 from core.git_manager import GitManager
 from core.svn_manager import SVNManager
 from core.sync_manager import SyncManager
+from core.sync_queue import SyncQueue, PRIORITY_MANUAL
+from core.progress import ProgressReporter
+from core.async_executor import get_executor
+from core.timer_scheduler import get_scheduler
 from ui.qt.commit_dialog import CommitDialog
 from ui.qt.settings_dialog import SettingsDialog
 from ui.qt.diff_viewer import DiffViewer
@@ -30,6 +34,7 @@ from ui.qt.task_integration_dialog import TaskIntegrationDialog
 from features.commit_templates import CommitTemplateManager
 from features.task_integration import TaskIntegrationManager
 from features.auto_sync import AutoSyncManager
+from features.notifications import get_dispatcher
 from ui.qt.resources import get_icon, setup_application_style
 
 
@@ -64,10 +69,17 @@ class WorkerThread(QThread):
 class MainWindow(QMainWindow):
     """Janela principal da aplicação usando Qt6"""
     
+    # Eventos de progresso emitidos pelas threads de trabalho
+    progress_event = pyqtSignal(dict)
+    
+    # Notificações entregues pelo dispatcher (título, mensagem, erro)
+    notification_requested = pyqtSignal(str, str, bool)
+    
     def __init__(self, config_manager):
         super().__init__()
         
         self.config = config_manager
+        self.progress_event.connect(self._on_progress_event)
         
         # Configurar variáveis
         self.git_repo_url = self.config.get('git_repo_url', '')
@@ -86,6 +98,7 @@ class MainWindow(QMainWindow):
         
         # Criar a interface
         self.create_ui()
+        self._setup_tray()
         
         # Atualizar estado inicial
         self.update_status()
@@ -115,6 +128,7 @@ class MainWindow(QMainWindow):
                 self.logger, 
                 self.config
             )
+            self._attach_progress_listeners()
         else:
             self.git_manager = None
             self.svn_manager = None
@@ -134,6 +148,42 @@ class MainWindow(QMainWindow):
         else:
             self.auto_sync_manager = None
     
+    def _setup_tray(self):
+        """Cria o ícone da bandeja e direciona para ele as notificações de sincronização"""
+        self.tray_icon = None
+        if not QSystemTrayIcon.isSystemTrayAvailable():
+            return
+        
+        self.tray_icon = QSystemTrayIcon(get_icon("sync"), self)
+        self.tray_icon.setToolTip("Git-SVN Sync Tool")
+        self.tray_icon.show()
+        
+        # O dispatcher roda em outra thread: o sinal entrega a mensagem na thread da GUI
+        self.notification_requested.connect(self._show_tray_message)
+        get_dispatcher(self.logger, self.config).set_tray(self.notification_requested.emit)
+    
+    @pyqtSlot(str, str, bool)
+    def _show_tray_message(self, title, message, error):
+        """Mostra uma notificação na bandeja do sistema"""
+        if self.tray_icon:
+            icon = QSystemTrayIcon.MessageIcon.Critical if error else QSystemTrayIcon.MessageIcon.Information
+            self.tray_icon.showMessage(title, message, icon, 5000)
+    
+    def _attach_progress_listeners(self):
+        """Conecta os eventos de progresso dos gerenciadores à barra de status"""
+        for manager in (self.git_manager, self.svn_manager):
+            if manager:
+                manager.add_progress_listener(self.progress_event.emit)
+    
+    @pyqtSlot(dict)
+    def _on_progress_event(self, event):
+        """Exibe um evento de progresso na barra de status"""
+        if event.get("done"):
+            self.statusBar.showMessage(ProgressReporter.describe(event), 3000)
+        else:
+            stage = f" [{event['stage']}]" if event.get("stage") else ""
+            self.statusBar.showMessage(ProgressReporter.describe(event) + stage)
+    
     def create_ui(self):
         """Cria a interface da janela principal"""
         # Widget central
@@ -446,11 +496,28 @@ class MainWindow(QMainWindow):
             result["local_status"] = f"Not found: {self.local_working_copy}"
             return result
         
-        # Status Git
         if not self.git_manager:
             self.git_manager = GitManager(self.local_working_copy, self.logger)
+        if not self.svn_manager:
+            self.svn_manager = SVNManager(self.local_working_copy, self.logger)
         
-        git_status = self.git_manager.get_status()
+        # Consultar Git e SVN concorrentemente no event loop compartilhado
+        git_snapshot, svn_status = get_executor().gather([
+            self.git_manager.get_status_snapshot_async(),
+            self.svn_manager.get_status_async()
+        ])
+        if isinstance(git_snapshot, Exception):
+            git_status = {"valid": False, "message": f"Error: {str(git_snapshot)}"}
+        elif git_snapshot is None:
+            git_status = {"valid": False, "message": "Not a Git repository"}
+        else:
+            # Status e lista de arquivos vêm do mesmo snapshot (um único 'git status')
+            git_status = git_snapshot.to_status()
+            result["modified_files"] = git_snapshot.to_modified_files()
+        if isinstance(svn_status, Exception):
+            svn_status = {"valid": False, "message": f"Error: {str(svn_status)}"}
+        
+        # Status Git
         if git_status["valid"]:
             result["git_status"] = git_status["message"]
             
@@ -463,10 +530,6 @@ class MainWindow(QMainWindow):
             result["git_status"] = git_status["message"]
         
         # Status SVN
-        if not self.svn_manager:
-            self.svn_manager = SVNManager(self.local_working_copy, self.logger)
-        
-        svn_status = self.svn_manager.get_status()
         if svn_status["valid"]:
             result["svn_status"] = svn_status["message"]
         else:
@@ -475,11 +538,11 @@ class MainWindow(QMainWindow):
         # Status Auto-Sync
         if self.auto_sync_manager:
             result["auto_sync_status"] = "Enabled" if self.auto_sync_manager.enabled else "Disabled"
-            if self.auto_sync_manager.enabled and self.auto_sync_manager.next_sync_time:
-                time_left = self.auto_sync_manager.next_sync_time - datetime.now()
-                if time_left.total_seconds() > 0:
-                    minutes, seconds = divmod(int(time_left.total_seconds()), 60)
-                    result["auto_sync_status"] += f" (Next sync in {minutes:02d}:{seconds:02d})"
+            sync_job = self.auto_sync_manager.next_sync_job()
+            if self.auto_sync_manager.enabled and sync_job and sync_job["remaining"] > 0:
+                minutes, seconds = divmod(int(sync_job["remaining"]), 60)
+                result["auto_sync_status"] += f" (Next sync in {minutes:02d}:{seconds:02d})"
+            result["auto_sync_reason"] = self.auto_sync_manager.next_sync_reason or ""
         else:
             result["auto_sync_status"] = "Not available"
         
@@ -503,6 +566,9 @@ class MainWindow(QMainWindow):
         
         if "auto_sync_status" in result:
             self.auto_sync_label.setText(result["auto_sync_status"])
+            self.auto_sync_label.setToolTip(
+                f"Next sync reason: {result['auto_sync_reason']}" if result.get("auto_sync_reason") else ""
+            )
         
         # Atualizar combo de branches
         if "branches" in result and result["branches"]:
@@ -521,8 +587,11 @@ class MainWindow(QMainWindow):
             
             self.branch_combo.blockSignals(False)
         
-        # Atualizar lista de arquivos
-        self.refresh_files_list()
+        # Atualizar lista de arquivos (reaproveitando o snapshot do status)
+        if "modified_files" in result:
+            self._populate_files_list(result["modified_files"])
+        else:
+            self.refresh_files_list()
         
         self.statusBar.showMessage("Status updated", 3000)
     
@@ -530,15 +599,18 @@ class MainWindow(QMainWindow):
         """Atualiza a lista de arquivos modificados"""
         self.statusBar.showMessage("Refreshing file list...")
         
-        # Limpar árvore
-        self.files_tree.clear()
-        
         if not self.git_manager:
+            self.files_tree.clear()
             self.statusBar.showMessage("Git manager not initialized", 3000)
             return
         
         # Obter arquivos modificados
-        modified_files = self.git_manager.get_modified_files()
+        self._populate_files_list(self.git_manager.get_modified_files())
+    
+    def _populate_files_list(self, modified_files):
+        """Preenche a árvore com a lista de arquivos modificados"""
+        # Limpar árvore
+        self.files_tree.clear()
         
         # Status types com cores
         status_colors = {
@@ -598,9 +670,10 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Error", "Git repository not initialized")
             return
         
-        # Mostrar diff para cada arquivo selecionado (limite a 5 por vez)
+        # Mostrar diff para cada arquivo selecionado (limite a 5 por vez, um único status)
+        diffs = self.git_manager.get_diffs(selected_files[:5])
         for file_path in selected_files[:5]:
-            diff_data = self.git_manager.get_diff(file_path)
+            diff_data = diffs.get(file_path)
             
             if diff_data:
                 # Usar o estilo de visualização configurado
@@ -643,7 +716,7 @@ class MainWindow(QMainWindow):
             task_id = None
             if self.task_manager and self.task_manager.extract_from_branch:
                 # Extrair do nome da branch atual
-                git_status = self.git_manager.get_status()
+                git_status = self.git_manager.get_status(self.git_manager.last_status_snapshot)
                 if git_status["valid"] and "branch" in git_status:
                     branch_name = git_status["branch"]
                     task_id = self.task_manager.extract_task_id(branch_name=branch_name)
@@ -797,12 +870,19 @@ class MainWindow(QMainWindow):
         sync_direction = self.config.get("sync.direction", "bidirectional")
         
         if sync_direction == "git_to_svn":
-            worker = WorkerThread(self.sync_manager.sync_git_to_svn)
+            operation = self.sync_manager.sync_git_to_svn
         elif sync_direction == "svn_to_git":
-            worker = WorkerThread(self.sync_manager.sync_svn_to_git)
+            operation = self.sync_manager.sync_svn_to_git
         else:  # bidirectional
-            worker = WorkerThread(self.sync_manager.bidirectional_sync)
-        
+            operation = self.sync_manager.bidirectional_sync
+        
+        # Passar pela fila da cópia de trabalho, compartilhada com o auto-sync:
+        # nunca duas sincronizações simultâneas, e pedidos repetidos são agrupados
+        queue = SyncQueue.for_working_copy(self.sync_manager.working_dir, self.logger)
+        if queue.is_busy():
+            self.statusBar.showMessage(f"Synchronization queued ({queue.describe()})")
+        request = queue.submit(sync_direction, operation, PRIORITY_MANUAL)
+        worker = WorkerThread(request.wait)
         worker.finished.connect(self._on_sync_repos_complete)
         worker.log.connect(self.logger.log)
         self.active_threads.append(worker)
@@ -848,7 +928,7 @@ class MainWindow(QMainWindow):
         
         # Fazer checkout
         self.statusBar.showMessage(f"Checking out branch '{branch_name}'...")
-        worker = WorkerThread(self.git_manager.repo.git.checkout, branch_name)
+        worker = WorkerThread(self.git_manager.checkout, branch_name)
         worker.finished.connect(lambda success, result: self._on_checkout_completed(success, result, branch_name))
         worker.log.connect(self.logger.log)
         self.active_threads.append(worker)
@@ -902,6 +982,10 @@ class MainWindow(QMainWindow):
             
             # Reinicializar gerenciadores se necessário
             if self.local_working_copy:
+                if self.git_manager:
+                    self.git_manager.close()
+                if self.sync_manager:
+                    self.sync_manager.close()
                 self.git_manager = GitManager(self.local_working_copy, self.logger)
                 self.svn_manager = SVNManager(self.local_working_copy, self.logger)
                 self.sync_manager = SyncManager(
@@ -910,6 +994,7 @@ class MainWindow(QMainWindow):
                     self.logger, 
                     self.config
                 )
+                self._attach_progress_listeners()
                 
                 # Verificar se auto-sync estava ativo e reiniciar
                 if self.auto_sync_manager:
@@ -992,11 +1077,28 @@ Licensed under MIT License
         if self.auto_sync_manager:
             self.auto_sync_manager.stop()
         
+        # Cancelar sincronização manual em andamento (encerra os processos VCS)
+        if self.sync_manager:
+            self.sync_manager.cancel("Application closing")
+        
+        # Encerrar o event loop compartilhado e processos git persistentes
+        get_executor().stop()
+        get_scheduler().stop()
+        
+        # Entregar as notificações pendentes pela plataforma, já sem a bandeja
+        dispatcher = get_dispatcher(self.logger, self.config)
+        dispatcher.set_tray(None)
+        dispatcher.stop()
+        if self.git_manager:
+            self.git_manager.close()
+        if self.sync_manager:
+            self.sync_manager.close()
+        
         # Parar todas as threads ativas
         for thread in list(self.active_threads):
             if thread.isRunning():
                 thread.stop()
-                thread.wait(100)  # Aguardar até 100ms para a thread terminar
+                thread.wait(5000)  # Processos cancelados terminam rapidamente
         
         # Aguardar qualquer thread ativa ser finalizada
         import time
@@ -1004,6 +1106,9 @@ Licensed under MIT License
         # Pequena pausa para permitir que threads terminem
         time.sleep(0.1)
         
+        # Gravar os registros de log pendentes e encerrar a thread de escrita
+        self.logger.close()
+        
         # Processar eventos pendentes
         QApplication.processEvents()
         
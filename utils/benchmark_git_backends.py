@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Compara os backends de leitura do GitManager (git CLI e pygit2) em um repositório
+
+Uso:
+    python -m utils.benchmark_git_backends /caminho/do/repositorio [--rounds 5] [--files 500]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+from core.git_backends import CLIGitBackend, Pygit2GitBackend, PYGIT2_AVAILABLE
+
+class _PrintLogger:
+    """Logger mínimo para uso fora da interface"""
+
+    def log(self, message, level="INFO"):
+        print(f"[{level}] {message}", file=sys.stderr)
+
+def _tracked_files(repo_path, limit):
+    """Lista até `limit` arquivos rastreados no HEAD"""
+    output = subprocess.run(
+        ["git", "ls-tree", "-r", "-z", "--name-only", "HEAD"],
+        cwd=repo_path, stdout=subprocess.PIPE, check=True
+    ).stdout.decode('utf-8', errors='replace')
+    return [p for p in output.split('\0') if p][:limit]
+
+def _has_parent(repo_path):
+    """Indica se o HEAD tem um commit pai (necessário para o diff de árvores)"""
+    return subprocess.run(
+        ["git", "rev-parse", "--verify", "--quiet", "HEAD~1"],
+        cwd=repo_path, stdout=subprocess.DEVNULL
+    ).returncode == 0
+
+def _measure(function, rounds):
+    """Executa a função `rounds` vezes e retorna os tempos em segundos"""
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+def run_benchmark(repo_path, rounds=5, file_count=500):
+    """Mede status, listagem de refs, leitura de blobs e diff de árvores em cada backend
+
+    Retorna uma lista de (operação, backend, mediana, mínimo) em segundos.
+    """
+    logger = _PrintLogger()
+    specs = [f"HEAD:{p}" for p in _tracked_files(repo_path, file_count)]
+    operations = [
+        ("status", lambda backend: backend.status_snapshot()),
+        ("list refs", lambda backend: backend.list_refs()),
+        (f"read {len(specs)} blobs", lambda backend: backend.read_blobs(specs)),
+    ]
+    if _has_parent(repo_path):
+        operations.append(("diff HEAD~1 HEAD", lambda backend: backend.diff_tree("HEAD~1", "HEAD")))
+
+    backends = [CLIGitBackend(repo_path, logger)]
+    if PYGIT2_AVAILABLE:
+        backends.append(Pygit2GitBackend(repo_path, logger))
+    else:
+        logger.log("pygit2 is not installed, benchmarking the git CLI backend only", "WARNING")
+
+    results = []
+    try:
+        for name, operation in operations:
+            for backend in backends:
+                operation(backend)  # Aquecimento (cache do sistema de arquivos, processos persistentes)
+                timings = _measure(lambda: operation(backend), rounds)
+                results.append((name, backend.name, statistics.median(timings), min(timings)))
+    finally:
+        for backend in backends:
+            backend.close()
+
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark of GitManager read backends")
+    parser.add_argument("repo", help="Path to a Git working copy")
+    parser.add_argument("--rounds", type=int, default=5, help="Measured rounds per operation")
+    parser.add_argument("--files", type=int, default=500, help="Number of blobs to read")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.repo, args.rounds, args.files)
+
+    print(f"{'Operation':<24}{'Backend':<10}{'Median (ms)':>14}{'Min (ms)':>12}")
+    for name, backend, median, minimum in results:
+        print(f"{name:<24}{backend:<10}{median * 1000:>14.1f}{minimum * 1000:>12.1f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -45,6 +45,10 @@ class ConfigManager:
         
         return app_data_dir
     
+    def get_data_path(self, file_name):
+        """Retorna o caminho de um arquivo de dados ao lado do arquivo de configuração"""
+        return os.path.join(os.path.dirname(os.path.abspath(self.config_file)), file_name)
+    
     def load(self):
         """Carrega configurações do arquivo"""
         try:
@@ -124,18 +128,70 @@ class ConfigManager:
             "svn_repo_url": "",
             "local_working_copy": "",
             "default_branch": "main",
+            "git_backend": "cli",
             
             "sync": {
                 "direction": "bidirectional",
                 "auto_resolve_conflicts": "none",
                 "auto_stash": True,
                 "auto_push": False,
-                "commit_message": "Synchronized changes"
+                "commit_message": "Synchronized changes",
+                "svn_targeted_update": True,
+                "svn_targeted_update_max_paths": 200,
+                "command_timeout_seconds": 600,
+                "watchdog_stuck_seconds": 300
+            },
+            
+            "retry": {
+                "max_attempts": 3,
+                "base_delay_seconds": 2.0,
+                "max_delay_seconds": 60.0,
+                "jitter": 0.5
+            },
+            
+            "circuit_breaker": {
+                "failure_threshold": 3,
+                "reset_seconds": 300
+            },
+            
+            "sparse": {
+                "include": [],
+                "root_depth": "empty"
+            },
+            
+            "git_fetch": {
+                "scope": "all",
+                "depth": 0,
+                "filter": "",
+                "prune": False,
+                "tags": True
             },
             
             "auto_sync": {
                 "enabled": False,
-                "interval_minutes": 30
+                "interval_minutes": 30,
+                "skip_unchanged": True,
+                "watch_changes": False,
+                "watch_debounce_seconds": 2.0,
+                "watch_max_delay_seconds": 30.0,
+                "adaptive_interval": False,
+                "min_interval_minutes": 5,
+                "max_interval_minutes": 120,
+                "jitter_fraction": 0.1,
+                "schedules": [],
+                "misfire_grace_seconds": 300
+            },
+            
+            "history": {
+                "enabled": True
+            },
+            
+            "maintenance": {
+                "enabled": True,
+                "interval_hours": 24,
+                "idle_minutes": 5,
+                "tasks": ["commit-graph", "loose-objects", "incremental-repack", "prune"],
+                "svn_vacuum_pristines": True
             },
             
             "ui": {
@@ -144,6 +200,11 @@ class ConfigManager:
                 "show_notifications": True
             },
             
+            "notifications": {
+                "window_seconds": 10,
+                "repo_interval_seconds": 300
+            },
+            
             "logging": {
                 "enable_file_logging": False,
                 "log_file_path": ""
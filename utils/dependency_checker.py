@@ -62,6 +62,7 @@ def check_dependencies():
     optional_deps = {
         "pygments": "Syntax highlighting for code diffs",
         "win10toast": "Desktop notifications on Windows",
+        "pygit2": "In-process libgit2 backend for Git reads",
     }
     
     for dep, desc in optional_deps.items():
@@ -39,6 +39,51 @@ def normalize_path(path):
     
     return os.path.normpath(path)
 
+# Profundidades aceitas por 'svn checkout --depth' e 'svn update --set-depth'
+SVN_DEPTHS = ("empty", "files", "immediates", "infinity")
+
+def parse_sparse_include(include):
+    """Normaliza o escopo esparso em uma lista de pares (caminho, profundidade)
+
+    Cada item é um caminho ("a/b", profundidade infinity), um dicionário
+    {"path": "a/b", "depth": "files"} ou um par (caminho, profundidade).
+    """
+    entries = []
+    for item in include or []:
+        if isinstance(item, dict):
+            path, depth = item.get("path") or "", item.get("depth") or "infinity"
+        elif isinstance(item, (tuple, list)):
+            path, depth = item
+        else:
+            path, depth = item, "infinity"
+        path = str(path).replace('\\', '/').strip('/')
+        if path:
+            entries.append((path, depth))
+    return entries
+
+def is_path_in_scope(path, include):
+    """Verifica se um caminho relativo pertence a um dos subdiretórios incluídos
+
+    Subárvores com profundidade files ou immediates incluem apenas os
+    filhos diretos, e empty apenas o próprio diretório.
+    """
+    scopes = parse_sparse_include(include)
+    if not scopes:
+        return True
+    
+    path = path.replace('\\', '/').strip('/')
+    if path in ('', '.'):
+        return False
+    
+    for scope, depth in scopes:
+        if path == scope:
+            return True
+        if path.startswith(scope + '/') and depth != "empty":
+            if depth not in ("files", "immediates") or '/' not in path[len(scope) + 1:]:
+                return True
+    
+    return False
+
 def secure_encode(text):
     """Codifica texto de forma básica (não segura)"""
     if not text:
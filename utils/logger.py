@@ -3,12 +3,44 @@
 
 import datetime
 import os
+import sys
+import queue
+import atexit
+import threading
 from PyQt6.QtWidgets import QTextEdit
 from PyQt6.QtGui import QTextCursor, QColor, QTextCharFormat, QFont
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QObject, pyqtSignal, pyqtSlot
+
+# Máximo de registros gravados/enviados à interface por lote
+LOG_BATCH_SIZE = 500
+
+class _WidgetBridge(QObject):
+    """Leva lotes de registros da thread de escrita para a thread da interface
+
+    O objeto é criado na thread da GUI; como o sinal é emitido de outra
+    thread, o Qt enfileira a entrega no event loop da interface.
+    """
+
+    records = pyqtSignal(list)
+
+    def __init__(self, callback):
+        super().__init__()
+        self.callback = callback
+        self.records.connect(self._deliver)
+
+    @pyqtSlot(list)
+    def _deliver(self, batch):
+        self.callback(batch)
 
 class LogManager:
-    """Gerenciador de log adaptado para Qt6 com estilos personalizados"""
+    """Gerenciador de log adaptado para Qt6 com estilos personalizados
+
+    log() apenas formata e enfileira o registro. Uma única thread de
+    escrita consome a fila em lotes: grava no arquivo por um handle
+    persistente com buffer (um flush por lote), imprime no console e envia
+    o lote à interface por um sinal Qt, de modo que o widget só é alterado
+    na thread da GUI.
+    """
     
     def __init__(self, log_widget=None, log_file=None):
         """Inicializa o gerenciador de log"""
@@ -30,6 +62,18 @@ class LogManager:
         # Configurar formatos de texto se o widget estiver disponível
         if self.log_widget:
             self.setup_text_tags()
+        
+        # Ponte para a thread da interface (criada aqui, na thread da GUI)
+        self._bridge = _WidgetBridge(self._append_batch_to_widget)
+        
+        # Fila de registros e thread de escrita
+        self._records = queue.Queue()
+        self._file = None
+        self._file_path = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
     
     def setup_text_tags(self):
         """Configura os formatos de texto para diferentes níveis de log"""
@@ -62,70 +106,127 @@ class LogManager:
         self.text_formats["DEBUG"] = debug_format
     
     def log(self, message, level="INFO"):
-        """Registra uma mensagem com nível específico"""
+        """Registra uma mensagem com nível específico (apenas enfileira, não bloqueia)"""
         timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        formatted_message = f"[{timestamp}] [{level}] {message}"
-        
-        # Registrar no widget se disponível
-        if self.log_widget and isinstance(self.log_widget, QTextEdit):
-            self._append_to_widget(formatted_message, level)
-        
+        self._records.put((f"[{timestamp}] [{level}] {message}", level))
+    
+    def _run(self):
+        """Função da thread de escrita: consome a fila em lotes"""
+        while True:
+            record = self._records.get()
+            stopping = record is None
+            batch = [] if stopping else [record]
+            while not stopping and len(batch) < LOG_BATCH_SIZE:
+                try:
+                    record = self._records.get_nowait()
+                except queue.Empty:
+                    break
+                if record is None:
+                    stopping = True
+                else:
+                    batch.append(record)
+            
+            if batch:
+                self._write_batch(batch)
+            if stopping:
+                self._close_file()
+                return
+    
+    def _write_batch(self, batch):
+        """Grava um lote no arquivo, no console e o envia à interface"""
         # Registrar no arquivo se configurado
         if self.log_file:
-            self._append_to_file(formatted_message)
+            self._append_to_file("".join(message + "\n" for message, _ in batch))
+        
+        # Registros com nível None (cabeçalho de sessão) vão apenas para o arquivo
+        batch = [record for record in batch if record[1] is not None]
+        if not batch:
+            return
         
         # Sempre imprimir no console
-        print(formatted_message)
+        try:
+            sys.stdout.write("".join(message + "\n" for message, _ in batch))
+            sys.stdout.flush()
+        except Exception:
+            pass
+        
+        # Registrar no widget se disponível (entregue na thread da GUI)
+        if self.log_widget and isinstance(self.log_widget, QTextEdit):
+            try:
+                self._bridge.records.emit(batch)
+            except RuntimeError:
+                # Janela já destruída durante o encerramento
+                pass
     
-    def _append_to_widget(self, message, level="INFO"):
-        """Adiciona uma mensagem ao widget de log com formatação"""
+    def _append_batch_to_widget(self, batch):
+        """Adiciona um lote de mensagens ao widget de log com formatação (thread da GUI)"""
+        if not (self.log_widget and isinstance(self.log_widget, QTextEdit)):
+            return
+        
         # Obter o cursor e formatar o texto
         cursor = self.log_widget.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
         
-        # Certificar que temos o formato correto para o nível
-        if level not in self.text_formats:
+        # Certificar que temos os formatos de texto
+        if not self.text_formats:
             self.setup_text_tags()
         
-        # Aplicar o formato para este nível
-        format = self.text_formats.get(level, self.text_formats["INFO"])
-        
-        # Inserir o texto formatado
-        cursor.insertText(message + "\n", format)
+        # Inserir o texto formatado, com o formato de cada nível
+        cursor.beginEditBlock()
+        for message, level in batch:
+            cursor.insertText(message + "\n", self.text_formats.get(level, self.text_formats["INFO"]))
+        cursor.endEditBlock()
         
         # Rolar para a última linha
         self.log_widget.setTextCursor(cursor)
         self.log_widget.ensureCursorVisible()
     
-    def _append_to_file(self, message):
-        """Adiciona uma mensagem ao arquivo de log"""
+    def _append_to_file(self, text):
+        """Adiciona texto ao arquivo de log pelo handle persistente (thread de escrita)"""
         try:
-            # Criar diretório se não existir
-            if self.log_file:
-                os.makedirs(os.path.dirname(os.path.abspath(self.log_file)), exist_ok=True)
-                
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(message + "\n")
+            path = self.log_file
+            if path != self._file_path:
+                # Arquivo novo ou alterado por set_log_file: abrir uma única vez
+                self._close_file()
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+                self._file = open(path, 'a', encoding='utf-8', buffering=64 * 1024)
+                self._file_path = path
+            self._file.write(text)
+            self._file.flush()
         except Exception as e:
             print(f"Error writing to log file: {str(e)}")
     
+    def _close_file(self):
+        """Fecha o handle do arquivo de log atual"""
+        if self._file:
+            try:
+                self._file.close()
+            except Exception:
+                pass
+        self._file = None
+        self._file_path = None
+    
+    def close(self, timeout=5.0):
+        """Grava os registros pendentes e encerra a thread de escrita"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread.is_alive():
+            self._records.put(None)
+            self._thread.join(timeout=timeout)
+    
     def clear_widget(self):
         """Limpa o widget de log"""
         if self.log_widget and isinstance(self.log_widget, QTextEdit):
             self.log_widget.clear()
     
     def set_log_file(self, file_path):
-        """Define o arquivo para registro de log"""
-        self.log_file = file_path
+        """Define o arquivo para registro de log
         
-        # Criar diretório se não existir
+        A troca do arquivo é feita pela thread de escrita no próximo lote,
+        que começa pelo cabeçalho da sessão.
+        """
+        self.log_file = file_path
         if file_path:
-            os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
-            
-            # Adicionar cabeçalho ao arquivo
-            try:
-                with open(file_path, 'a', encoding='utf-8') as f:
-                    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    f.write(f"[{timestamp}] === Log Session Started ===\n")
-            except Exception as e:
-                print(f"Error initializing log file: {str(e)}")
\ No newline at end of file
+            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self._records.put((f"[{timestamp}] === Log Session Started ===", None))
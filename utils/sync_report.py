@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Relatório do histórico de sincronizações: latência p50/p95, taxa de falha e tendência
+
+Uso:
+    python -m utils.sync_report [--period day|week] [--days 14] [--repo /caminho] [--recent 10] [--db arquivo]
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime
+
+from core.sync_history import SyncHistory
+
+class _PrintLogger:
+    """Logger mínimo para uso fora da interface"""
+
+    def log(self, message, level="INFO"):
+        print(f"[{level}] {message}", file=sys.stderr)
+
+def _default_db_path():
+    """Caminho do histórico ao lado do arquivo de configuração da aplicação"""
+    from utils.config_manager import ConfigManager
+    return ConfigManager().get_data_path("sync_history.sqlite")
+
+def _seconds(value):
+    """Formata uma duração (ou '-' quando não há amostras)"""
+    return "-" if value is None else f"{value:.1f}s"
+
+def _trend(value):
+    """Formata a variação relativa do p50"""
+    return "-" if value is None else f"{value:+.0%}"
+
+def print_report(history, period="day", days=14, repo=None):
+    """Imprime o relatório agregado por repositório e período"""
+    rows = history.report(period=period, days=days, repo=repo)
+    if not rows:
+        print("No synchronizations recorded in this period")
+        return
+
+    current_repo = None
+    for row in rows:
+        if row["repo"] != current_repo:
+            current_repo = row["repo"]
+            print(f"\n{current_repo}")
+            print(f"  {'Period':<12}{'Runs':>6}{'Failed':>8}{'Fail %':>8}{'p50':>9}{'p95':>9}"
+                  f"{'Trend':>8}{'Files':>8}{'MiB':>9}")
+        print(f"  {row['period'].isoformat():<12}{row['runs']:>6}{row['failures']:>8}"
+              f"{row['failure_rate']:>8.0%}{_seconds(row['p50']):>9}{_seconds(row['p95']):>9}"
+              f"{_trend(row['trend']):>8}{row['files_changed']:>8}{row['bytes'] / 1024 / 1024:>9.1f}")
+
+def print_recent(history, limit, repo=None):
+    """Imprime as últimas execuções com o tempo de cada fase"""
+    print(f"\nLast {limit} runs")
+    for run in history.recent_runs(repo=repo, limit=limit):
+        started = datetime.fromtimestamp(run["started"]).strftime('%Y-%m-%d %H:%M:%S')
+        outcome = run["outcome"]
+        if run["error_phase"]:
+            outcome += f" in {run['error_phase']}"
+        phases = ", ".join(f"{name} {seconds:.1f}s" for name, seconds in run["phases"].items())
+        print(f"  {started}  {run['direction']:<14}{run['duration']:>8.1f}s  {outcome:<28}{phases}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sync history report")
+    parser.add_argument("--db", help="Path to sync_history.sqlite (default: next to the configuration file)")
+    parser.add_argument("--period", choices=["day", "week"], default="day", help="Aggregation period")
+    parser.add_argument("--days", type=int, default=14, help="Number of days to include")
+    parser.add_argument("--repo", help="Only report this working copy")
+    parser.add_argument("--recent", type=int, default=0, help="Also list the last N runs")
+    args = parser.parse_args(argv)
+
+    db_path = args.db or _default_db_path()
+    if not os.path.exists(db_path):
+        print(f"No sync history found at {db_path}", file=sys.stderr)
+        return 1
+
+    repo = os.path.realpath(args.repo) if args.repo else None
+    history = SyncHistory(db_path, _PrintLogger())
+    try:
+        print_report(history, args.period, args.days, repo)
+        if args.recent:
+            print_recent(history, args.recent, repo)
+    finally:
+        history.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())